@@ -5,11 +5,21 @@ This module defines :class:`.Request`, which forms the high-level API of
 understanding of this API and a basic understanding of the SDMX web service
 guidelines.
 """
+import asyncio
 import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from copy import copy
 from functools import partial
-from typing import Dict
+from io import BytesIO
+from itertools import chain
+from typing import MutableMapping
 from warnings import warn
+from weakref import WeakKeyDictionary
 
+import pandas as pd
 import requests
 
 from pandasdmx import remote
@@ -18,10 +28,12 @@ from pandasdmx.reader import get_reader_for_content_type
 from .message import Message
 from .model import DataStructureDefinition, MaintainableArtefact
 from .source import NoSource, list_sources, sources
-from .util import Resource
+from .util import MessageCache, Resource
 
 logger = logging.getLogger(__name__)
 
+_lock = threading.Lock()
+
 
 class Request:
     """Client for a SDMX REST web service.
@@ -38,12 +50,20 @@ class Request:
         or  a subclass. If given,
         it is  used for HTTP requests, and any   *session_opts* passed  will raise TypeError. 
         A typical  use case is the injection of alternative caching libraries such as Cache Control.
+    max_concurrent : int, optional
+        Maximum number of queries handled at once by :meth:`aget`.
+    cache : :class:`~collections.abc.MutableMapping`, optional
+        Storage for messages retrieved with `use_cache=True`. Default: a new
+        :class:`.MessageCache` with its default limits. Pass e.g. a
+        :class:`.MessageCache` with other limits, or a :class:`dict` for an
+        unbounded cache that may be shared by several instances.
     session_opts :
         Additional keyword arguments are passed to
         :class:`.Session`.
     """
 
-    cache: Dict[str, Message] = {}
+    #: Messages retrieved with `use_cache=True`, by URL; see the `cache` parameter.
+    cache: MutableMapping[str, Message]
 
     #: :class:`.source.Source` for requests sent from the instance.
     source = None
@@ -51,7 +71,22 @@ class Request:
     #: :class:`.Session` for queries sent from the instance.
     session = None
 
-    def __init__(self, source=None, log_level=None, session=None, **session_opts):
+    #: Maximum number of queries handled at once by :meth:`aget`.
+    max_concurrent = 8
+
+    # Pool of threads and asyncio.Semaphore per event loop, used by aget()
+    _executor = None
+    _semaphores = None
+
+    def __init__(
+        self,
+        source=None,
+        log_level=None,
+        session=None,
+        max_concurrent=None,
+        cache=None,
+        **session_opts,
+    ):
         """Constructor."""
         try:
             self.source = sources[source.upper()] if source else NoSource
@@ -67,6 +102,12 @@ class Request:
         if log_level:
             logging.getLogger("pandasdmx").setLevel(log_level)
 
+        if max_concurrent:
+            self.max_concurrent = max_concurrent
+        self._semaphores = WeakKeyDictionary()
+        self._parse_lock = threading.RLock()
+        self.cache = MessageCache() if cache is None else cache
+
     def __getattr__(self, name):
         """Convenience methods."""
         try:
@@ -106,6 +147,24 @@ class Request:
     def clear_cache(self):
         self.cache.clear()
 
+    def close(self):
+        """Shut down the threads used by :meth:`aget`, and close :attr:`session`.
+
+        A Request may also be used in a with-context, which calls this method on
+        exit. The threads are started again if :meth:`aget` is used after closing.
+        """
+        with _lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     @property
     def timeout(self):
         return self.session.timeout
@@ -335,6 +394,12 @@ class Request:
             File path or file-like to write SDMX data as it is recieved.
             *file-like* must be binary and writable. It may be used in a with-context (recommended
 when using a fsspec.core.OpenFile.
+
+            If the :attr:`session` was created with ``stream=True``, the response
+            is parsed while it is downloaded, using
+            :class:`.remote.StreamingResponseIO`, and is not retained in memory
+            unless `tofile` is given. :attr:`.Message.response` then has no
+            content.
         use_cache : bool, optional
             If :obj:`True`, return a previously retrieved :class:`~.Message`
             from :attr:`cache`, or update the cache with a newly-retrieved
@@ -348,6 +413,10 @@ when using a fsspec.core.OpenFile.
 
         Other Parameters
         ----------------
+        dataset_class : type
+            Class of the data sets in a data message, e.g.
+            :class:`.experimental.DataSet`. Default: :class:`.DataSet` or the
+            subclass for the message type.
         dsd : :class:`~.DataStructureDefinition`
             Existing object used to validate the `key` argument. If not
             provided, an additional query executed to retrieve a DSD in order
@@ -364,6 +433,16 @@ when using a fsspec.core.OpenFile.
             For queries with `resource_type='data'`. :class:`str` values are
             not validated; :class:`dict` values are validated using
             :meth:`~.DataStructureDefinition.make_constraint`.
+        max_series : int
+            If given with a :class:`dict` `key`, split the query so that each part
+            selects at most `max_series` combinations of dimension values. See
+            `max_url_length`.
+        max_url_length : int
+            If given with a :class:`dict` `key`, split the query so that the URL
+            of each part has at most `max_url_length` characters. The parts are
+            sent concurrently, using up to :attr:`max_concurrent` threads, and the
+            resulting data sets are merged into one :class:`.DataMessage`, without
+            duplicate series or observations. See :meth:`.CubeRegion.split`.
         params : dict
             Query parameters. The `SDMX REST web service guidelines <https://\
             github.com/sdmx-twg/sdmx-rest/tree/master/v2_1/ws/rest/docs>`_
@@ -390,21 +469,268 @@ when using a fsspec.core.OpenFile.
         -------
         :class:`~.Message` or :class:`~requests.Request`
             The requested SDMX message or, if `dry_run` is :obj:`True`, the
-            prepared request object.
+            prepared request object; a list of these if the query is split.
 
         Raises
         ------
         NotImplementedError
             If the :attr:`source` does not support the given `resource_type`
             and `force` is not :obj:`True`.
+        ValueError
+            If `tofile` is given and the query is split.
+
+        """
+        max_length = kwargs.pop("max_url_length", None)
+        max_series = kwargs.pop("max_series", None)
+        if (
+            (max_length is not None or max_series is not None)
+            and isinstance(kwargs.get("key"), dict)
+            and "url" not in kwargs
+        ):
+            return self._get_split(
+                resource_type,
+                resource_id,
+                tofile,
+                use_cache,
+                dry_run,
+                max_length,
+                max_series,
+                kwargs,
+            )
+
+        req, dataset_class = self._prepare(resource_type, resource_id, kwargs)
+
+        # Try to get resource from memory cache if specified
+        if use_cache:
+            try:
+                return self.cache[req.url]
+            except KeyError:
+                logger.info("Not found in cache")
+                pass
+
+        if dry_run:
+            return req
+
+        response = self._send(req, resource_type)
+        response, Reader, response_content = self._content(response, tofile)
+
+        # Parse the message, using any provided or auto-queried DSD
+        msg = self._read(
+            Reader, response_content, kwargs.get("dsd", None), dataset_class
+        )
+
+        return self._finish(msg, response, req, use_cache, kwargs)
+
+    def _read(self, Reader, source, dsd, dataset_class):
+        """Parse `source`; messages read with the same `dsd` are parsed one at a time.
+
+        Reading a message may modify `dsd`, e.g. by adding components, so it must not
+        be shared by concurrent readers.
+        """
+        with self._parse_lock if dsd is not None else nullcontext():
+            return _read_message(Reader, source, dsd, dataset_class)
+
+    async def aget(
+        self,
+        resource_type=None,
+        resource_id=None,
+        tofile=None,
+        use_cache=False,
+        dry_run=False,
+        executor=None,
+        **kwargs,
+    ):
+        """Retrieve SDMX data or metadata, without blocking the event loop.
+
+        As :meth:`get`, but a coroutine. Up to :attr:`max_concurrent` queries are
+        handled at once; others wait until one of these is complete. Sending the
+        query, receiving the response and other blocking work happen in a pool of
+        threads, so that many queries can be awaited concurrently. Use :meth:`close`
+        or a with-context to shut down the threads::
+
+            with Request("ECB") as req:
+                msgs = await asyncio.gather(*[req.aget("data", id) for id in ids])
+
+        Parameters
+        ----------
+        executor : :class:`concurrent.futures.Executor`, optional
+            If given, the entire response is received and then parsed using
+            `executor`, e.g. a :class:`~concurrent.futures.ProcessPoolExecutor`.
+            Otherwise, the response is parsed in the same pool of threads.
+
+        Other parameters are as for :meth:`get`.
+        """
+        loop = asyncio.get_running_loop()
+        call = partial(loop.run_in_executor, self._pool())
+
+        if {"max_series", "max_url_length"} & set(kwargs):
+            # Parts of a split query are sent concurrently by get()
+            return await call(
+                partial(
+                    self.get,
+                    resource_type,
+                    resource_id,
+                    tofile=tofile,
+                    use_cache=use_cache,
+                    dry_run=dry_run,
+                    **kwargs,
+                )
+            )
+
+        async with self._semaphore(loop):
+            # Argument handling may query for a DSD to validate `key`
+            req, dataset_class = await call(
+                self._prepare, resource_type, resource_id, kwargs
+            )
+
+            if use_cache:
+                try:
+                    return self.cache[req.url]
+                except KeyError:
+                    logger.info("Not found in cache")
+                    pass
+
+            if dry_run:
+                return req
+
+            response = await call(self._send, req, resource_type)
+            response, Reader, response_content = await call(
+                self._content, response, tofile
+            )
+
+            args = [Reader, response_content, kwargs.get("dsd", None), dataset_class]
+            if executor is None:
+                msg = await call(self._read, *args)
+            else:
+                args[1] = await call(response_content.read)
+                msg = await loop.run_in_executor(executor, _read_message, *args)
+
+            return await call(self._finish, msg, response, req, use_cache, kwargs)
+
+    def _get_split(
+        self,
+        resource_type,
+        resource_id,
+        tofile,
+        use_cache,
+        dry_run,
+        max_length,
+        max_series,
+        kwargs,
+    ):
+        """Retrieve data for a `key` that may be split; see :meth:`get`."""
+        key = kwargs.pop("key")
+        dsd = kwargs.pop("dsd", None)
+        _, dsd = self._make_key(resource_type, resource_id, key, dsd)
+        cr = dsd.make_constraint(key).data_content_region[0]
+
+        def args(key):
+            # Copy arguments that may be modified by Source.modify_request_args()
+            return dict(
+                kwargs,
+                key=key,
+                dsd=dsd,
+                params=dict(kwargs.get("params", {})),
+                headers=dict(kwargs.get("headers", {})),
+            )
+
+        # URL of the entire query, and its length without the key
+        key = cr.to_query_string(dsd)
+        url = self.get(resource_type, resource_id, dry_run=True, **args(key)).url
+        if max_length is not None:
+            max_length -= len(url) - len(key)
+
+        if use_cache:
+            try:
+                return self.cache[url]
+            except KeyError:
+                logger.info("Not found in cache")
+                pass
+
+        keys = [r.to_query_string(dsd) for r in cr.split(dsd, max_length, max_series)]
+        if len(keys) == 1:
+            return self.get(
+                resource_type,
+                resource_id,
+                tofile=tofile,
+                use_cache=use_cache,
+                dry_run=dry_run,
+                **args(key),
+            )
+        elif tofile:
+            raise ValueError(f"cannot write {len(keys)} split queries to tofile=")
+        elif dry_run:
+            return [
+                self.get(resource_type, resource_id, dry_run=True, **args(key))
+                for key in keys
+            ]
+
+        logger.info("Splitting query for %s into %d parts", url, len(keys))
+        msg = self._get_all(resource_type, resource_id, map(args, keys))
+
+        if use_cache:
+            self.cache[url] = msg
+
+        return msg
 
+    def _get_all(
+        self, resource_type, resource_id, queries, workers=None, missing_ok=False
+    ):
+        """Retrieve `queries` concurrently, and return one merged message.
+
+        Each of `queries` is a dict of keyword arguments to :meth:`get`. Up to
+        `workers` queries are sent at once; default :attr:`max_concurrent`. With
+        `missing_ok`, queries for which the web service responds 404 Not Found are
+        skipped, unless all of them are.
+
+        Each worker thread uses its own shallow copy of this Request, with a copy of
+        :attr:`session` that shares settings, cookies and any cache, but has separate
+        connection pools. A DSD given in the queries is shared by all workers;
+        messages that refer to it are parsed one at a time, since reading may add
+        components and codes to it.
         """
+        local = threading.local()
+        sessions = []
+
+        def get(kwargs):
+            if not hasattr(local, "req"):
+                local.req = copy(self)
+                local.req.session = _copy_session(self.session)
+                sessions.append(local.req.session)
+            try:
+                return local.req.get(resource_type, resource_id, **kwargs)
+            except requests.exceptions.HTTPError as e:
+                if missing_ok and e.response is not None:
+                    if e.response.status_code == 404:
+                        return e
+                raise
+
+        try:
+            with ThreadPoolExecutor(workers or self.max_concurrent) as pool:
+                results = list(pool.map(get, queries))
+        finally:
+            for session in sessions:
+                _close_copied_adapters(session)
+
+        messages = [r for r in results if not isinstance(r, Exception)]
+        if not messages:
+            raise results[0]
+        elif len(messages) < len(results):
+            n = len(results) - len(messages)
+            logger.info("%d of %d queries found no data", n, len(results))
+        return _merge(messages)
+
+    def _prepare(self, resource_type, resource_id, kwargs):
+        """Return a prepared request and the `dataset_class` for :meth:`get`."""
         # Allow sources to modify request args
         # TODO this should occur after most processing, defaults, checking etc.
         #      are performed, so that core code does most of the work.
         if self.source:
             self.source.modify_request_args(kwargs)
 
+        # Passed to the reader
+        dataset_class = kwargs.pop("dataset_class", None)
+
         # Handle arguments
         if "url" in kwargs:
             req = self._request_from_url(kwargs)
@@ -418,17 +744,10 @@ when using a fsspec.core.OpenFile.
         logger.info("Requesting resource from %s", req.url)
         logger.info("with headers %s" % req.headers)
 
-        # Try to get resource from memory cache if specified
-        if use_cache:
-            try:
-                return self.cache[req.url]
-            except KeyError:
-                logger.info("Not found in cache")
-                pass
-
-        if dry_run:
-            return req
+        return req, dataset_class
 
+    def _send(self, req, resource_type):
+        """Send `req` and return the response, raising for HTTP errors."""
         try:
             response = self.session.send(req)
             response.raise_for_status()
@@ -443,14 +762,17 @@ when using a fsspec.core.OpenFile.
             else:
                 raise
 
-        # Maybe copy the response to file as it's received
-        response_content = remote.ResponseIO(response, tee=tofile)
+        return response
 
+    def _content(self, response, tofile):
+        """Return `response`, the reader class and a file-like for its content."""
         # Select reader class
         content_type = response.headers.get("content-type", None)
         try:
             Reader = get_reader_for_content_type(content_type)
         except ValueError:
+            # Source-specific handling requires the entire response
+            response_content = remote.ResponseIO(response, tee=tofile)
             try:
                 response, response_content = self.source.handle_response(
                     response, response_content
@@ -462,13 +784,17 @@ when using a fsspec.core.OpenFile.
                     "can't determine a reader for response "
                     "content type: %s" % content_type
                 )
+        else:
+            # Maybe copy the response to file as it's received. If the session
+            # streams responses, parse the content while it is downloaded
+            stream = getattr(self.session, "stream", False)
+            IO = remote.StreamingResponseIO if stream else remote.ResponseIO
+            response_content = IO(response, tee=tofile)
 
-        # Instantiate reader
-        reader = Reader()
-
-        # Parse the message, using any provided or auto-queried DSD
-        msg = reader.read_message(response_content, dsd=kwargs.get("dsd", None))
+        return response, Reader, response_content
 
+    def _finish(self, msg, response, req, use_cache, kwargs):
+        """Complete `msg` parsed from `response` to `req`."""
         # Store the HTTP response with the message
         msg.response = response
 
@@ -481,6 +807,153 @@ when using a fsspec.core.OpenFile.
 
         return msg
 
+    def _pool(self):
+        """Return a pool of :attr:`max_concurrent` threads for :meth:`aget`."""
+        with _lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent, thread_name_prefix="pandasdmx"
+                )
+        return self._executor
+
+    def _semaphore(self, loop):
+        """Return a semaphore limiting queries by :meth:`aget` in `loop`."""
+        try:
+            return self._semaphores[loop]
+        except KeyError:
+            return self._semaphores.setdefault(
+                loop, asyncio.Semaphore(self.max_concurrent)
+            )
+
+    def data_partitioned(
+        self,
+        resource_id,
+        key=None,
+        start=None,
+        end=None,
+        step="5Y",
+        workers=None,
+        use_cache=False,
+        dry_run=False,
+        **kwargs,
+    ):
+        """Retrieve data for `resource_id` in time windows, concurrently.
+
+        The periods from `start` to `end` are divided into windows of length
+        `step`, and one query is sent for each window, with the 'startPeriod' and
+        'endPeriod' query parameters. The data sets received are merged into one
+        :class:`.DataMessage`: each series contains the observations from every
+        window, in order, without duplicates. To obtain a :class:`pandas.Series`
+        or :class:`~pandas.DataFrame`, use :func:`.to_pandas`::
+
+            msg = req.data_partitioned(
+                "EXR", key={"CURRENCY": "USD"}, start="1999", end="2020", step="5Y"
+            )
+            df = pandasdmx.to_pandas(msg, datetime="TIME_PERIOD")
+
+        Parameters
+        ----------
+        resource_id : str
+            ID of the data flow.
+        key : str or dict, optional
+            As for :meth:`get`. A :class:`dict` is validated once, not for each
+            window.
+        start : str or datetime-like
+            First period to retrieve, e.g. '2000', '2000-07' or '2000-07-15'.
+        end : str or datetime-like
+            Last period to retrieve; all of a year or month given as a string is
+            included.
+        step : str or :class:`pandas.DateOffset`, optional
+            Length of each window: an optional integer, followed by 'A' or 'Y'
+            (years), 'Q' (quarters), 'M' (months), 'W' (weeks) or 'D' (days).
+        workers : int, optional
+            Maximum number of queries sent at once; default :attr:`max_concurrent`.
+        use_cache : bool, optional
+            If :obj:`True`, return a message previously retrieved for the same
+            arguments from :attr:`cache`, or store the merged message there.
+        dry_run : bool, optional
+            If :obj:`True`, return a list of the prepared requests for each window.
+        kwargs :
+            Other arguments to :meth:`get`, e.g. `dsd` or `params`.
+
+        Returns
+        -------
+        :class:`.DataMessage` or list of :class:`requests.Request`
+
+        Raises
+        ------
+        ValueError
+            If `start` or `end` is missing, `start` is after `end`, or `step` is not
+            understood.
+        """
+        if start is None or end is None:
+            raise ValueError(f"start and end are required; got {start!r}, {end!r}")
+        start = pd.Period(start).start_time if isinstance(start, str) else start
+        end = pd.Period(end).end_time if isinstance(end, str) else end
+        start, end = pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+        if start > end:
+            raise ValueError(f"start ({start:%Y-%m-%d}) is after end ({end:%Y-%m-%d})")
+        offset = _offset(step)
+
+        if isinstance(key, dict) and "url" not in kwargs:
+            # Validate the key and retrieve any DSD once, not for each window
+            key, kwargs["dsd"] = self._make_key(
+                Resource.data, resource_id, key, kwargs.get("dsd", None)
+            )
+
+        params = kwargs.pop("params", {})
+
+        def args(start, end):
+            return dict(
+                kwargs,
+                key=key,
+                params=dict(
+                    params,
+                    startPeriod=start.strftime("%Y-%m-%d"),
+                    endPeriod=end.strftime("%Y-%m-%d"),
+                ),
+                headers=dict(kwargs.get("headers", {})),
+            )
+
+        # Start and end dates of each window
+        windows = []
+        while start <= end:
+            windows.append((start, min(start + offset - pd.Timedelta(days=1), end)))
+            start += offset
+
+        if dry_run:
+            return [
+                self.get(Resource.data, resource_id, dry_run=True, **args(*w))
+                for w in windows
+            ]
+
+        # URL of a single query for all windows
+        url = self.get(
+            Resource.data, resource_id, dry_run=True, **args(windows[0][0], end)
+        ).url
+
+        if use_cache:
+            try:
+                return self.cache[url]
+            except KeyError:
+                logger.info("Not found in cache")
+                pass
+
+        logger.info("Partitioning query for %s into %d windows", url, len(windows))
+        # Windows without any data are skipped
+        msg = self._get_all(
+            Resource.data,
+            resource_id,
+            [args(*w) for w in windows],
+            workers,
+            missing_ok=True,
+        )
+
+        if use_cache:
+            self.cache[url] = msg
+
+        return msg
+
     def preview_data(self, flow_id, key={}):
         """Return a preview of data.
 
@@ -529,6 +1002,114 @@ when using a fsspec.core.OpenFile.
             return list(all_keys)
 
 
+def _merge(messages):
+    """Merge the data sets of `messages` into those of the first, and return it.
+
+    Series and observations are identified by the IDs and values of their keys;
+    those already in the first message are not added again.
+    """
+    msg = messages[0]
+    for other in messages[1:]:
+        for i, ds in enumerate(other.data):
+            if i < len(msg.data):
+                _merge_dataset(msg.data[i], ds)
+            else:
+                msg.data.append(ds)
+    return msg
+
+
+def _merge_dataset(ds, other):
+    """Add the group keys, series and observations of `other` to `ds`.
+
+    Series keys and observations from `other` are associated with the group keys of
+    `ds`, instead of the equal ones of `other`.
+    """
+    series = {_key_id(sk): sk for sk in ds.series}
+    groups = {(gk.id, _key_id(gk)) for gk in ds.group}
+    seen = set(map(_obs_id, ds.obs))
+
+    for gk in other.group:
+        if (gk.id, _key_id(gk)) not in groups:
+            ds.group[gk] = []
+
+    for sk, observations in other.series.items():
+        target = series.setdefault(_key_id(sk), sk)
+        if target is sk:
+            # Associated with group keys of `ds` by add_obs(), below
+            sk.group_keys.clear()
+        new = []
+        for obs in observations:
+            id = _obs_id(obs)
+            if id not in seen:
+                seen.add(id)
+                obs.series_key = target
+                obs.group_keys.clear()
+                new.append(obs)
+        ds.add_obs(new, target)
+
+    # Observations not in any series
+    new = []
+    for obs in other.obs:
+        if obs.series_key is None and _obs_id(obs) not in seen:
+            seen.add(_obs_id(obs))
+            obs.group_keys.clear()
+            new.append(obs)
+    ds.add_obs(new)
+
+
+def _key_id(key):
+    return tuple((id, kv.value) for id, kv in key.values.items())
+
+
+def _obs_id(obs):
+    return tuple(chain(*map(_key_id, obs.key_parts)))
+
+
+def _offset(step):
+    """Return a :class:`pandas.DateOffset` for `step`; see data_partitioned()."""
+    if isinstance(step, pd.DateOffset):
+        return step
+
+    match = re.fullmatch(r"(\d*)([AYQMWD])", str(step))
+    if not match:
+        raise ValueError(
+            f"step must be a DateOffset, or an integer and one of A, Y, Q, M, W, D; "
+            f"got {step!r}"
+        )
+    n, unit = int(match.group(1) or 1), match.group(2)
+    units = dict(A="years", Y="years", Q="months", M="months", W="weeks", D="days")
+    return pd.DateOffset(**{units[unit]: n * (3 if unit == "Q" else 1)})
+
+
+def _copy_session(session):
+    """Return a shallow copy of `session` with its own connection pools.
+
+    Instances of :class:`requests.adapters.HTTPAdapter` are copied; other adapters,
+    e.g. mocks used in testing, are shared.
+    """
+    result = type(session).__new__(type(session))
+    result.__dict__.update(session.__dict__)
+    result.adapters = type(session.adapters)(
+        (prefix, copy(a) if isinstance(a, requests.adapters.HTTPAdapter) else a)
+        for prefix, a in session.adapters.items()
+    )
+    return result
+
+
+def _close_copied_adapters(session):
+    """Close the connection pools of a session from :func:`_copy_session`."""
+    for adapter in session.adapters.values():
+        if isinstance(adapter, requests.adapters.HTTPAdapter):
+            adapter.close()
+
+
+def _read_message(Reader, source, dsd, dataset_class):
+    """Parse `source` using `Reader`; a module-level function, for processes."""
+    if isinstance(source, bytes):
+        source = BytesIO(source)
+    return Reader().read_message(source, dsd=dsd, dataset_class=dataset_class)
+
+
 def read_url(url, **kwargs):
     """Request a URL directly."""
     return Request().get(url=url, **kwargs)
@@ -6,15 +6,20 @@ Currently:
   without DataAttributes attached at various levels.
 - sdmx.writer converts these to pd.Series and pd.DataFrame objects.
 
-This module contains an alternate, incomplete/experimental implementation, in
-which Observation values, DataAttributes, and series- and group-associations
-are stored internally as a pd.DataFrame. test_experimental.py verifies that
-this implementation exposes the same API as the default DataSet.
+This module contains an alternate, experimental implementation, in which
+Observation values, DataAttributes, and series- and group-associations are
+stored internally as a pd.DataFrame. test_experimental.py verifies that this
+implementation exposes the same API as the default DataSet.
 
+To read data messages into this class, pass ``dataset_class=DataSet`` to
+:func:`.read_sdmx` or :meth:`.Request.get`.
 """
-from typing import Optional, Text
+from collections.abc import MutableMapping
+from typing import Dict, List, Optional, Text, Tuple
 
+import numpy as np
 import pandas as pd
+from pydantic import PrivateAttr
 
 from pandasdmx.model import (
     ActionType,
@@ -22,10 +27,19 @@ from pandasdmx.model import (
     AttributeValue,
     DataAttribute,
     DataStructureDefinition,
+    GroupKey,
     Key,
     Observation,
+    SeriesKey,
 )
 from pandasdmx.util import DictLike
+from pandasdmx.writer.pandas import (
+    _dataset_compat,
+    _maybe_convert_datetime,
+    _ordered_key,
+    write_dataset,
+    writer,
+)
 
 
 class DataSet(AnnotableArtefact):
@@ -35,63 +49,371 @@ class DataSet(AnnotableArtefact):
     valid_from: Optional[Text] = None
     structured_by: Optional[DataStructureDefinition] = None
 
-    # Internal storage: a pd.DataFrame with columns:
+    # Internal storage: a pd.DataFrame with one row per Observation, indexed by the
+    # full key and sorted, as returned by to_pandas(); and columns:
     # - 'value': the Observation value.
+    # - 'order': integer giving the order in which Observations were added.
     # - ('attr_obs', *id*): value for Observation.attached_attribute[id].
-    # - TODO 'series_key': integer index of the SeriesKey associated with the
-    #                      Observation.
-    # - TODO 'group_keys': integer indices of the GroupKey(s) associated with
-    #                      the Observation.
-    _data = None
+    # - 'series_key': integer index in _series_keys of the SeriesKey associated
+    #   with the Observation, or -1.
+    # - ('group_key', *i*): True if the Observation is associated with the i-th
+    #   GroupKey in _group_keys.
+    _data: Optional[pd.DataFrame] = PrivateAttr(default=None)
+
+    # Observations added since _data was last updated: dimension ID → list of
+    # values; column label → list of values; and the number of observations
+    _pending_key: Dict = PrivateAttr(default_factory=dict)
+    _pending_data: Dict = PrivateAttr(default_factory=dict)
+    _pending_len: int = PrivateAttr(default=0)
+
+    # SeriesKey and GroupKey instances, and their indices
+    _series_keys: List[SeriesKey] = PrivateAttr(default_factory=list)
+    _series_index: Dict = PrivateAttr(default_factory=dict)
+    _group_keys: List[GroupKey] = PrivateAttr(default_factory=list)
+    _group_index: Dict = PrivateAttr(default_factory=dict)
+
+    # _data, for which the following were computed: positions of its rows in order
+    # of 'order'; and index in _series_keys → positions of the rows in that series,
+    # in the same order. See _positions().
+    _positions_cache: Tuple = PrivateAttr(default=(None, None, None))
 
     def add_obs(self, observations, series_key=None):
         """Add *observations* to a series with *series_key*."""
-        if series_key:
-            raise NotImplementedError
+        code = -1 if series_key is None else self._add_series_key(series_key)
+        n = self._pending_len
 
-        # dict of dicts: key → {value, attributes, etc. }
-        obs_dict = {}
         for obs in observations:
-            # DataFrame row for this Observation
-            row = {"value": obs.value}
+            # Full key: values of the series key, then of the observation key
+            keys = obs.key_parts if series_key is None else (series_key, obs.dimension)
+            ids, values = _ordered_key(keys)
+            _append(self._pending_key, dict(zip(ids, map(str, values))), n)
 
-            # Store attributes
+            # DataFrame row for this Observation
+            row = {"value": obs.value, "series_key": code}
             for attr_id, av in obs.attached_attribute.items():
                 row[("attr_obs", attr_id)] = av.value
+            _append(self._pending_data, row, n)
+
+            self._pending_len = n = n + 1
+
+    def _add_series_key(self, series_key):
+        """Return the index of `series_key` in :attr:`_series_keys`, adding it."""
+        try:
+            return self._series_index[series_key]
+        except KeyError:
+            self._series_keys.append(series_key)
+            result = self._series_index[series_key] = len(self._series_keys) - 1
+            return result
+
+    def _add_group_key(self, group_key):
+        """Add `group_key`. Associations with observations are updated by _frame()."""
+        if group_key not in self._group_index:
+            self._group_keys.append(group_key)
+            self._group_index[group_key] = len(self._group_keys) - 1
+            self._data = self._drop_groups(self._data)
+
+    def _remove_series_key(self, series_key):
+        """Remove `series_key` and the observations associated with it."""
+        i = self._series_index[series_key]
+        data = self._frame()
+        if data is not None:
+            codes = data["series_key"].to_numpy()
+            keep = codes != i
+            # Codes of later series keys decrease by 1
+            data = data[keep].assign(series_key=codes[keep] - (codes[keep] > i))
+        self._data = data
+
+        del self._series_keys[i]
+        _reindex(self._series_index, self._series_keys)
+
+    def _remove_group_key(self, group_key):
+        """Remove `group_key`. Observations associated with it are retained."""
+        del self._group_keys[self._group_index[group_key]]
+        _reindex(self._group_index, self._group_keys)
+        self._data = self._drop_groups(self._data)
+
+    def _add_group_refs(self, target):
+        """No-op; associations with groups are determined from the index of _data."""
+
+    def _frame(self):
+        """Return :attr:`_data`, first adding any pending observations."""
+        data = self._data
+
+        if self._pending_len:
+            # Associations with groups are determined again for all rows, below
+            data = self._drop_groups(data)
+
+            new = pd.DataFrame(self._pending_data)
+            try:
+                new["value"] = new["value"].astype(np.float64)
+            except (TypeError, ValueError):
+                pass  # Non-numeric values; keep as given
+            new.index = pd.MultiIndex.from_arrays(
+                list(self._pending_key.values()), names=list(self._pending_key)
+            )
+            start = 0 if data is None or not len(data) else data["order"].max() + 1
+            new["order"] = np.arange(start, start + self._pending_len)
+            self._pending_key.clear()
+            self._pending_data.clear()
+            self._pending_len = 0
+
+            data = new if data is None else pd.concat([data, new])
+            # Sort; duplicate keys remain in the order they were added
+            data = data.sort_index()
+
+        if data is not None and self._group_keys and ("group_key", 0) not in data:
+            for i, gk in enumerate(self._group_keys):
+                data[("group_key", i)] = self._group_mask(data.index, gk)
+
+        self._data = data
+        return data
 
-            # Store the row
-            obs_dict[obs.key.order().get_values()] = row
+    @staticmethod
+    def _drop_groups(data):
+        """Return `data` without ('group_key', *i*) columns."""
+        if data is None:
+            return data
+        cols = _columns(data, "group_key")
+        return data.drop(columns=cols) if cols else data
 
-        # Convert to pd.DataFrame. Note similarity to sdmx.writer
-        self._data = pd.DataFrame.from_dict(obs_dict, orient="index")
+    @staticmethod
+    def _group_mask(index, group_key):
+        """Return a boolean array: :obj:`True` for rows of `index` in `group_key`."""
+        result = np.ones(len(index), dtype=bool)
+        for id, kv in group_key.values.items():
+            if id not in index.names:
+                return np.zeros(len(index), dtype=bool)
+            result &= np.asarray(index.get_level_values(id) == str(kv.value))
+        return result
 
-        if len(obs_dict):
-            self._data.index.names = obs.key.order().values.keys()
+    def _positions(self):
+        """Return positions of rows of :meth:`_frame` in the order they were added.
+
+        Returns a 3-tuple: the data; an array of the positions of all rows; and a
+        :class:`dict` mapping the index of each series key to an array of the
+        positions of its rows. These are computed once for each version of the
+        data, so that accessing each of :attr:`series` is not O(N).
+        """
+        data = self._frame()
+        if data is not self._positions_cache[0]:
+            if data is None:
+                order, series = np.array([], dtype=int), {}
+            else:
+                order = np.argsort(data["order"].to_numpy(), kind="stable")
+                codes = data["series_key"].to_numpy()[order]
+                by_series = np.argsort(codes, kind="stable")
+                bounds = np.flatnonzero(np.diff(codes[by_series])) + 1
+                series = {
+                    int(codes[rows[0]]): order[rows]
+                    for rows in np.split(by_series, bounds)
+                    if len(rows)
+                }
+            self._positions_cache = (data, order, series)
+        return self._positions_cache
 
     @property
     def obs(self):
-        # In model.DataSet, .obs is typed as List[Observation].
-        # Here, the Observations are generated on request.
-        for key, data in self._data.iterrows():
-            yield self._make_obs(key, data)
-
-    def _make_obs(self, key, data):
-        """Create an Observation from tuple *key* and pd.Series *data."""
-        # Create the Key
-        key = Key({dim: value for dim, value in zip(self._data.index.names, key)})
-        attrs = {}
-
-        # Handle columns of ._data
-        for col, value in data.items():
-            try:
-                # A tuple column label is ('attr_obs', attr_id)
-                group, attr_id = col
-            except ValueError:
-                # Not a tuple → the 'value' column, handled below
-                continue
-            if group == "attr_obs":
-                # Create a DataAttribute
-                attrs[attr_id] = AttributeValue(
-                    value_for=DataAttribute(id=attr_id), value=value
+        # In model.DataSet, .obs is typed as List[Observation]. Here, the
+        # Observations are generated on request, in the order they were added.
+        data, order, _ = self._positions()
+        return [] if data is None else self._make_obs(data.iloc[order])
+
+    @property
+    def series(self):
+        """Map of series key → list of observations.
+
+        A view of :attr:`_data`; the observations are generated on request.
+        """
+        return _Membership(self, self._series_keys, self._series_index, "series")
+
+    @property
+    def group(self):
+        """Map of group key → list of observations.
+
+        A view of :attr:`_data`; the observations are generated on request.
+        Assigning ``ds.group[group_key] = ...`` adds `group_key`; the observations
+        associated with it are those with matching key values.
+        """
+        return _Membership(self, self._group_keys, self._group_index, "group")
+
+    def _make_obs(self, data):
+        """Create Observations from rows of *data*, a subset of :attr:`_data`."""
+        if data is None or not len(data):
+            return []
+
+        ids = list(data.index.names)
+        attrs = _columns(data, "attr_obs")
+        groups = _columns(data, "group_key")
+        da = getattr(self.structured_by, "attributes", None)
+
+        columns = (
+            data.index,
+            data["value"],
+            data["series_key"],
+            zip(*(data[c] for c in attrs)) if attrs else iter(tuple, None),
+            zip(*(data[c] for c in groups)) if groups else iter(tuple, None),
+        )
+
+        result = []
+        for key, value, code, attr_values, in_groups in zip(*columns):
+            if not isinstance(key, tuple):
+                key = (key,)
+
+            if code >= 0:
+                series_key = self._series_keys[code]
+                dims = {
+                    id: v for id, v in zip(ids, key) if id not in series_key.values
+                }
+            else:
+                series_key = None
+                dims = dict(zip(ids, key))
+
+            aa = {}
+            for (_, attr_id), v in zip(attrs, attr_values):
+                if pd.isna(v):
+                    continue
+                aa[attr_id] = AttributeValue(
+                    value_for=_attribute(da, attr_id), value=v
+                )
+
+            result.append(
+                Observation(
+                    series_key=series_key,
+                    dimension=Key(dims),
+                    value=value,
+                    attached_attribute=aa,
+                    group_keys={
+                        self._group_keys[i] for (_, i), m in zip(groups, in_groups) if m
+                    },
                 )
-        return Observation(dimension=key, value=data["value"], attached_attribute=attrs)
+            )
+
+        return result
+
+    def to_pandas(self):
+        """Return the observation values as a :class:`pandas.Series`.
+
+        This is the same as :func:`.to_pandas` returns for a :class:`.model.DataSet`
+        with the default arguments. Unless there are observations with duplicate
+        keys, it is the 'value' column of the internal storage, without copying.
+        """
+        data = self._frame()
+        if data is None:
+            return pd.Series([], name="value", dtype=np.float64)
+        elif data.index.is_unique:
+            return data["value"]
+        else:
+            # As write_dataset(): the last of any duplicate keys is retained
+            return data.loc[~data.index.duplicated(keep="last"), "value"]
+
+
+class _Membership(MutableMapping):
+    """View of the observations associated with series or group keys."""
+
+    def __init__(self, ds, keys, index, kind):
+        self._ds = ds
+        self._keys = keys
+        self._index = index
+        self._kind = kind
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            key = self._keys[key]
+        i = self._index[key]
+
+        data, order, series = self._ds._positions()
+        if data is None:
+            return []
+        elif self._kind == "series":
+            rows = series.get(i, order[:0])
+        else:
+            rows = order[data[("group_key", i)].to_numpy()[order]]
+        return self._ds._make_obs(data.iloc[rows])
+
+    def __setitem__(self, key, observations):
+        if self._kind == "series":
+            self._ds.add_obs(observations, key)
+        else:
+            self._ds._add_group_key(key)
+
+    def __delitem__(self, key):
+        if isinstance(key, int):
+            key = self._keys[key]
+
+        if self._kind == "series":
+            self._ds._remove_series_key(key)
+        else:
+            self._ds._remove_group_key(key)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+
+def _append(columns, row, n):
+    """Append the values in `row` to lists of length `n` in `columns`.
+
+    Lists for labels not in `row` are padded with :obj:`None`, as are new lists.
+    """
+    for label, value in row.items():
+        try:
+            columns[label].append(value)
+        except KeyError:
+            columns[label] = [None] * n + [value]
+    for values in columns.values():
+        if len(values) == n:
+            values.append(None)
+
+
+def _reindex(index, keys):
+    """Update `index` in place to map each of `keys` to its position."""
+    index.clear()
+    index.update((key, i) for i, key in enumerate(keys))
+
+
+def _columns(data, group):
+    """Return the labels of columns of `data` like (`group`, …)."""
+    return [c for c in data.columns if isinstance(c, tuple) and c[0] == group]
+
+
+def _attribute(attributes, id):
+    """Return the DataAttribute `id` from `attributes`, or a new one."""
+    try:
+        return attributes.get(id)
+    except (AttributeError, KeyError):
+        return DataAttribute(id=id)
+
+
+@writer
+def _write_dataset(
+    obj: DataSet,
+    attributes="",
+    dtype=np.float64,
+    constraint=None,
+    datetime=False,
+    categorical=False,
+    chunksize=None,
+    **kwargs,
+):
+    """Convert :class:`.experimental.DataSet`.
+
+    As :func:`.write_dataset`. With the default `attributes`, `constraint` and
+    `dtype`, the values are returned from the internal storage without copying.
+    """
+    rtype = kwargs.get("_rtype", "rows")
+    args = (attributes, dtype, constraint, datetime, categorical, chunksize)
+    if any(args[:1] + args[2:]) or not dtype or rtype == "compat":
+        return write_dataset(obj, *args, **kwargs)
+
+    kwargs.setdefault("_rtype", "rows")
+    result = obj.to_pandas()
+    if not len(result):
+        # As write_dataset() for a data set without observations
+        return write_dataset(obj, *args, **kwargs)
+    if len(result) and result.dtype != dtype:
+        result = result.astype(dtype)
+
+    result, datetime, kwargs = _dataset_compat(result, datetime, kwargs)
+    return _maybe_convert_datetime(result, datetime, obj=obj, **kwargs)
@@ -28,8 +28,10 @@ from collections.abc import Iterable as IterableABC
 from copy import copy
 from datetime import date, datetime, timedelta
 from enum import Enum
+from functools import reduce
 from inspect import isclass
-from operator import attrgetter
+from itertools import islice
+from operator import attrgetter, is_, mul
 from typing import (
     Any,
     Dict,
@@ -39,12 +41,15 @@ from typing import (
     Mapping,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
 )
 from warnings import warn
 
+from pydantic import PrivateAttr
+
 from pandasdmx.util import BaseModel, DictLike, compare, validate_dictlike, validator
 
 log = logging.getLogger(__name__)
@@ -53,6 +58,11 @@ log = logging.getLogger(__name__)
 # spec. Currently set to 'en' because test_dsd.py expects it
 DEFAULT_LOCALE = "en"
 
+#: Maximum number of entries in each of the caches of values and keys kept by
+#: :meth:`DataStructureDefinition.make_key`. When a cache is full, its oldest
+#: entry is discarded for each new one.
+MAX_INTERNED = 2 ** 16
+
 
 # §3.2: Base structures
 
@@ -232,7 +242,21 @@ class IdentifiableArtefact(AnnotableArtefact):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._match_urn()
+
+    @classmethod
+    def construct(cls, _fields_set=None, **values):
+        """Create a new instance from trusted `values`, without validation.
+
+        See :meth:`.util.BaseModel.construct`. Other logic in the constructors of
+        subclasses, e.g. for :attr:`.Item.parent` and :attr:`.Item.child`, is not
+        applied.
+        """
+        result = super().construct(_fields_set, **values)
+        result._match_urn()
+        return result
 
+    def _match_urn(self):
         if self.urn:
             import pandasdmx.urn
 
@@ -799,6 +823,34 @@ class ComponentList(IdentifiableArtefact, Generic[CT]):
     # ItemScheme._Item
     _Component: Type = Component
 
+    # Index of `components` by ID; and the list and number of its elements that the
+    # index reflects
+    _index: Dict = PrivateAttr(default_factory=dict)
+    _indexed: Tuple = PrivateAttr(default=(None, 0))
+
+    def _update_index(self) -> Dict:
+        """Return the index of :attr:`components` by ID, updating it if needed.
+
+        Components appended to :attr:`components`, directly or otherwise, are added
+        to the index. If the list is replaced or shortened, the index is rebuilt.
+        """
+        components, n = self._indexed
+        if components is self.components and n == len(components):
+            return self._index
+        elif components is not self.components or n > len(self.components):
+            # Build a new dict; the current one may be shared with a copy of self
+            self._index, n = {}, 0
+
+        for c in self.components[n:]:
+            try:
+                # As the previous linear search, the first of any duplicate IDs
+                self._index.setdefault(c.id, c)
+            except TypeError:
+                pass  # MissingID
+
+        self._indexed = (self.components, len(self.components))
+        return self._index
+
     # Convenience access to the components
     def append(self, value: CT):
         """Append *value* to :attr:`components`."""
@@ -806,11 +858,10 @@ class ComponentList(IdentifiableArtefact, Generic[CT]):
 
     def get(self, id) -> CT:
         """Return the component with the given *id*."""
-        # Search for an existing Component
-        for c in self.components:
-            if c.id == id:
-                return c
-        raise KeyError(id)
+        try:
+            return self._update_index()[id]
+        except (KeyError, TypeError):
+            raise KeyError(id) from None
 
     def getdefault(self, id, cls=None, **kwargs) -> CT:
         """Return or create the component with the given *id*.
@@ -866,6 +917,12 @@ class ComponentList(IdentifiableArtefact, Generic[CT]):
     def __iter__(self):
         return iter(self.components)
 
+    def __contains__(self, value):
+        """A :class:`str` is contained if it is the ID of any component."""
+        if isinstance(value, str) and not isinstance(value, _MissingID):
+            return value in self._update_index()
+        return value in self.components
+
     def __repr__(self):
         return "<{}: {}>".format(
             self.__class__.__name__, "; ".join(map(repr, self.components))
@@ -1104,6 +1161,78 @@ class CubeRegion(BaseModel):
 
         return ".".join(all_values)
 
+    def split(self, structure, max_length=None, max_keys=None):
+        """Split the region into smaller regions that together include the same keys.
+
+        Member selections are divided repeatedly until, for each of the returned
+        regions, :meth:`to_query_string` has at most `max_length` characters, and
+        the number of combinations of selected values—i.e. of keys, or of series
+        in a data query—is at most `max_keys`. Dimensions without a member
+        selection are not counted.
+
+        Returns
+        -------
+        list of CubeRegion
+            ``[self]``, if it is within the limits.
+
+        Raises
+        ------
+        ValueError
+            if the region is excluded, or if a region exceeds the limits but none of
+            its included member selections has 2 or more values.
+        """
+        if not self.included:
+            # The parts of an excluded region would each exclude fewer keys
+            raise ValueError("cannot split an excluded CubeRegion")
+
+        result = []
+        regions = [self]
+        while len(regions):
+            cr = regions.pop()
+            lengths = {}
+            sizes = {}
+            for dim, ms in cr.member.items():
+                if ms.included and len(ms.values) > 1:
+                    # Selections that can be split
+                    lengths[dim] = sum(len(str(mv.value)) + 1 for mv in ms.values)
+                    sizes[dim] = len(ms.values)
+
+            length = len(cr.to_query_string(structure))
+            n_keys = reduce(mul, (len(ms.values) for ms in cr.member.values()), 1)
+            if max_length is not None and length > max_length:
+                # Halve the longest selection
+                dim = max(lengths, key=lengths.get, default=None)
+                parts = 2
+            elif max_keys is not None and n_keys > max_keys:
+                # Split the selection with the most values into as many parts as
+                # needed, each with an equal number of values
+                dim = max(sizes, key=sizes.get, default=None)
+                parts = -(-n_keys // max_keys) if max_keys > 0 else n_keys
+            else:
+                result.append(cr)
+                continue
+
+            if dim is None:
+                raise ValueError(
+                    f"cannot split {cr.to_query_string(structure)!r} to "
+                    f"max_length={max_length}, max_keys={max_keys}"
+                )
+
+            values = sorted(cr.member[dim].values, key=lambda mv: str(mv.value))
+            parts = min(parts, len(values))
+            bounds = [len(values) * i // parts for i in range(parts + 1)]
+            # Push the last part first, so that the first part is handled next
+            for start, end in reversed(list(zip(bounds, bounds[1:]))):
+                part = values[start:end]
+                new = CubeRegion(included=cr.included)
+                new.member.update(cr.member)
+                new.member[dim] = MemberSelection(
+                    included=True, values_for=dim, values=set(part)
+                )
+                regions.append(new)
+
+        return result
+
 
 class ContentConstraint(Constraint):
     #: :class:`CubeRegions <.CubeRegion>` included in the ContentConstraint.
@@ -1235,6 +1364,11 @@ class DimensionDescriptor(ComponentList[DimensionComponent]):
 
     _Component = Dimension
 
+    # The components list and their orders for which _permutations is valid
+    _order_state: Tuple = PrivateAttr(default=(None, None))
+    # Tuple of dimension IDs → indices of the IDs in the order of the DSD
+    _permutations: Dict = PrivateAttr(default_factory=dict)
+
     def assign_order(self):
         """Assign the :attr:`.DimensionComponent.order` attribute.
 
@@ -1243,16 +1377,71 @@ class DimensionDescriptor(ComponentList[DimensionComponent]):
         for i, component in enumerate(self.components):
             component.order = i + 1
 
+    def _permutation(self, ids):
+        """Return the indices of the dimension `ids` in the order of the DSD.
+
+        IDs that are not of any dimension are omitted. Results are cached until
+        :attr:`components` or the :attr:`~.DimensionComponent.order` of any component
+        changes.
+        """
+        orders = tuple(c.order for c in self.components)
+        if self._order_state != (self.components, orders):
+            self._order_state = (self.components, orders)
+            self._permutations = {}
+
+        try:
+            return self._permutations[ids]
+        except KeyError:
+            pass
+
+        position = {
+            dim.id: i
+            for i, dim in enumerate(sorted(self.components, key=attrgetter("order")))
+        }
+        result = tuple(
+            sorted(
+                (i for i, id in enumerate(ids) if id in position),
+                key=lambda i: position[ids[i]],
+            )
+        )
+        self._permutations[ids] = result
+        return result
+
     def order_key(self, key):
-        """Return a key ordered according to the DSD."""
+        """Return a key ordered according to the DSD.
+
+        If `key` is already in order, it is returned unchanged.
+        """
+        values = list(key.values.values())
+        indices = self._permutation(tuple(key.values.keys()))
+        if indices == tuple(range(len(values))):
+            return key
+
         result = key.__class__()
-        for dim in sorted(self.components, key=attrgetter("order")):
-            try:
-                result[dim.id] = key[dim.id]
-            except KeyError:
-                continue
+        for i in indices:
+            result[values[i].id] = values[i]
         return result
 
+    def order_values(self, ids, values):
+        """Order dimension `ids` and their `values` according to the DSD.
+
+        Unlike :meth:`order_key`, no :class:`Key` is created. IDs that are not of
+        any dimension are omitted.
+
+        Parameters
+        ----------
+        ids : tuple of str
+        values : sequence
+            with the same length as `ids`.
+
+        Returns
+        -------
+        tuple
+            of two tuples: the ordered IDs, and the corresponding values.
+        """
+        indices = self._permutation(ids)
+        return tuple(ids[i] for i in indices), tuple(values[i] for i in indices)
+
     @classmethod
     def from_key(cls, key):
         """Create a new DimensionDescriptor from a *key*.
@@ -1312,6 +1501,13 @@ class DataStructureDefinition(Structure, ConstrainableArtefact):
     #: :class:`.GroupDimensionDescriptor`.
     group_dimensions: DictLike[str, GroupDimensionDescriptor] = DictLike()
 
+    # (id, type, value) → KeyValue or AttributeValue created by make_key(…,
+    # trusted=True); and (key class, group ID, (id, type, value) for each value) →
+    # Key interned by make_key(…, intern=True). Each holds at most MAX_INTERNED
+    # entries.
+    _interned_values: Dict = PrivateAttr(default_factory=dict)
+    _interned_keys: Dict = PrivateAttr(default_factory=dict)
+
     # Convenience methods
     def make_constraint(self, key):
         """Return a constraint for *key*.
@@ -1391,9 +1587,22 @@ class DataStructureDefinition(Structure, ConstrainableArtefact):
                 dd[i].local_representation.enumerated.append(Code(id=kv.value))
         return cls(dimensions=dd)
 
-    def make_key(self, key_cls, values: Mapping, extend=False, group_id=None):
+    def make_key(
+        self,
+        key_cls,
+        values: Mapping,
+        extend=False,
+        group_id=None,
+        intern=False,
+        trusted=False,
+    ):
         """Make a :class:`.Key` or subclass.
 
+        With `trusted` or `intern`, the :class:`.KeyValue` and
+        :class:`.AttributeValue` instances in the key are shared with any other key
+        made in the same way by this DSD with the same IDs, and values of the same
+        type, and must not be modified.
+
         Parameters
         ----------
         key_cls : Key or SeriesKey or GroupKey
@@ -1408,6 +1617,15 @@ class DataStructureDefinition(Structure, ConstrainableArtefact):
         group_id : str, optional
             When `key_cls` is :class`.GroupKey`, the ID of the
             :class:`.GroupDimensionDescriptor` that structures the key.
+        intern : bool, optional
+            If :obj:`True`, return the same object for every call with the same
+            `key_cls`, `group_id` and `values` (of the same types), among the last
+            :data:`MAX_INTERNED` such keys. The key must then not be modified, e.g.
+            by updating its :attr:`~.Key.attrib`.
+        trusted : bool, optional
+            If :obj:`True`, the key, :class:`.KeyValue` and :class:`.AttributeValue`
+            are created without validation, using :meth:`~.util.BaseModel.construct`.
+            `values` must then be :class:`str`, as in a parsed message.
 
         Returns
         -------
@@ -1420,6 +1638,22 @@ class DataStructureDefinition(Structure, ConstrainableArtefact):
             If any of the keys of `values` is not a Dimension or Attribute in
             the DSD.
         """
+        if intern:
+            try:
+                # Values that are equal but of different types, e.g. 1 and True, are
+                # not interchangeable
+                ikey = (
+                    key_cls,
+                    group_id,
+                    tuple((id, type(v), v) for id, v in values.items()),
+                )
+                return self._interned_keys[ikey]
+            except KeyError:
+                pass
+            except TypeError:
+                # Some value is not hashable
+                intern = False
+
         # Methods to get dimensions and attributes
         get_method = "getdefault" if extend else "get"
         dim = getattr(self.dimensions, get_method)
@@ -1428,6 +1662,10 @@ class DataStructureDefinition(Structure, ConstrainableArtefact):
         # Arguments for creating the Key
         args: Dict[str, Any] = dict(described_by=self.dimensions)
 
+        # KeyValue and AttributeValue instances from previous calls, shared only with
+        # other calls that promise not to modify them
+        interned = self._interned_values if (trusted or intern) else {}
+
         if key_cls is GroupKey:
             # Get the GroupDimensionDescriptor, if indicated by group_id
             gdd = self.group_dimensions.get(group_id, None)
@@ -1443,6 +1681,9 @@ class DataStructureDefinition(Structure, ConstrainableArtefact):
                 # GroupKey will have same ID and be described by the GDD
                 args = dict(id=group_id, described_by=gdd)
 
+                # dim() below must be called for every value
+                interned = {}
+
                 # Dimensions to be retrieved from the GDD
                 def dim(id):
                     # Get from the DimensionDescriptor
@@ -1455,33 +1696,54 @@ class DataStructureDefinition(Structure, ConstrainableArtefact):
                 # Not described by anything
                 args = dict()
 
+        # Create instances with or without validation
+        if trusted:
+            key_cls, kv_cls, av_cls = (
+                key_cls.construct,
+                KeyValue.construct,
+                AttributeValue.construct,
+            )
+        else:
+            kv_cls, av_cls = KeyValue, AttributeValue
+
         key = key_cls(**args)
 
         # Convert keyword arguments to either KeyValue or AttributeValue
         keyvalues = []
-        for order, (id, value) in enumerate(values.items()):
-            args = dict(id=id, value=value)
-
-            if id in self.attributes:
-                # Reference a DataAttribute from the AttributeDescriptor
-                da = attr(id)
-                # Store the attribute value, referencing
-                key.attrib[da.id] = AttributeValue(**args, value_for=da)
-                continue
-
-            # Reference a Dimension from the DimensionDescriptor. If extend=False and
-            # the Dimension does not exist, this will raise KeyError
-            args["value_for"] = dim(id)
+        for id, value in values.items():
+            try:
+                kv = interned.get((id, type(value), value))
+                hashable = True
+            except TypeError:
+                # Value is not hashable; don't intern
+                kv, hashable = None, False
+
+            if kv is None:
+                if id in self.attributes:
+                    # Reference a DataAttribute from the AttributeDescriptor
+                    kv = av_cls(value=value, value_for=attr(id))
+                else:
+                    # Reference a Dimension from the DimensionDescriptor. If
+                    # extend=False and the Dimension does not exist, this will raise
+                    # KeyError
+                    kv = kv_cls(id=id, value=value, value_for=dim(id))
 
-            # Retrieve the order
-            order = args["value_for"].order
+                if hashable:
+                    _intern(interned, (id, type(value), value), kv)
 
-            # Store a KeyValue, to be sorted later
-            keyvalues.append((order, KeyValue(**args)))
+            if isinstance(kv, AttributeValue):
+                # Store the attribute value
+                key.attrib[kv.value_for.id] = kv
+            else:
+                # Store a KeyValue, to be sorted later by the Dimension's order
+                keyvalues.append((kv.value_for.order, kv))
 
         # Sort the values according to *order*
         key.values.update({kv.id: kv for _, kv in sorted(keyvalues)})
 
+        if intern:
+            _intern(self._interned_keys, ikey, key)
+
         return key
 
     def compare(self, other, strict=True):
@@ -1502,6 +1764,13 @@ class DataStructureDefinition(Structure, ConstrainableArtefact):
         )
 
 
+def _intern(cache, key, value):
+    """Store `value` in `cache`, first discarding the oldest entries if it is full."""
+    while cache and len(cache) >= MAX_INTERNED:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
 class DataflowDefinition(StructureUsage, ConstrainableArtefact):
     #:
     structure: DataStructureDefinition = DataStructureDefinition()
@@ -1529,7 +1798,7 @@ class KeyValue(BaseModel):
     #: The actual value.
     value: Any
     #:
-    value_for: Optional[Dimension] = None
+    value_for: Optional[DimensionComponent] = None
 
     def __init__(self, *args, **kwargs):
         args, kwargs = value_for_dsd_ref("dimension", args, kwargs)
@@ -1832,6 +2101,11 @@ class Observation(BaseModel):
         """Return the entire key, including KeyValues at the series level."""
         return self.series_key + self.dimension
 
+    @property
+    def key_parts(self):
+        """Return the :attr:`series_key` and :attr:`dimension` that are not None."""
+        return tuple(k for k in (self.series_key, self.dimension) if k is not None)
+
     def __len__(self):
         # FIXME this is unintuitive; maybe deprecate/remove?
         return len(self.key)
@@ -1886,13 +2160,63 @@ class DataSet(AnnotableArtefact):
     #: :mod:`pandasdmx` extension not in the IM.
     group: DictLike[GroupKey, List[Observation]] = DictLike()
 
-    def _add_group_refs(self, target):
+    # Index of the keys of `group`: dimension IDs → values → list of GroupKey.
+    # GroupKeys with values that are not hashable are stored under None.
+    _group_index: Dict = PrivateAttr(default_factory=dict)
+    # GroupKeys in `group` that have been added to _group_index
+    _group_indexed: List = PrivateAttr(default_factory=list)
+
+    def _index_groups(self):
+        """Add any new keys of :attr:`group` to the index used by _add_group_refs."""
+        indexed = self._group_indexed
+        if len(self.group) < len(indexed) or not all(map(is_, self.group, indexed)):
+            # Some GroupKeys were removed or replaced; rebuild
+            self._group_index.clear()
+            indexed.clear()
+        elif len(self.group) == len(indexed):
+            return
+
+        for gk in islice(self.group, len(indexed), None):
+            ids = tuple(gk.values.keys())
+            values = tuple(kv.value for kv in gk.values.values())
+            try:
+                self._group_index.setdefault(ids, {}).setdefault(values, []).append(gk)
+            except TypeError:
+                self._group_index.setdefault(None, []).append(gk)
+            indexed.append(gk)
+
+    def _add_group_refs(self, target, index=True):
         """Associate *target* with groups in this dataset.
 
-        *target* may be an instance of SeriesKey or Observation.
+        *target* may be an instance of SeriesKey or Observation. If *index* is
+        :obj:`False`, the caller has already called :meth:`_index_groups` since the
+        keys of :attr:`group` were last changed.
         """
-        for group_key in self.group:
-            if group_key in (target if isinstance(target, SeriesKey) else target.key):
+        if index:
+            self._index_groups()
+
+        # Values of `target`, by dimension ID
+        keys = (target,) if isinstance(target, SeriesKey) else target.key_parts
+        values = {}
+        for key in keys:
+            values.update((id, kv.value) for id, kv in key.values.items())
+
+        # Look up GroupKeys with the same values for the dimensions of each key
+        matched = []
+        for ids, index in self._group_index.items():
+            if ids is None:
+                # Not hashable; compare
+                full_key = target if isinstance(target, SeriesKey) else target.key
+                matched.extend(gk for gk in index if gk in full_key)
+                continue
+            try:
+                matched.extend(index.get(tuple(values[id] for id in ids), ()))
+            except (KeyError, TypeError):
+                # `target` lacks one of the dimensions, or a value is not hashable
+                pass
+
+        for group_key in matched:
+            if group_key not in target.group_keys:
                 target.group_keys.add(group_key)
                 if isinstance(target, Observation):
                     self.group[group_key].append(target)
@@ -1901,16 +2225,16 @@ class DataSet(AnnotableArtefact):
         """Add *observations* to a series with *series_key*.
 
         Checks consistency and adds group associations."""
+        # The keys of `group` are not changed below; index them once
+        self._index_groups()
+
         if series_key:
             # Associate series_key with any GroupKeys that apply to it
-            self._add_group_refs(series_key)
+            self._add_group_refs(series_key, index=False)
             # Maybe initialize empty series
             self.series.setdefault(series_key, [])
 
         for obs in observations:
-            # Associate the observation with any GroupKeys that contain it
-            self._add_group_refs(obs)
-
             # Store a reference to the observation
             self.obs.append(obs)
 
@@ -1926,6 +2250,9 @@ class DataSet(AnnotableArtefact):
                 # Store a reference to the observation
                 self.series[series_key].append(obs)
 
+            # Associate the observation with any GroupKeys that contain its full key
+            self._add_group_refs(obs, index=False)
+
     @validator("action")
     def _validate_action(cls, value):
         if value in ActionType:
@@ -90,7 +90,7 @@ register(sdmxjson.Reader)
 register(sdmxml.Reader)
 
 
-def read_sdmx(filename_or_obj, format=None, **kwargs):
+def read_sdmx(filename_or_obj, format=None, stream=False, columnar=False, **kwargs):
     """
     Load a SDMX-ML or SDMX-JSON message from a file or file-like object.
     A given file-like object is closed after loading.
@@ -101,17 +101,36 @@ def read_sdmx(filename_or_obj, format=None, **kwargs):
         or open binary file. A file is not closed explicitly. So it should be passed
         from a with-context.
     format : 'XML' or 'JSON', optional
+    stream : bool, optional
+        If :obj:`True`, return an iterator over the observations in the message,
+        instead of a :class:`.Message`. See :meth:`.sdmxml.Reader.iter_observations`
+        and :meth:`.sdmxjson.Reader.iter_observations`.
+    columnar : bool, optional
+        If :obj:`True`, return the data as :mod:`pandas` objects, instead of a
+        :class:`.Message`. See :meth:`.sdmxml.Reader.read_columns` and
+        :meth:`.sdmxjson.Reader.read_columns`.
 
     Other Parameters
     ----------------
     dsd : :class:`~.DataStructureDefinition`
         For “structure-specific” `format`=``XML`` messages only.
+    parser : str
+        For `format`=``XML`` only; one of :data:`.sdmxml.PARSERS`.
+    decoder : str
+        For `format`=``JSON`` only; one of :data:`.sdmxjson.DECODERS`.
+    dataset_class : type
+        Class of the data sets in a data message, e.g.
+        :class:`.experimental.DataSet`. Not used with `stream` or `columnar`.
     """
     reader = None
 
-    # pop any dsd from kwargs as these are passed to any FS backend
+    # pop any dsd, parser, decoder and dataset_class from kwargs as these are passed
+    # to any FS backend
     kwargs = kwargs.copy()
     dsd = kwargs.pop("dsd", None)
+    parser = kwargs.pop("parser", None)
+    decoder = kwargs.pop("decoder", None)
+    dataset_class = kwargs.pop("dataset_class", None)
 
     try:
         # Do we have a path/filename rather than file?
@@ -160,7 +179,16 @@ def read_sdmx(filename_or_obj, format=None, **kwargs):
             f"format={format}, or content '{first_line[:5].decode()}..'"
         )
 
-    if dsd:
-        return reader().read_message(obj, dsd=dsd)
+    # Pass only the reader arguments given; not every reader accepts them
+    args = {
+        k: v for k, v in (("dsd", dsd), ("parser", parser), ("decoder", decoder)) if v
+    }
+
+    if stream:
+        return reader().iter_observations(obj, **args)
+    elif columnar:
+        return reader().read_columns(obj, **args)
+    elif dataset_class:
+        return reader().read_message(obj, dataset_class=dataset_class, **args)
     else:
-        return reader().read_message(obj)
+        return reader().read_message(obj, **args)
@@ -37,3 +37,21 @@ class BaseReader(ABC):
             An instance of a Message subclass.
         """
         pass  # pragma: no cover
+
+    def iter_observations(self, source, dsd=None):
+        """Iterate over the observations in *source* without building a Message.
+
+        Readers that do not support streaming raise :class:`NotImplementedError`.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__module__}.Reader does not support streaming"
+        )
+
+    def read_columns(self, source, dsd=None):
+        """Read data in *source* directly into :mod:`pandas` objects.
+
+        Readers that do not support this raise :class:`NotImplementedError`.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__module__}.Reader does not support read_columns()"
+        )
@@ -1,5 +1,14 @@
 """SDMX-JSON v2.1 reader"""
+import codecs
+import importlib
 import json
+import re
+import shutil
+from tempfile import SpooledTemporaryFile
+from warnings import warn
+
+import numpy as np
+import pandas as pd
 
 from pandasdmx import model
 from pandasdmx.message import DataMessage, Header
@@ -15,10 +24,246 @@ from pandasdmx.model import (
     SeriesKey,
 )
 from pandasdmx.reader.base import BaseReader
+from pandasdmx.reader.sdmxml import StreamedObservation
+
+#: Number of bytes read from the source at a time by :class:`JSONStream`.
+CHUNK_SIZE = 64 * 1024
+
+#: Sources that cannot be rewound are copied to a temporary file, held in memory up
+#: to this many bytes.
+SPOOL_SIZE = 16 * 1024 * 1024
+
+#: JSON decoders for the `decoder` argument to :meth:`Reader.read_message` etc.,
+#: by name; see :func:`register_decoder`. "json" reads the message incrementally
+#: with :class:`JSONStream`; each other value is a function that decodes an entire
+#: document from :class:`bytes`, such as :func:`orjson.loads`.
+DECODERS = {"json": None}
+
+#: Optional dependencies registered in :data:`DECODERS` if they are installed.
+#: Each provides a ``loads()`` function.
+OPTIONAL_DECODERS = ("orjson", "ujson")
+
+# Regular expressions used by JSONStream
+_WS = re.compile(r"[ \t\n\r]*")
+# An object key with no escape sequences, and the following colon
+_KEY = re.compile(r'[ \t\n\r]*"([^"\\]*)"[ \t\n\r]*:')
+# Characters that start or end a container or string
+_SKIP = re.compile(r'[{}\[\]"]')
+# The remainder of a string, after its opening quotation mark
+_STRING_END = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+
+
+class JSONStream:
+    """Incremental reader for a JSON document in a binary file-like `source`.
+
+    Unlike :func:`json.load`, JSONStream reads `source` in chunks of
+    :data:`CHUNK_SIZE` bytes, and does not decode the whole document at once.
+    Instead, the caller navigates it: objects and arrays are traversed with
+    :meth:`items` and :meth:`elements`, while other values are decoded with
+    :meth:`value` or passed over with :meth:`skip`. Each of these consumes exactly
+    one value from the current position.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._raw_decode = json.JSONDecoder().raw_decode
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _read(self, size=CHUNK_SIZE):
+        """Append at least `size` characters from the source to the buffer.
+
+        Returns :obj:`False` if the source is exhausted.
+        """
+        if self.eof:
+            return False
+
+        # Discard the consumed part of the buffer
+        parts = [self.buf[self.pos :]]
+        self.pos = 0
+
+        while size > 0:
+            data = self.source.read(max(size, CHUNK_SIZE))
+            chunk = self._decoder.decode(data, final=not data)
+            parts.append(chunk)
+            size -= len(chunk)
+            if not data:
+                self.eof = True
+                break
+
+        self.buf = "".join(parts)
+        return len(self.buf) > len(parts[0])
+
+    def _error(self, msg):
+        return json.JSONDecodeError(msg, self.buf, self.pos)
+
+    def _peek(self):
+        """Skip whitespace and return the next character, or "" at the end."""
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self._read():
+                return self.buf[self.pos : self.pos + 1]
+
+    def _expect(self, chars):
+        """Consume and return the next character, which must be one of `chars`."""
+        c = self._peek()
+        if not c or c not in chars:
+            raise self._error(f"Expecting one of {repr(chars)}")
+        self.pos += 1
+        return c
+
+    def value(self):
+        """Decode and return the value at the current position."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Incomplete value; read as much again and retry
+                if not self._read(len(self.buf) - self.pos):
+                    raise
+            else:
+                # A number at the end of the buffer may continue in the source
+                if end < len(self.buf) or not self._read():
+                    self.pos = end
+                    return value
+
+    def items(self):
+        """Iterate over the keys of the object at the current position.
+
+        After each key is yielded, its value must be consumed before the iteration
+        continues.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            match = _KEY.match(self.buf, self.pos)
+            if match:
+                self.pos = match.end()
+                yield match.group(1)
+            else:
+                # Key with escape sequences, or not entirely in the buffer
+                if self._peek() != '"':
+                    raise self._error("Expecting property name")
+                key = self.value()
+                self._expect(":")
+                yield key
+
+            if self._expect(",}") == "}":
+                return
+
+    def elements(self):
+        """Iterate over the elements of the array at the current position.
+
+        The index of each element is yielded; the element itself must be consumed
+        before the iteration continues.
+        """
+        self._expect("[")
+        if self._peek() == "]":
+            self.pos += 1
+            return
+
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if self._expect(",]") == "]":
+                return
+
+    def skip(self):
+        """Pass over the value at the current position, without decoding it."""
+        if self._peek() not in "{[":
+            self.value()
+            return
+
+        depth = 0
+        while True:
+            match = _SKIP.search(self.buf, self.pos)
+            if match is None:
+                self.pos = len(self.buf)
+                if not self._read():
+                    raise self._error("Unterminated value")
+                continue
+
+            self.pos = match.end()
+            c = match.group()
+            if c == '"':
+                # Skip to the end of the string
+                while True:
+                    match = _STRING_END.match(self.buf, self.pos)
+                    if match:
+                        self.pos = match.end()
+                        break
+                    elif not self._read():
+                        raise self._error("Unterminated string")
+            elif c in "{[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+
+class JSONDocument:
+    """A decoded JSON document, navigated like :class:`JSONStream`.
+
+    This allows :class:`Reader` to use a decoder from :data:`DECODERS` that decodes
+    the entire document at once.
+    """
+
+    def __init__(self, doc):
+        # The value at the current position
+        self._next = doc
+
+    def value(self):
+        """Return the value at the current position."""
+        return self._next
+
+    def items(self):
+        """Iterate over the keys of the object at the current position."""
+        for key, value in self.value().items():
+            self._next = value
+            yield key
+
+    def elements(self):
+        """Iterate over the indices of the array at the current position."""
+        for index, value in enumerate(self.value()):
+            self._next = value
+            yield index
+
+    def skip(self):
+        """Pass over the value at the current position."""
+
+
+def register_decoder(name, loads):
+    """Register `loads` as a JSON decoder with `name` in :data:`DECODERS`.
+
+    `loads` must accept the entire SDMX-JSON message as :class:`bytes`, and return
+    the decoded document as :func:`json.loads` does.
+    """
+    DECODERS[name] = loads
+
+
+for _name in OPTIONAL_DECODERS:
+    try:
+        register_decoder(_name, importlib.import_module(_name).loads)
+    except ImportError:
+        pass
 
 
 class Reader(BaseReader):
-    """Read SDMXJSON 2.1 and expose it as instances from :mod:`pandasdmx.model`."""
+    """Read SDMXJSON 2.1 and expose it as instances from :mod:`pandasdmx.model`.
+
+    The message is read incrementally using :class:`JSONStream`: ``"structure"`` is
+    decoded first, and the observations in ``"dataSets"`` are then converted as they
+    are read, so that the decoded JSON for the entire message is never held in
+    memory.
+    """
 
     content_types = [
         "application/vnd.sdmx.draft-sdmx-json+json",
@@ -29,33 +274,276 @@ class Reader(BaseReader):
 
     suffixes = [".json"]
 
+    #: Default for the `decoder` argument to :meth:`read_message` etc.; one of
+    #: :data:`DECODERS`. Set e.g. to "orjson" to use that decoder process-wide.
+    decoder = "json"
+
+    #: Class of the data sets in a data message. See :meth:`read_message`.
+    dataset_class = DataSet
+
     @classmethod
     def detect(cls, content):
         return content.startswith(b"{")
 
-    def read_message(self, source, dsd=None):
+    def read_message(self, source, dsd=None, decoder=None, dataset_class=None):
+        """Read the message in `source`.
+
+        `decoder` is one of :data:`DECODERS`; by default, :attr:`decoder`. If
+        `dataset_class` is given, e.g. :class:`.experimental.DataSet`, data sets are
+        instances of this class.
+
+        Observations with the same observation-level key share a single
+        :class:`.Key` as :attr:`.Observation.dimension`; this must not be modified.
+        """
+        self.dataset_class = dataset_class or self.dataset_class
+
+        # Observation-level keys, by SDMX-JSON key and id() of the base key. Keys
+        # such as "0" for the first period recur in every series; each is created
+        # and ordered once. Base keys are retained by _parse() until it completes.
+        # Observations with the same key, e.g. in different series, share one Key
+        # instance, as with DataStructureDefinition.make_key(…, intern=True).
+        obs_keys = {}
+
+        def make_key(key, base):
+            try:
+                return obs_keys[key, id(base)]
+            except KeyError:
+                result = self._make_key("observation", key, base=base)
+                obs_keys[key, id(base)] = result
+                return result
+
+        for ds, _, series_key, base_key, observations in self._parse(
+            source, dsd, decoder
+        ):
+            if not self.msg.data or self.msg.data[-1] is not ds:
+                self.msg.data.append(ds)
+
+            ds.add_obs(
+                (
+                    Observation(
+                        series_key=series_key,
+                        dimension=make_key(key, base_key),
+                        value=elem[0] if len(elem) else None,
+                        attached_attribute=self._make_attrs("observation", elem[1:]),
+                    )
+                    for key, elem in observations
+                ),
+                series_key,
+            )
+
+        return self.msg
+
+    def iter_observations(self, source, dsd=None, decoder=None):
+        """Iterate over the observations in `source` without building a Message.
+
+        As :meth:`.sdmxml.Reader.iter_observations`. The observations of a series
+        are yielded as they are read, unless its ``"attributes"`` follow its
+        ``"observations"``; these are decoded together before any is yielded.
+        With a `decoder` other than "json", the entire message is decoded first.
+
+        Yields
+        ------
+        .StreamedObservation
+        """
+        for _, _, series_key, base_key, observations in self._parse(
+            source, dsd, decoder
+        ):
+            for key, elem in observations:
+                yield StreamedObservation(
+                    series_key,
+                    self._make_key("observation", key, base=base_key),
+                    elem[0] if len(elem) else None,
+                    self._make_attrs("observation", elem[1:]),
+                )
+
+    def read_columns(self, source, dsd=None, decoder=None):
+        """Read the data sets in `source` into pandas objects.
+
+        As :meth:`.sdmxml.Reader.read_columns`, without creating
+        :class:`.Observation` or :class:`.Key` instances. The keys of the
+        observations in each series are decoded together by :meth:`_decode_keys`,
+        and the resulting indices of dimension values form the codes of a
+        :class:`pandas.MultiIndex`. Attributes are discarded. `decoder` is as for
+        :meth:`read_message`.
+        """
+        result = []
+        for ds, key, series_key, base_key, observations in self._parse(
+            source, dsd, decoder
+        ):
+            if not result or result[-1][0] is not ds:
+                # Data set, dimension IDs in the order of Observation.key, and lists
+                # of arrays of codes and values
+                result.append([ds, None, [], []])
+            data = result[-1]
+
+            keys, values = [], []
+            for obs_key, elem in observations:
+                keys.append(obs_key)
+                values.append(elem[0] if len(elem) else None)
+
+            if not keys:
+                continue
+            elif data[1] is None:
+                obs_key = self._make_key("observation", keys[0], base=base_key)
+                data[1] = [kv.id for kv in (series_key + obs_key)]
+
+            # Indices of the values of all dimensions, in the order of the DSD.
+            # Dimensions at the data set level have only one value.
+            codes = np.full(
+                (len(keys), len(self.msg.structure.dimensions)), -1, dtype=np.intp
+            )
+            codes[:, self._level_pos.get("dataSet", [])] = 0
+            if key is not None:
+                codes[:, self._level_pos.get("series", [])] = self._decode_keys(
+                    "series", [key]
+                )
+            codes[:, self._level_pos.get("observation", [])] = self._decode_keys(
+                "observation", keys
+            )
+
+            data[2].append(codes)
+            data[3].append(np.array(values, dtype=float))
+
+        for i, (_, ids, codes, values) in enumerate(result):
+            result[i] = self._to_pandas(ids, codes, values)
+
+        return result[0] if len(result) == 1 else result
+
+    def _to_pandas(self, ids, codes, values):
+        """Return a :class:`pandas.Series` from the arrays of :meth:`read_columns`.
+
+        The index has the dimensions `ids`, in that order; as :func:`.write_dataset`,
+        the last of any duplicate keys is retained, and the index is sorted. If there
+        are no observations, the result is an empty Series with an index level for
+        each dimension of the DSD.
+        """
+        dims = list(self.msg.structure.dimensions)
+
+        if not values:
+            index = None
+            if dims:
+                ids = [dim.id for dim in dims]
+                index = pd.MultiIndex.from_arrays([[]] * len(ids), names=ids)
+            return pd.Series([], index=index, name="value", dtype=np.float64)
+
+        pos = {dim.id: i for i, dim in enumerate(dims)}
+        codes = np.concatenate(codes)
+
+        index = pd.MultiIndex(
+            levels=[[kv.value for kv in self._dim_values[dims[pos[id]]]] for id in ids],
+            codes=[codes[:, pos[id]] for id in ids],
+            names=ids,
+        )
+        result = pd.Series(np.concatenate(values), index=index, name="value")
+        return result[~index.duplicated(keep="last")].sort_index()
+
+    def _parse(self, source, dsd, decoder=None):
+        """Parse `source`, yielding the observations of each series.
+
+        Each item is a tuple of:
+
+        1. the :class:`.DataSet`,
+        2. the key of the series as it appears in the SDMX-JSON message, e.g. "0:3",
+           or :obj:`None` for observations not in a series,
+        3. the :class:`.SeriesKey`, or :obj:`None` for observations not in a series,
+        4. a :class:`.Key` with the dimensions at the data set level, or :obj:`None`,
+        5. an iterable of (key, values) for each observation, as they appear in the
+           SDMX-JSON message. This must be exhausted before the next item is
+           requested.
+
+        The first item for each data set has no observations, so that data sets
+        with no series or observations are also yielded.
+        """
         # Initialize message instance
-        msg = DataMessage()
+        self.msg = DataMessage()
 
         if dsd:  # pragma: no cover
             # Store explicit DSD, if any
-            msg.dataflow.structure = dsd
+            self.msg.dataflow.structure = dsd
 
-        # Read JSON
-        source.default_size = -1
-        tree = json.load(source)
+        self._dim_level = None
 
-        # Read the header
+        loads = self._get_decoder(decoder)
+        if loads is None:
+            if not getattr(source, "seekable", lambda: False)():
+                # Copy to a file that can be rewound, in case "dataSets" precedes
+                # "structure"
+                source, _source = SpooledTemporaryFile(max_size=SPOOL_SIZE), source
+                shutil.copyfileobj(_source, source)
+                source.seek(0)
+
+            start = source.tell()
+
+            def open_stream():
+                source.seek(start)
+                return JSONStream(source)
+
+        else:
+            # Decode the entire document at once
+            doc = loads(source.read())
+
+            def open_stream():
+                return JSONDocument(doc)
+
+        deferred = False
+
+        stream = open_stream()
+        for name in stream.items():
+            if name == "header":
+                self._read_header(stream.value())
+            elif name == "structure":
+                self._read_structure(stream.value())
+            elif name == "dataSets" and self._dim_level is not None:
+                yield from self._read_datasets(stream)
+            elif name == "dataSets":
+                # The structure is needed to interpret the data sets; read them again
+                # after the structure
+                deferred = True
+                stream.skip()
+            else:
+                stream.skip()
+
+        if not deferred:
+            return
+        elif self._dim_level is None:
+            raise ValueError("SDMX-JSON message has no structure for its dataSets")
+
+        stream = open_stream()
+        for name in stream.items():
+            if name == "dataSets":
+                yield from self._read_datasets(stream)
+            else:
+                stream.skip()
+
+    def _get_decoder(self, name=None):
+        """Return the decoder `name` from :data:`DECODERS`; default :attr:`decoder`.
+
+        If `name` is one of :data:`OPTIONAL_DECODERS` but is not installed, a warning
+        is given and "json" is used instead.
+        """
+        name = name or self.decoder
+        if name in DECODERS:
+            return DECODERS[name]
+        elif name in OPTIONAL_DECODERS:
+            warn(
+                f"optional dependency {name} is not installed; using decoder='json'",
+                RuntimeWarning,
+            )
+            return DECODERS["json"]
+
+        raise ValueError(f"decoder={repr(name)}; expected one of {tuple(DECODERS)}")
+
+    def _read_header(self, elem):
         # TODO handle KeyError here
-        elem = tree["header"]
-        msg.header = Header(
+        self.msg.header = Header(
             id=elem["id"],
             prepared=elem["prepared"],
             sender=model.Agency(**elem["sender"]),
         )
 
-        # pre-fetch some structures for efficient use in series and obs
-        structure = tree["structure"]
+    def _read_structure(self, structure):
+        """Read dimensions and attributes from `structure` into :attr:`msg`."""
+        msg = self.msg
 
         # Read dimensions and values
         self._dim_level = dict()
@@ -90,6 +578,13 @@ class Reader(BaseReader):
 
         msg.observation_dimension = dim_at_obs
 
+        # Dimensions at each level, in the order of the DSD, and their positions
+        self._level_dims = dict()
+        self._level_pos = dict()
+        for i, d in enumerate(msg.structure.dimensions):
+            self._level_dims.setdefault(self._dim_level[d], []).append(d)
+            self._level_pos.setdefault(self._dim_level[d], []).append(i)
+
         # Read attributes and values
         self._attr_level = dict()
         self._attr_values = dict()
@@ -110,52 +605,108 @@ class Reader(BaseReader):
                         AttributeValue(value=value["name"], value_for=a)
                     )
 
-        self.msg = msg
+        # Attributes at each level, in order
+        self._level_attrs = dict()
+        for a in msg.structure.attributes:
+            self._level_attrs.setdefault(self._attr_level[a], []).append(a)
 
+    def _read_datasets(self, stream):
         # Make a SeriesKey for Observations in this DataSet
         ds_key = self._make_key("dataSet")
 
-        # Read DataSets
-        for ds in tree["dataSets"]:
-            msg.data.append(self.read_dataset(ds, ds_key))
+        for _ in stream.elements():
+            yield from self._read_dataset(stream, ds_key)
+
+    def _read_dataset(self, stream, ds_key):
+        ds = self.dataset_class()
+        yield ds, None, None, ds_key, ()
+
+        for name in stream.items():
+            if name == "action":
+                ds.action = ActionType[stream.value().lower()]
+            elif name == "validFrom":
+                ds.valid_from = stream.value()
+            elif name == "series":
+                # Process series
+                for key_values in stream.items():
+                    series_key = self._make_key("series", key_values, base=ds_key)
+                    observations = self._read_series(stream, series_key)
+                    yield ds, key_values, series_key, None, observations
+                    # Consume any observations not used by the caller
+                    for _ in observations:
+                        pass
+            elif name == "observations":
+                # Process bare observations
+                observations = self._read_observations(stream)
+                yield ds, None, None, ds_key, observations
+                for _ in observations:
+                    pass
+            else:
+                stream.skip()
+
+    def _read_series(self, stream, series_key):
+        attributes = False
+        observations = None
+
+        for name in stream.items():
+            if name == "attributes":
+                series_key.attrib = self._make_attrs("series", stream.value())
+                attributes = True
+            elif name == "observations" and attributes:
+                yield from self._read_observations(stream)
+            elif name == "observations":
+                # Attributes of the series may follow; decode all its observations
+                observations = stream.value()
+            else:
+                stream.skip()
+
+        if observations:
+            yield from observations.items()
+
+    def _read_observations(self, stream):
+        for key in stream.items():
+            yield key, stream.value()
+
+    def _key_values(self, level, value=None):
+        """Iterate over (:class:`.Dimension`, :class:`.KeyValue`) for a `level` key.
 
-        return msg
+        SDMXJSON observations have keys like '2' or '3:4', consisting of colon
+        (':') separated indices. Each index refers to one of the values given
+        in the DSD for an observation-level dimension.
+        """
+        # Dimensions at the appropriate level
+        dims = self._level_dims.get(level, [])
 
-    def read_dataset(self, root, ds_key):
-        ds = DataSet(
-            action=ActionType[root["action"].lower()],
-            valid_from=root.get("validFrom", None),
-        )
+        # Dimensions specified at the dataSet level have only one value, so
+        # pre-fill this
+        value = ":".join(["0"] * len(dims)) if value is None else value
 
-        # Process series
-        for key_values, elem in root.get("series", {}).items():
-            series_key = self._make_key("series", key_values, base=ds_key)
-            series_key.attrib = self._make_attrs("series", root.get("attributes", []))
-            ds.add_obs(self.read_obs(elem, series_key=series_key), series_key)
-
-        # Process bare observations
-        ds.add_obs(self.read_obs(root, base_key=ds_key))
-
-        return ds
-
-    def read_obs(self, root, series_key=None, base_key=None):
-        for key, elem in root.get("observations", {}).items():
-            value = elem.pop(0) if len(elem) else None
-            o = Observation(
-                series_key=series_key,
-                dimension=self._make_key("observation", key, base=base_key),
-                value=value,
-                attached_attribute=self._make_attrs("observation", elem),
-            )
-            yield o
+        if len(value):
+            # Iterate over key indices and the corresponding dimensions
+            for index, dim in zip(map(int, value.split(":")), dims):
+                # Look up the value
+                yield dim, self._dim_values[dim][index]
+
+    def _decode_keys(self, level, keys):
+        """Decode string `keys` at `level` into indices of dimension values.
+
+        Unlike :meth:`_key_values`, all `keys` are split and converted together. The
+        result is an array with one row per key, and one column for each dimension at
+        `level`, in the order of the DSD.
+        """
+        n = len(self._level_dims.get(level, []))
+        if n == 0:
+            return np.empty((len(keys), 0), dtype=np.intp)
+
+        result = np.fromstring(":".join(keys), dtype=np.intp, sep=":")
+        if result.size != len(keys) * n:
+            raise ValueError(f"SDMX-JSON {level} keys do not all have {n} indices")
+
+        return result.reshape(len(keys), n)
 
     def _make_key(self, level, value=None, base=None):
         """Convert a string observation key *value* to a Key or subclass.
 
-        SDMXJSON observations have keys like '2' or '3:4', consisting of colon
-        (':') separated indices. Each index refers to one of the values given
-        in the DSD for an observation-level dimension.
-
         KeyValues from any *base* Key are copied, and the new values appended.
         *level* species whether a 'series' or 'observation' Key is returned.
         """
@@ -165,18 +716,9 @@ class Reader(BaseReader):
         if base:
             key.values.update(base.values)
 
-        # Dimensions at the appropriate level
-        dims = [d for d in self.msg.structure.dimensions if self._dim_level[d] == level]
-
-        # Dimensions specified at the dataSet level have only one value, so
-        # pre-fill this
-        value = ":".join(["0"] * len(dims)) if value is None else value
-
-        if len(value):
-            # Iterate over key indices and the corresponding dimensions
-            for index, dim in zip(map(int, value.split(":")), dims):
-                # Look up the value and assign to the Key
-                key[dim.id] = self._dim_values[dim][index]
+        # Assign values to the Key
+        for dim, kv in self._key_values(level, value):
+            key[dim.id] = kv
 
         # Order the key
         return self.msg.structure.dimensions.order_key(key)
@@ -186,11 +728,8 @@ class Reader(BaseReader):
 
         'level' must be one of 'dataSet', 'series', or 'observation'.
         """
-        attrs = [
-            a for a in self.msg.structure.attributes if self._attr_level[a] == level
-        ]
         result = {}
-        for index, attr in zip(values, attrs):
+        for index, attr in zip(values, self._level_attrs.get(level, [])):
             if index is None:
                 continue
             av = self._attr_values[attr][index]
@@ -8,13 +8,15 @@
 
 import logging
 import re
-from collections import defaultdict
+from array import array
+from collections import ChainMap, defaultdict, namedtuple
 from copy import copy
 from inspect import isclass
 from itertools import chain, product
-from operator import itemgetter
 from sys import maxsize
 
+import numpy as np
+import pandas as pd
 from lxml import etree
 from lxml.etree import QName
 
@@ -30,6 +32,13 @@ log.setLevel(logging.DEBUG)
 
 PARSE = {}
 
+#: Parsing functions that override :data:`PARSE` in
+#: :meth:`Reader.iter_observations`.
+STREAM = {}
+
+#: Parsing functions that override :data:`PARSE` in :meth:`Reader.read_columns`.
+COLUMNAR = {}
+
 SKIP = (
     "com:Annotations com:Footer footer:Message "
     # Key and observation values
@@ -43,6 +52,16 @@ SKIP = (
     ":Ref :URN"
 )
 
+#: Elements that, once parsed, are removed from their parent together with any
+#: preceding siblings. The parsing functions for the parents of these elements do
+#: not inspect their children, so memory used is bounded for any number of series
+#: and observations.
+RELEASE = (
+    "gen:Group gen:Obs gen:Series "
+    # Structure-specific
+    ":Group :Obs :Series"
+)
+
 TO_SNAKE_RE = re.compile("([A-Z]+)")
 
 
@@ -51,21 +70,81 @@ def add_localizations(target: model.InternationalString, values: list) -> None:
     target.localizations.update({locale: label for locale, label in values})
 
 
-# filter() conditions; see get_unique() and pop_single()
+class Stack(list):
+    """A stack of parsed objects.
 
+    The first call to :meth:`with_id` creates an index of the objects by their
+    :attr:`~.IdentifiableArtefact.id`, which is then kept up to date by
+    :meth:`append`, :meth:`extend` and :meth:`pop`.
+    """
 
-def matching_class(cls):
-    def func(item):
-        return isclass(item) and issubclass(item, cls)
+    _index = None
+
+    def append(self, obj):
+        super().append(obj)
+        if self._index is not None:
+            self._index[obj.id or None].append(obj)
+
+    def extend(self, objects):
+        for obj in objects:
+            self.append(obj)
+
+    def pop(self, *args):
+        obj = super().pop(*args)
+        if self._index is not None:
+            # Remove by identity, searching from the most recently pushed
+            bucket = self._index[obj.id or None]
+            for i in range(len(bucket) - 1, -1, -1):
+                if bucket[i] is obj:
+                    del bucket[i]
+                    break
+        return obj
 
-    return func
+    def with_id(self, id):
+        """Return a list of the objects in the stack with the given `id`."""
+        if self._index is None:
+            self._index = defaultdict(list)
+            for obj in self:
+                self._index[obj.id or None].append(obj)
+        return self._index.get(id, [])
 
 
-def matching_class0(cls):
-    def func(item):
-        return isclass(item[0]) and issubclass(item[0], cls)
+class Stacks(defaultdict):
+    """Collection of :class:`Stack`, keyed by class or by name.
 
-    return func
+    For each class passed to :meth:`matching`, the keys that are the same class or a
+    subclass are recorded, and updated as keys are added and removed, so that
+    :meth:`Reader.get_single` and :meth:`Reader.pop_all` need not examine every key.
+    """
+
+    def __init__(self):
+        super().__init__(Stack)
+        # Class → list of keys that are the class or a subclass
+        self._matching = {}
+
+    def __missing__(self, key):
+        result = super().__missing__(key)
+        if isclass(key):
+            for cls, keys in self._matching.items():
+                if issubclass(key, cls):
+                    keys.append(key)
+        return result
+
+    def pop(self, key, *args):
+        if isclass(key) and key in self:
+            for keys in self._matching.values():
+                if key in keys:
+                    keys.remove(key)
+        return super().pop(key, *args)
+
+    def matching(self, cls):
+        """Return a list of keys that are `cls` or subclasses of `cls`."""
+        try:
+            return self._matching[cls]
+        except KeyError:
+            result = [k for k in self if isclass(k) and issubclass(k, cls)]
+            self._matching[cls] = result
+            return result
 
 
 def setdefault_attrib(target, elem, *names):
@@ -82,27 +161,27 @@ def to_snake(value):
     return TO_SNAKE_RE.sub(r"_\1", value).lower()
 
 
-def start(*args, only=True):
+def start(*args, only=True, table=PARSE):
     """Decorator for a function that parses "start" events for XML elements."""
 
     def decorator(func):
         for tag in to_tags(*args):
-            PARSE[tag, "start"] = func
+            table[tag, "start"] = func
             if only:
-                PARSE[tag, "end"] = None
+                table[tag, "end"] = None
         return func
 
     return decorator
 
 
-def end(*args, only=True):
+def end(*args, only=True, table=PARSE):
     """Decorator for a function that parses "end" events for XML elements."""
 
     def decorator(func):
         for tag in to_tags(*args):
-            PARSE[tag, "end"] = func
+            table[tag, "end"] = func
             if only:
-                PARSE[tag, "start"] = None
+                table[tag, "start"] = None
         return func
 
     return decorator
@@ -113,12 +192,219 @@ def to_tags(*args):
 
 
 PARSE.update({k: None for k in product(to_tags(SKIP), ["start", "end"])})
+RELEASE = set(to_tags(RELEASE))
 
 
 class NotReference(Exception):
     pass
 
 
+#: Item yielded by :meth:`Reader.iter_observations`. The fields have the same
+#: meaning as the corresponding attributes of :class:`.Observation`.
+StreamedObservation = namedtuple(
+    "StreamedObservation", "series_key dimension value attached_attribute"
+)
+
+
+class Columns:
+    """Columnar storage for the observations of one data set.
+
+    Each dimension value is stored as an integer code in an :class:`array.array`,
+    together with a mapping from values to codes; observation values are stored
+    in an array of float64. No :mod:`pandasdmx.model` objects are created per
+    observation.
+    """
+
+    def __init__(self, dsd, extend=False):
+        self.dsd = dsd
+        self.extend = extend
+        # Dimension ID → {value: code}
+        self.codes = {}
+        # Dimension ID → array of codes
+        self.arrays = {}
+        self.values = array("d")
+        self._add_dims()
+
+    def _add_dims(self):
+        for dim in self.dsd.dimensions.components:
+            if dim.id not in self.codes:
+                self.codes[dim.id] = {}
+                # Observations before this dimension was created lack a value
+                self.arrays[dim.id] = array("i", [-1] * len(self.values))
+
+    def is_dimension(self, id):
+        """Return :obj:`True` if `id` is a dimension, rather than an attribute."""
+        if id in self.codes:
+            return True
+        elif id in self.dsd.attributes:
+            return False
+        elif self.extend:
+            # As DataStructureDefinition.make_key(…, extend=True)
+            self.dsd.dimensions.getdefault(id)
+            self._add_dims()
+            return True
+        raise KeyError(id)
+
+    def append(self, key, value):
+        """Append an observation with dimension values `key` and `value`."""
+        for id, codes in self.codes.items():
+            v = key.get(id, None)
+            self.arrays[id].append(-1 if v is None else codes.setdefault(v, len(codes)))
+        self.values.append(np.nan if value is None else float(value))
+
+    def to_pandas(self):
+        """Return a :class:`pandas.Series`, as :func:`.write_dataset` does.
+
+        If there are no observations, the result is an empty Series with an index
+        level for each dimension of the DSD.
+        """
+        dims = [
+            dim.id
+            for dim in sorted(self.dsd.dimensions.components, key=lambda d: d.order)
+        ]
+
+        if len(self.values) == 0:
+            index = None
+            if dims:
+                index = pd.MultiIndex.from_arrays([[]] * len(dims), names=dims)
+            return pd.Series([], index=index, name="value", dtype=np.float64)
+
+        # Index levels in the order of the DSD, omitting unused dimensions
+        dims = [id for id in dims if len(self.codes.get(id, ()))]
+        index = pd.MultiIndex(
+            levels=[list(self.codes[id]) for id in dims],
+            codes=[np.frombuffer(self.arrays[id], dtype=np.intc) for id in dims],
+            names=dims,
+            verify_integrity=False,
+        )
+        result = pd.Series(np.frombuffer(self.values), index=index, name="value")
+
+        # As write_dataset(): the last of any duplicate keys is retained, and the
+        # index is sorted
+        return result[~index.duplicated(keep="last")].sort_index()
+
+
+class _Element:
+    """Minimal stand-in for :class:`lxml.etree._Element`, built by :class:`_Target`.
+
+    Only the parts of the lxml API used by the parsing functions are provided.
+    """
+
+    __slots__ = ("tag", "attrib", "nsmap", "text", "children", "parent")
+
+    def __init__(self, tag, attrib, nsmap, parent):
+        self.tag = tag
+        self.attrib = attrib
+        self.nsmap = nsmap
+        self.text = None
+        self.children = []
+        self.parent = parent
+
+    def __getitem__(self, index):
+        return self.children[index]
+
+    def __iter__(self):
+        return iter(self.children)
+
+    def __len__(self):
+        return len(self.children)
+
+    def __delitem__(self, index):
+        del self.children[index]
+
+    def index(self, child):
+        return self.children.index(child)
+
+    def iterchildren(self):
+        return iter(self.children)
+
+    def getparent(self):
+        return self.parent
+
+    def clear(self):
+        self.attrib = {}
+        self.text = None
+        self.children = []
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.tag} {self.attrib}>"
+
+    def to_etree(self, parent=None):
+        """Return an equivalent :class:`lxml.etree._Element`, including children."""
+        if parent is None:
+            result = etree.Element(self.tag, self.attrib, nsmap=self.nsmap)
+        else:
+            result = etree.SubElement(parent, self.tag, self.attrib, nsmap=self.nsmap)
+        result.text = self.text
+        for child in self.children:
+            child.to_etree(result)
+        return result
+
+
+def _tostring(elem, **kwargs) -> str:
+    """Serialize `elem`, an lxml element or :class:`_Element`, to a string.
+
+    `kwargs` are passed to :func:`lxml.etree.tostring`.
+    """
+    if isinstance(elem, _Element):
+        elem = elem.to_etree()
+    return etree.tostring(elem, **kwargs).decode()
+
+
+class _Target:
+    """lxml parser target that dispatches events as they are parsed.
+
+    lxml builds no tree; instead, each element is a lightweight :class:`_Element`
+    that is cleared after its "end" event is handled.
+    """
+
+    def __init__(self, reader, table):
+        self.reader = reader
+        self.table = table
+        # Element currently open
+        self.element = None
+        # Results to be yielded by Reader._parse()
+        self.results = []
+
+    def start(self, tag, attrib, nsmap):
+        parent = self.element
+        if parent is None:
+            elem = _Element(tag, attrib or {}, nsmap, None)
+        else:
+            elem = _Element(
+                tag, attrib or {}, {**parent.nsmap, **nsmap} if nsmap else parent.nsmap,
+                parent,
+            )
+            parent.children.append(elem)
+        self.element = elem
+        self.reader._handle(self.table, "start", elem, self.results)
+
+    def end(self, tag):
+        elem = self.element
+        self.element = elem.parent
+        self.reader._handle(self.table, "end", elem, self.results)
+
+    def data(self, data):
+        # Text before the first child element
+        elem = self.element
+        if not elem.children:
+            elem.text = data if elem.text is None else elem.text + data
+
+    def close(self):
+        pass
+
+
+#: Values for the `parser` argument to :meth:`Reader.read_message` etc.:
+#: - "iterparse": :func:`lxml.etree.iterparse`, which builds a tree of lxml
+#:   elements, cleared as each is parsed.
+#: - "target": :class:`lxml.etree.XMLParser` with a parser target, which builds
+#:   no tree.
+PARSERS = ("iterparse", "target")
+
+#: Number of bytes fed at once to the "target" parser.
+CHUNK_SIZE = 64 * 1024
+
+
 _NO_AGENCY = model.Agency()
 
 
@@ -216,45 +502,39 @@ class Reader(BaseReader):
     ]
     suffixes = [".xml"]
 
+    #: If :obj:`True`, :class:`.Observation`, :class:`.Key` (and subclasses),
+    #: :class:`.KeyValue`, :class:`.AttributeValue` and :class:`.Code` are created
+    #: without validation, since the values parsed from XML are already of the
+    #: expected types. Set to :obj:`False` to validate every object, e.g. to debug
+    #: a malformed message.
+    trusted = True
+
+    #: If :obj:`True`, each parsed element in :data:`RELEASE` is removed from its
+    #: parent, together with any preceding siblings, so that the memory used by the
+    #: parser does not grow with the number of series and observations. Set to
+    #: :obj:`False` to keep the (cleared) elements in the tree, e.g. to inspect it
+    #: when debugging a parsing function.
+    release = True
+
+    #: Class of the data sets in a data message, if not the subclass of
+    #: :class:`.DataSet` for the message type. See :meth:`read_message`.
+    dataset_class = None
+
     @classmethod
     def detect(cls, content):
         return content.startswith(b"<")
 
-    def read_message(self, source, dsd=None):
-        # Initialize stacks
-        self.stack = defaultdict(list)
-
-        # If calling code provided a DSD, add it to a stack
-        self.ignore = set([id(dsd)])
-
-        # Let it be ignored when parsing is complete
-        self.push(dsd)
+    def read_message(self, source, dsd=None, parser="iterparse", dataset_class=None):
+        """Read a message from `source`.
 
-        try:
-            # Use the etree event-driven parser
-            for event, element in etree.iterparse(source, events=("start", "end")):
-                t = (element.tag, event)
-                if t in PARSE:
-                    # Retrieve the parsing function for this element & event
-                    func = PARSE[t]
-                else:  # pragma: no cover
-                    # Don't know what to do for this (element, event)
-                    log.warning(f"Parsing of  {t} not implemented.")
-                    continue
-
-                if func:  # else: do nothing
-                    # Parse the element
-                    result = func(self, element)
-                    self.push(result)
-
-                    if event == "end":
-                        element.clear()  # Free memory
+        `parser` is one of :data:`PARSERS`. If `dataset_class` is given, e.g.
+        :class:`.experimental.DataSet`, data sets are instances of this class.
+        """
+        self.dataset_class = dataset_class or self.dataset_class
 
-        except Exception as exc:
-            # Parsing failed; display some diagnostic information
-            self._dump()
-            print(etree.tostring(element, pretty_print=True).decode())
-            raise XMLParseError from exc
+        # Parse the entire message. PARSE never yields StreamedObservation
+        for _ in self._parse(source, dsd, PARSE, parser):
+            pass  # pragma: no cover
 
         # Parsing complete
 
@@ -273,6 +553,140 @@ class Reader(BaseReader):
 
         return self.get_single(message.Message)
 
+    def iter_observations(self, source, dsd=None, parser="iterparse"):
+        """Iterate over the observations in `source` without building a Message.
+
+        Observations are yielded as soon as the parser reaches the end of each
+        ``<Obs>`` element, and are not collected in any :class:`.DataSet`. The
+        memory used is thus independent of the number of observations in `source`.
+
+        Parameters
+        ----------
+        source : file-like
+            Data message content.
+        dsd : DataStructureDefinition, optional
+            For “structure-specific” messages.
+        parser : str, optional
+            One of :data:`PARSERS`.
+
+        Yields
+        ------
+        StreamedObservation
+            with the :class:`.SeriesKey` (:obj:`None` for observations not in a
+            series), the :class:`.Key` at the observation level, the value, and a
+            :class:`dict` of :class:`.AttributeValue` attached to the observation.
+            Attributes of the series and its groups are available through
+            :attr:`.SeriesKey.attrib` and :attr:`.SeriesKey.group_attrib`.
+        """
+        yield from self._parse(source, dsd, ChainMap(STREAM, PARSE), parser)
+
+    def read_columns(self, source, dsd=None, parser="iterparse"):
+        """Read a data message in `source` into pandas objects.
+
+        Observations are stored in per-dimension arrays of integer codes and an
+        array of float64 values (see :class:`Columns`), without creating
+        :class:`.Observation`, :class:`.Key` or :class:`.AttributeValue` instances.
+        Attributes are discarded. `parser` is one of :data:`PARSERS`.
+
+        Returns
+        -------
+        :class:`pandas.Series`
+            for a message with a single data set. This is the same as
+            :func:`.to_pandas` returns for the :class:`.DataMessage`, with the
+            default arguments.
+        list of :class:`pandas.Series`
+            if the message has more than one data set.
+
+        Raises
+        ------
+        XMLParseError
+            if `source` is not a data message.
+        """
+        for _ in self._parse(source, dsd, ChainMap(COLUMNAR, PARSE), parser):
+            pass  # pragma: no cover
+
+        result = self.pop_all("Columns")
+        return result[0] if len(result) == 1 else result
+
+    def _parse(self, source, dsd, table, parser="iterparse"):
+        """Parse `source` using the functions in `table`.
+
+        Results of the parsing functions are pushed onto the stacks, except
+        :class:`StreamedObservation`, which are yielded.
+        """
+        if parser not in PARSERS:
+            raise ValueError(f"parser={repr(parser)}; expected one of {PARSERS}")
+
+        # Initialize stacks
+        self.stack = Stacks()
+
+        # If calling code provided a DSD, add it to a stack
+        self.ignore = set([id(dsd)])
+
+        # Let it be ignored when parsing is complete
+        self.push(dsd)
+
+        results = []
+        element = None
+
+        try:
+            if parser == "iterparse":
+                # Use the etree event-driven parser
+                for event, element in etree.iterparse(source, events=("start", "end")):
+                    self._handle(table, event, element, results)
+                    if results:
+                        yield from results
+                        results.clear()
+            else:
+                # Use a parser target; lxml calls its methods while `source` is fed
+                target = _Target(self, table)
+                xml_parser = etree.XMLParser(target=target)
+                for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                    xml_parser.feed(chunk)
+                    if target.results:
+                        yield from target.results
+                        target.results.clear()
+                xml_parser.close()
+
+        except Exception as exc:
+            # Parsing failed; display some diagnostic information
+            self._dump()
+            if parser == "target":
+                element = target.element
+            if element is not None:
+                print(_tostring(element, pretty_print=True))
+            raise XMLParseError from exc
+
+    def _handle(self, table, event, element, results):
+        """Handle one `event` for `element` using the functions in `table`.
+
+        :class:`StreamedObservation` are appended to `results`.
+        """
+        t = (element.tag, event)
+        if t in table:
+            # Retrieve the parsing function for this element & event
+            func = table[t]
+        else:  # pragma: no cover
+            # Don't know what to do for this (element, event)
+            log.warning(f"Parsing of  {t} not implemented.")
+            return
+
+        if func:  # else: do nothing
+            # Parse the element
+            result = func(self, element)
+            if isinstance(result, StreamedObservation):
+                results.append(result)
+            else:
+                self.push(result)
+
+            if event == "end":
+                element.clear()  # Free memory
+
+                if self.release and element.tag in RELEASE:
+                    # Also free the preceding siblings, cleared in the same way
+                    parent = element.getparent()
+                    del parent[: parent.index(element)]
+
     def _clean(self):  # pragma: no cover
         """Remove empty stacks."""
         for key in list(self.stack.keys()):
@@ -299,7 +713,7 @@ class Reader(BaseReader):
                 stack_or_obj
                 if isinstance(stack_or_obj, str)
                 # Element; use its local name
-                else QName(stack_or_obj).localname
+                else QName(stack_or_obj.tag).localname
             )
             self.stack[stack].append(obj)
 
@@ -328,19 +742,14 @@ class Reader(BaseReader):
         checked. If `strict` is True, only the corresponding stack is checked.
         """
         if strict or isinstance(cls_or_name, str):
-            results = self.stack.get(cls_or_name, [])
+            stacks = [self.stack.get(cls_or_name, Stack())]
         else:
-            results = chain(
-                *map(
-                    itemgetter(1),
-                    filter(matching_class0(cls_or_name), self.stack.items()),
-                )
-            )
+            stacks = [self.stack[k] for k in self.stack.matching(cls_or_name)]
 
         if id:
-            results = [obj for obj in results if obj.id == id]
+            results = list(chain(*[stack.with_id(id) for stack in stacks]))
         else:
-            results = list(results)
+            results = list(chain(*stacks))
 
         return None if len(results) != 1 else results[0]
 
@@ -354,9 +763,8 @@ class Reader(BaseReader):
         if strict or isinstance(cls_or_name, str):
             return self.stack.pop(cls_or_name, [])
         else:
-            cond = matching_class(cls_or_name)
             return list(
-                chain(*[self.stack.pop(k) if cond(k) else [] for k in list(self.stack)])
+                chain(*[self.stack.pop(k) for k in list(self.stack.matching(cls_or_name))])
             )
 
     def pop_single(self, cls_or_name):
@@ -423,7 +831,11 @@ class Reader(BaseReader):
         if elem is not None:
             kwargs.setdefault("annotations", [])
             kwargs["annotations"].extend(self.pop_all(model.Annotation))
-        return cls(**kwargs)
+        return self.construct(cls, **kwargs) if cls is model.Code else cls(**kwargs)
+
+    def construct(self, cls, **kwargs):
+        """Create an instance of `cls`; without validation if :attr:`trusted`."""
+        return cls.construct(**kwargs) if self.trusted else cls(**kwargs)
 
     def identifiable(self, cls, elem, **kwargs):
         """Create a IdentifiableArtefact of `cls` from `elem` and `kwargs`."""
@@ -516,7 +928,9 @@ def _message(reader, elem):
         "StructureSpecific" in elem.tag
         and reader.get_single(model.DataStructureDefinition) is None
     ):
-        log.warning(f"sdmxml.Reader got no dsd=… argument for {QName(elem).localname}")
+        log.warning(
+            f"sdmxml.Reader got no dsd=… argument for {QName(elem.tag).localname}"
+        )
         ss_without_dsd = True
     # The following seems to only confuse users.
     # Thus it is commented out post v1.1.0
@@ -527,7 +941,11 @@ def _message(reader, elem):
     # Store values for other methods
     reader.push("SS without DSD", ss_without_dsd)
     if "Data" in elem.tag:
-        reader.push("DataSetClass", model.get_class(f"{QName(elem).localname}Set"))
+        reader.push(
+            "DataSetClass",
+            reader.dataset_class
+            or model.get_class(f"{QName(elem.tag).localname}Set"),
+        )
 
     # Instantiate the message object
     cls = class_for_tag(elem.tag)
@@ -710,7 +1128,7 @@ def _ref(reader, elem):
         # Use the *grand*-parent of the <Ref> or <URN> for a class hint
         cls_hint = class_for_tag(elem.getparent().tag)
 
-    reader.push(QName(elem).localname, Reference(elem, cls_hint))
+    reader.push(QName(elem.tag).localname, Reference(elem, cls_hint))
 
 
 @end("com:Annotation")
@@ -738,14 +1156,8 @@ def _item_start(reader, elem):
     # Avoid stealing the name & description of the parent ItemScheme from the stack
     # TODO check this works for annotations
 
-    try:
-        if elem[0].tag in ("Ref", "URN"):
-            # `elem` is a reference, so it has no name/etc.; don't stash
-            return
-    except IndexError:
-        # No child elements; stash() anyway, but it will be a no-op
-        pass
-
+    # Child elements are not yet available at the "start" event, so stash() even
+    # if `elem` turns out to be a reference; _item() restores the stash in any case
     reader.stash("Name", "Description")
 
 
@@ -753,9 +1165,12 @@ def _item_start(reader, elem):
 def _item(reader, elem):
     try:
         # <str:DataProvider> may be a reference, e.g. in <str:ConstraintAttachment>
-        return Reference(elem)
+        ref = Reference(elem)
     except NotReference:
         pass
+    else:
+        reader.unstash()
+        return ref
 
     cls = class_for_tag(elem.tag)
     item = reader.nameable(cls, elem)
@@ -893,7 +1308,7 @@ def _cl(reader, elem):
     args = dict(components=reader.pop_all(model.Component))
 
     # Determine the class
-    localname = QName(elem).localname
+    localname = QName(elem.tag).localname
     if localname == "Group":
         cls = model.GroupDimensionDescriptor
 
@@ -991,7 +1406,7 @@ def _ms(reader, elem):
     kind = {
         "KeyValue": ("dimensions", model.Dimension),
         "Attribute": ("attributes", model.DataAttribute),
-    }.get(QName(elem).localname)
+    }.get(QName(elem.tag).localname)
 
     try:
         # Navigate from the current ContentConstraint to a
@@ -1123,9 +1538,7 @@ def _dfd(reader, elem):
 
     structure = reader.pop_resolved_ref("Structure")
     if structure is None:
-        log.warning(
-            "Not implemented: forward reference to:\n" + etree.tostring(elem).decode()
-        )
+        log.warning("Not implemented: forward reference to:\n" + _tostring(elem))
         arg = {}
     else:
         arg = dict(structure=structure)
@@ -1144,7 +1557,9 @@ def _avs(reader, elem):
     result = {}
     for e in elem.iterchildren():
         da = ad.getdefault(e.attrib["id"])
-        result[da.id] = model.AttributeValue(value=e.attrib["value"], value_for=da)
+        result[da.id] = reader.construct(
+            model.AttributeValue, value=e.attrib["value"], value_for=da
+        )
 
     reader.push("Attributes", result)
 
@@ -1157,7 +1572,7 @@ def _key(reader, elem):
 
     dsd = reader.get_single("DataSet").structured_by
 
-    return dsd.make_key(cls, kv, extend=True)
+    return dsd.make_key(cls, kv, extend=True, trusted=reader.trusted)
 
 
 @end("gen:Series")
@@ -1174,7 +1589,10 @@ def _series_ss(reader, elem):
     ds.add_obs(
         reader.pop_all(model.Observation),
         ds.structured_by.make_key(
-            model.SeriesKey, elem.attrib, extend=reader.peek("SS without DSD"),
+            model.SeriesKey,
+            elem.attrib,
+            extend=reader.peek("SS without DSD"),
+            trusted=reader.trusted,
         ),
     )
 
@@ -1198,7 +1616,10 @@ def _group_ss(reader, elem):
     group_id = attrib.pop(qname("xsi", "type"), None)
 
     gk = ds.structured_by.make_key(
-        model.GroupKey, attrib, extend=reader.peek("SS without DSD"),
+        model.GroupKey,
+        attrib,
+        extend=reader.peek("SS without DSD"),
+        trusted=reader.trusted,
     )
 
     if group_id:
@@ -1224,13 +1645,17 @@ def _obs(reader, elem):
     args = dict()
 
     for e in elem.iterchildren():
-        localname = QName(e).localname
+        localname = QName(e.tag).localname
         if localname == "Attributes":
             args["attached_attribute"] = reader.pop_single("Attributes")
         elif localname == "ObsDimension":
             # Mutually exclusive with ObsKey
+            # The same value, e.g. a TIME_PERIOD, recurs in many series; share Keys
             args["dimension"] = dsd.make_key(
-                model.Key, {dim_at_obs.id: e.attrib["value"]}
+                model.Key,
+                {dim_at_obs.id: e.attrib["value"]},
+                intern=True,
+                trusted=reader.trusted,
             )
         elif localname == "ObsKey":
             # Mutually exclusive with ObsDimension
@@ -1238,7 +1663,7 @@ def _obs(reader, elem):
         elif localname == "ObsValue":
             args["value"] = e.attrib["value"]
 
-    return model.Observation(**args)
+    return reader.construct(model.Observation, **args)
 
 
 @end(":Obs")
@@ -1254,13 +1679,20 @@ def _obs_ss(reader, elem):
     dsd = reader.get_single(model.DataStructureDefinition)
 
     # Extend the DSD if the user failed to provide it
-    key = dsd.make_key(model.Key, attrib, extend=reader.peek("SS without DSD"))
+    key = dsd.make_key(
+        model.Key,
+        attrib,
+        extend=reader.peek("SS without DSD"),
+        trusted=reader.trusted,
+    )
 
     # Remove attributes from the Key to be attached to the Observation
     aa = key.attrib
     key.attrib = {}
 
-    return model.Observation(dimension=key, value=value, attached_attribute=aa)
+    return reader.construct(
+        model.Observation, dimension=key, value=value, attached_attribute=aa
+    )
 
 
 @start("mes:DataSet", only=False)
@@ -1287,14 +1719,162 @@ def _ds_end(reader, elem):
     # Collect observations not grouped by SeriesKey
     ds.add_obs(reader.pop_all(model.Observation))
 
-    # Create group references
-    for obs in ds.obs:
-        ds._add_group_refs(obs)
+    # Create references to any groups that appeared after the observations. Other
+    # classes, e.g. experimental.DataSet, determine these when needed.
+    if isinstance(ds, model.DataSet):
+        ds._index_groups()
+        for obs in ds.obs:
+            ds._add_group_refs(obs, index=False)
 
     # Add the data set to the message
     reader.get_single(message.Message).data.append(ds)
 
 
+# Parsers used only by Reader.iter_observations(). These yield observations
+# instead of collecting them in the DataSet.
+
+
+@start(":Series", only=False, table=STREAM)
+def _series_ss_stream(reader, elem):
+    ds = reader.get_single("DataSet")
+    sk = ds.structured_by.make_key(
+        model.SeriesKey,
+        elem.attrib,
+        extend=reader.peek("SS without DSD"),
+        trusted=reader.trusted,
+    )
+    ds._add_group_refs(sk)
+    reader.push("SeriesKey", sk)
+
+
+@end(":Series", only=False, table=STREAM)
+def _series_ss_stream_end(reader, elem):
+    reader.pop_single("SeriesKey")
+
+
+@end("gen:SeriesKey", only=False, table=STREAM)
+def _key_stream(reader, elem):
+    sk = _key(reader, elem)
+    reader.get_single("DataSet")._add_group_refs(sk)
+    return sk
+
+
+@end("gen:Attributes", only=False, table=STREAM)
+def _avs_stream(reader, elem):
+    _avs(reader, elem)
+    if elem.getparent().tag == qname("gen:Series"):
+        # Series attributes precede the observations; attach them immediately
+        reader.peek(model.SeriesKey).attrib.update(reader.pop_single("Attributes"))
+
+
+@end("gen:Series", table=STREAM)
+def _series_stream_end(reader, elem):
+    reader.pop_single(model.SeriesKey)
+
+
+@end("gen:Obs", table=STREAM)
+def _obs_stream(reader, elem):
+    obs = _obs(reader, elem)
+    return StreamedObservation(
+        reader.peek(model.SeriesKey),
+        obs.dimension,
+        obs.value,
+        obs.attached_attribute,
+    )
+
+
+@end(":Obs", table=STREAM)
+def _obs_ss_stream(reader, elem):
+    obs = _obs_ss(reader, elem)
+    return StreamedObservation(
+        reader.peek("SeriesKey"), obs.dimension, obs.value, obs.attached_attribute,
+    )
+
+
+@end("mes:DataSet", only=False, table=STREAM)
+def _ds_stream_end(reader, elem):
+    reader.pop_single("DataSet")
+
+
+# Parsers used only by Reader.read_columns().
+
+
+@start("mes:DataSet", only=False, table=COLUMNAR)
+def _ds_columnar_start(reader, elem):
+    _ds_start(reader, elem)
+    ds = reader.peek("DataSet")
+    # Keys in generic messages may extend the DSD, as in _key()
+    extend = reader.peek("SS without DSD") or "Generic" in elem.getparent().tag
+    reader.push("Columns", Columns(ds.structured_by, extend=extend))
+
+
+@end("gen:GroupKey gen:ObsKey gen:SeriesKey", table=COLUMNAR)
+def _key_columnar(reader, elem):
+    columns = reader.peek("Columns")
+    key = {}
+    for e in elem.iterchildren():
+        if columns.is_dimension(e.attrib["id"]):
+            key[e.attrib["id"]] = e.attrib["value"]
+    reader.push(elem, key)
+
+
+@start(":Series", only=False, table=COLUMNAR)
+def _series_columnar_start(reader, elem):
+    columns = reader.peek("Columns")
+    reader.push(
+        "SeriesKey", {k: v for k, v in elem.attrib.items() if columns.is_dimension(k)}
+    )
+
+
+@end("gen:Series", table=COLUMNAR)
+@end(":Series", only=False, table=COLUMNAR)
+def _series_columnar_end(reader, elem):
+    reader.pop_single("SeriesKey")
+
+
+@end(":Obs", table=COLUMNAR)
+def _obs_columnar(reader, elem):
+    columns = reader.peek("Columns")
+    key = dict(reader.peek("SeriesKey") or {})
+    value = None
+    for k, v in elem.attrib.items():
+        if k == "OBS_VALUE":
+            value = v
+        elif columns.is_dimension(k):
+            key[k] = v
+    columns.append(key, value)
+
+
+@end("gen:Obs", table=COLUMNAR)
+def _obs_gen_columnar(reader, elem):
+    key = dict(reader.peek("SeriesKey") or {})
+    # Mutually exclusive with ObsDimension
+    key.update(reader.pop_single("ObsKey") or {})
+    value = None
+    for e in elem.iterchildren():
+        localname = QName(e.tag).localname
+        if localname == "ObsDimension":
+            dim_at_obs = reader.get_single(message.Message).observation_dimension
+            key[dim_at_obs.id] = e.attrib["value"]
+        elif localname == "ObsValue":
+            value = e.attrib["value"]
+    reader.peek("Columns").append(key, value)
+
+
+@end(":Group gen:Attributes gen:Group", table=COLUMNAR)
+def _group_columnar(reader, elem):
+    # Attributes are discarded, thus groups are not needed. Group keys may still
+    # extend the DSD, so that dimensions are in the same order as in read_message()
+    reader.pop_single("GroupKey")
+
+
+@end("mes:DataSet", only=False, table=COLUMNAR)
+def _ds_columnar_end(reader, elem):
+    reader.pop_single("DataSet")
+    # Replace the Columns with the pandas object; collected by read_columns()
+    reader.push("Columns", reader.pop_single("Columns").to_pandas())
+
+
 # §11: Data Provisioning
 
 
@@ -1,6 +1,7 @@
 import logging
 import os
 from io import BufferedIOBase, BytesIO
+from itertools import chain
 from warnings import warn
 
 import requests
@@ -18,6 +19,9 @@ except ImportError:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+#: Size of chunks retrieved from streamed responses, in bytes.
+CHUNK_SIZE = 64 * 1024
+
 
 class Session(MaybeCachedSession):
     """:class:`requests.Session` subclass with optional caching.
@@ -92,23 +96,13 @@ class ResponseIO(BufferedIOBase):
 
     def __init__(self, response, tee=None):
         self.response = response
-        # Open a new file in various scenarios, or assume that tee is an open file
-        if tee is None:
-            tee = BytesIO()
-        elif isinstance(tee, (str, os.PathLike)):
-            tee = open(tee, mode="w+b")
-        # Handle the special case of a fsspec.OpenFile
-        if isinstance(tee, list):
-            assert len(tee) == 1, ValueError(f"Only 1 file allowed, {len(tee)} given.")
-            tee = tee[0]
-        # Now tee must be an open file, including when passed as such
-        #   use tee as instance cache
-        self.tee = tee
+        # Use tee as instance cache
+        self.tee = _open_tee(BytesIO() if tee is None else tee)
 
         # write content, but do not close the file.
-        tee.write(response.content)
-        tee.flush()
-        tee.seek(0)
+        self.tee.write(response.content)
+        self.tee.flush()
+        self.tee.seek(0)
 
     def readable(self):
         return True
@@ -117,5 +111,101 @@ class ResponseIO(BufferedIOBase):
         """Read and return up to `size` bytes by calling ``self.tee.read()``."""
         return self.tee.read(size)
 
+    def seekable(self):
+        return self.tee.seekable()
+
+    def seek(self, offset, whence=0):
+        return self.tee.seek(offset, whence)
+
+    def tell(self):
+        return self.tee.tell()
+
     def close(self):
         self.tee.close()
+
+
+class StreamingResponseIO(ResponseIO):
+    """Unbuffered wrapper for a streamed :class:`requests.Response`.
+
+    Unlike :class:`ResponseIO`, the content of `response` is not retrieved on
+    instantiation. Each call to :meth:`read` pulls only as many chunks from
+    :meth:`requests.Response.iter_content` as needed, so that a reader parses the
+    message while it is downloaded, and data already parsed is not kept in memory.
+    `response` should come from a request sent with ``stream=True``; see
+    :class:`Session`.
+
+    Parameters
+    ----------
+    response : :class:`requests.Response`
+        HTTP response to wrap.
+    tee : optional
+        As for :class:`ResponseIO`. Received data is written to *tee* chunk by
+        chunk. If not given, no copy of the data is kept.
+    chunk_size : int, optional
+        Size of chunks to retrieve from `response`, in bytes.
+    """
+
+    def __init__(self, response, tee=None, chunk_size=CHUNK_SIZE):
+        self.response = response
+        self.tee = None if tee is None else _open_tee(tee)
+        self._chunks = response.iter_content(chunk_size)
+        self._buffer = bytearray()
+
+    # Not seekable, even if tee is
+    seekable = BufferedIOBase.seekable
+    seek = BufferedIOBase.seek
+    tell = BufferedIOBase.tell
+
+    def read(self, size=-1):
+        """Read and return up to `size` bytes from the response.
+
+        With `size` omitted or negative, read all remaining bytes.
+        """
+        buffer = self._buffer
+        if size is None or size < 0:
+            chunks = chain([bytes(buffer)], map(self._received, self._chunks))
+            buffer.clear()
+            result = b"".join(chunks)
+            self._flush()
+            return result
+
+        while len(buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._flush()
+                break
+            buffer += self._received(chunk)
+
+        result = bytes(buffer[:size])
+        del buffer[:size]
+        return result
+
+    def read1(self, size=-1):
+        return self.read(size)
+
+    def _received(self, chunk):
+        """Write `chunk` to :attr:`tee`, if any, and return it."""
+        if self.tee is not None:
+            self.tee.write(chunk)
+        return chunk
+
+    def _flush(self):
+        if self.tee is not None:
+            self.tee.flush()
+
+    def close(self):
+        self.response.close()
+        if self.tee is not None:
+            self.tee.close()
+
+
+def _open_tee(tee):
+    """Return an open binary file for `tee`; see :class:`ResponseIO`."""
+    # Open a new file if given a path, or assume that tee is an open file
+    if isinstance(tee, (str, os.PathLike)):
+        tee = open(tee, mode="w+b")
+    # Handle the special case of a fsspec.OpenFile
+    if isinstance(tee, list):
+        assert len(tee) == 1, ValueError(f"Only 1 file allowed, {len(tee)} given.")
+        tee = tee[0]
+    return tee
@@ -0,0 +1,35 @@
+"""Compare the decoders in :data:`.sdmxjson.DECODERS` on the SDMX-JSON test files.
+
+Run with::
+
+    $ python -m pandasdmx.tests.reader.bench_json [NUMBER]
+
+For each test file and decoder, the best time of NUMBER (default 20) reads with
+:meth:`.sdmxjson.Reader.read_message` is printed, in milliseconds.
+"""
+import sys
+from io import BytesIO
+from timeit import repeat
+
+from pandasdmx.reader import sdmxjson
+from pandasdmx.tests.data import test_files
+
+
+def main(number=20):
+    decoders = list(sdmxjson.DECODERS)
+    print(f"{'file':<24}" + "".join(f"{name:>10}" for name in decoders))
+
+    for path in test_files(format="json")["argvalues"]:
+        data = path.read_bytes()
+        times = []
+        for decoder in decoders:
+
+            def read():
+                sdmxjson.Reader().read_message(BytesIO(data), decoder=decoder)
+
+            times.append(min(repeat(read, number=1, repeat=number)) * 1e3)
+        print(f"{path.name:<24}" + "".join(f"{t:>10.2f}" for t in times))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -1,7 +1,13 @@
+import json
+from io import BytesIO, RawIOBase
+from itertools import chain
+
 import pytest
 
 import pandasdmx
-from pandasdmx.tests.data import specimen, test_files
+from pandasdmx.reader import sdmxjson
+from pandasdmx.tests import assert_pd_equal
+from pandasdmx.tests.data import BASE_PATH, specimen, test_files
 
 
 @pytest.mark.parametrize("path", **test_files(format="json"))
@@ -14,3 +20,166 @@ def test_header():
     with specimen("flat.json") as f:
         resp = pandasdmx.read_sdmx(f)
     assert resp.header.id == "62b5f19d-f1c9-495d-8446-a3661ed24753"
+
+
+def test_series_attributes():
+    msg = pandasdmx.read_sdmx(BASE_PATH / "ECB_EXR" / "ts.json")
+    sk = list(msg.data[0].series.keys())[1]
+    assert sk.attrib.TITLE == "Russian rouble (RUB)"
+
+
+class Unseekable(RawIOBase):
+    """Binary stream that cannot be rewound."""
+
+    def __init__(self, data):
+        self._data = BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self._data.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+
+def _summary(obs):
+    return [
+        (repr(o.series_key), repr(o.dimension), o.value, dict(o.attached_attribute))
+        for o in obs
+    ]
+
+
+FILES = ["action-delete.json", "flat.json", "ts.json", "xs.json"]
+
+
+@pytest.mark.parametrize("filename", FILES)
+def test_stream_columnar(filename):
+    path = BASE_PATH / "ECB_EXR" / filename
+    msg = pandasdmx.read_sdmx(path)
+
+    # The same observations, in the same order
+    streamed = list(pandasdmx.read_sdmx(path, stream=True))
+    assert _summary(streamed) == _summary(o for ds in msg.data for o in ds.obs)
+
+    # The columnar reader gives the same result as to_pandas()
+    expected = pandasdmx.to_pandas(msg)
+    result = pandasdmx.read_sdmx(path, columnar=True)
+    if isinstance(expected, list):
+        assert len(expected) == len(result)
+    else:
+        expected, result = [expected], [result]
+    for e, r in zip(expected, result):
+        assert_pd_equal(e, r)
+
+
+def test_read_columns_empty():
+    # A data set with series, but no observations
+    data = json.loads((BASE_PATH / "ECB_EXR" / "ts.json").read_text())
+    for series in data["dataSets"][0]["series"].values():
+        series["observations"] = {}
+
+    result = pandasdmx.read_sdmx(
+        BytesIO(json.dumps(data).encode()), format="json", columnar=True
+    )
+    assert len(result) == 0 and result.name == "value"
+    assert list(result.index.names) == [
+        dim["id"] for dim in chain(*data["structure"]["dimensions"].values())
+    ]
+
+
+@pytest.mark.parametrize("filename", FILES)
+def test_structure_last(monkeypatch, filename):
+    path = BASE_PATH / "ECB_EXR" / filename
+    expected = _summary(pandasdmx.read_sdmx(path).data[0].obs)
+
+    # As returned by e.g. OECD: "dataSets" precedes "structure"; compact
+    tree = json.loads(path.read_bytes())
+    data = json.dumps(
+        {key: tree[key] for key in ("dataSets", "header", "structure")},
+        separators=(",", ":"),
+    ).encode()
+
+    # Read in very small chunks, so that tokens are split across chunks
+    monkeypatch.setattr(sdmxjson, "CHUNK_SIZE", 7)
+
+    for source in (BytesIO(data), Unseekable(data)):
+        msg = sdmxjson.Reader().read_message(source)
+        assert expected == _summary(msg.data[0].obs)
+
+
+@pytest.mark.parametrize("filename", FILES)
+def test_decoder(monkeypatch, filename):
+    path = BASE_PATH / "ECB_EXR" / filename
+    msg = pandasdmx.read_sdmx(path)
+    expected = [_summary(ds.obs) for ds in msg.data]
+
+    # A decoder for the entire document, registered by name
+    monkeypatch.setitem(sdmxjson.DECODERS, "stdlib", json.loads)
+
+    for decoder in set(sdmxjson.DECODERS) - {"json"}:
+        # Selected per call
+        result = pandasdmx.read_sdmx(path, decoder=decoder)
+        assert expected == [_summary(ds.obs) for ds in result.data]
+
+        streamed = list(pandasdmx.read_sdmx(path, stream=True, decoder=decoder))
+        assert _summary(streamed) == sum(expected, [])
+
+    # Selected process-wide
+    monkeypatch.setattr(sdmxjson.Reader, "decoder", "stdlib")
+    result = sdmxjson.Reader().read_message(Unseekable(path.read_bytes()))
+    assert expected == [_summary(ds.obs) for ds in result.data]
+
+
+def test_decoder_invalid(monkeypatch):
+    path = BASE_PATH / "ECB_EXR" / "flat.json"
+
+    with pytest.raises(ValueError, match="decoder='foo'"):
+        pandasdmx.read_sdmx(path, decoder="foo")
+
+    # An optional decoder that is not installed falls back to "json"
+    monkeypatch.delitem(sdmxjson.DECODERS, "ujson", raising=False)
+    with pytest.warns(RuntimeWarning, match="ujson is not installed"):
+        msg = pandasdmx.read_sdmx(path, decoder="ujson")
+    assert len(msg.data[0].obs)
+
+
+def test_json_stream():
+    data = '{"a": [1, 2.5e3, "x\\\\\\"y", null], "b\\u00e9": {"c": {}}, "d": true}'
+    stream = sdmxjson.JSONStream(BytesIO(data.encode()))
+
+    result = []
+    for key in stream.items():
+        result.append(key)
+        if key == "a":
+            for i in stream.elements():
+                result.append(stream.value())
+        else:
+            stream.skip()
+
+    assert ["a", 1, 2500.0, 'x\\"y', None, "bé", "d"] == result
+
+    # Invalid JSON raises an exception
+    stream = sdmxjson.JSONStream(BytesIO(b'{"a": [1, 2}'))
+    with pytest.raises(json.JSONDecodeError):
+        for key in stream.items():
+            stream.skip()
+
+
+def test_decode_keys():
+    reader = sdmxjson.Reader()
+    with specimen("ts.json") as f:
+        reader.read_message(f)
+
+    # ts.json has 1 series-level dimension
+    result = reader._decode_keys("series", ["1", "0"])
+    assert (2, 1) == result.shape
+    assert [1, 0] == list(result[:, 0])
+
+    # …and 4 at the data set level
+    result = reader._decode_keys("dataSet", ["0:0:0:0", "0:1:2:3"])
+    assert [[0, 0, 0, 0], [0, 1, 2, 3]] == result.tolist()
+
+    # Keys with the wrong number of indices
+    with pytest.raises(ValueError):
+        reader._decode_keys("dataSet", ["0:0:0", "0:0"])
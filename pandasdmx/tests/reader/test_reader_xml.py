@@ -2,14 +2,18 @@ import re
 from io import BytesIO
 from itertools import chain
 
+import pandas as pd
 import pytest
 from lxml import etree
 
 import pandasdmx
+from pandasdmx import model
 from pandasdmx.format.xml import qname
+from pandasdmx.reader import sdmxml
 from pandasdmx.model import Facet, FacetType, FacetValueType
-from pandasdmx.reader.sdmxml import Reader, XMLParseError
-from pandasdmx.tests.data import specimen, test_files
+from pandasdmx.reader.sdmxml import PARSERS, Reader, Stacks, XMLParseError
+from pandasdmx.tests import assert_pd_equal
+from pandasdmx.tests.data import BASE_PATH, specimen, test_files
 
 
 # Read example data files
@@ -76,6 +80,201 @@ def test_read_ss_xml():
     assert len(TIME_FORMAT.related_to.dimensions) == 5
 
 
+@pytest.mark.parametrize(
+    "filename, ss",
+    [
+        ("ng-flat.xml", False),
+        ("ng-ts-gf.xml", False),
+        ("ng-xs.xml", False),
+        ("ng-flat-ss.xml", True),
+        ("ng-ts-gf-ss.xml", True),
+    ],
+)
+def test_iter_observations(filename, ss):
+    base = BASE_PATH / "ECB_EXR"
+    dsd = pandasdmx.read_sdmx(base / "ng-structure-full.xml").structure[0]
+    dsd = dsd if ss else None
+
+    msg = pandasdmx.read_sdmx(base / filename, dsd=dsd)
+    streamed = list(pandasdmx.read_sdmx(base / filename, dsd=dsd, stream=True))
+
+    # Same observations, in the same order
+    assert len(streamed) == len(msg.data[0].obs)
+    for s, o in zip(streamed, msg.data[0].obs):
+        assert s.dimension == o.dimension and s.value == o.value
+        assert s.attached_attribute.compare(o.attached_attribute)
+        if o.series_key is None:
+            assert s.series_key is None
+        else:
+            assert s.series_key == o.series_key
+            assert s.series_key.attrib.compare(o.series_key.attrib)
+            assert set(s.series_key.group_attrib) == set(o.series_key.group_attrib)
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "ECB_EXR/ng-flat.xml",
+        "ECB_EXR/ng-ts-gf.xml",
+        "ECB_EXR/ng-structure-full.xml",
+        "INSEE/CNA-2010-CONSO-SI-A17.xml",
+        "INSEE/IPI-2010-A21-structure.xml",
+        "INSEE/dataflow.xml",
+    ],
+)
+def test_parser_target(filename):
+    # The parser target gives the same result as iterparse
+    expected = pandasdmx.read_sdmx(BASE_PATH / filename)
+    result = pandasdmx.read_sdmx(BASE_PATH / filename, parser="target")
+
+    assert repr(expected) == repr(result)
+    if isinstance(expected, pandasdmx.message.DataMessage):
+        assert_pd_equal(pandasdmx.to_pandas(expected), pandasdmx.to_pandas(result))
+    else:
+        for name in ("codelist", "concept_scheme", "dataflow", "structure"):
+            for id, obj in getattr(expected, name).items():
+                other = getattr(result, name)[id]
+                assert str(obj.name) == str(other.name)
+                assert len(getattr(obj, "items", ())) == len(
+                    getattr(other, "items", ())
+                )
+
+    with pytest.raises(ValueError, match="parser='foo'"):
+        pandasdmx.read_sdmx(BASE_PATH / filename, parser="foo")
+
+
+@pytest.mark.parametrize(
+    "filename, dsd_filename",
+    [
+        ("ECB_EXR/ng-ts.xml", None),
+        ("ECB_EXR/rg-ts.xml", None),
+        ("ECB_EXR/ng-ts-gf-ss.xml", "ECB_EXR/ng-structure-full.xml"),
+        ("ECB_EXR/sg-ts-ss.xml", "ECB_EXR/sg-structure.xml"),
+        ("INSEE/IPI-2010-A21-structure.xml", None),
+    ],
+)
+def test_trusted(monkeypatch, filename, dsd_filename):
+    # Objects created without validation are the same as validated ones
+    kw = dict()
+    if dsd_filename:
+        kw["dsd"] = pandasdmx.read_sdmx(BASE_PATH / dsd_filename).structure[0]
+
+    expected = pandasdmx.read_sdmx(BASE_PATH / filename, **kw)
+    monkeypatch.setattr(Reader, "trusted", False)
+    result = pandasdmx.read_sdmx(BASE_PATH / filename, **kw)
+
+    if isinstance(expected, pandasdmx.message.DataMessage):
+        for e, r in zip(expected.data[0].obs, result.data[0].obs):
+            assert e.compare(r) and repr(e) == repr(r)
+            for kv_e, kv_r in zip(e.key, r.key):
+                assert type(kv_e.value_for) is type(kv_r.value_for)
+                assert kv_e.value_for.id == kv_r.value_for.id
+        assert_pd_equal(
+            pandasdmx.to_pandas(expected, attributes="osgd"),
+            pandasdmx.to_pandas(result, attributes="osgd"),
+        )
+    else:
+        for id, cl in expected.codelist.items():
+            assert cl.compare(result.codelist[id])
+            for code in cl:
+                other = result.codelist[id][code.id]
+                assert repr(code) == repr(other) and code.urn_group == other.urn_group
+
+
+def test_reader_stacks():
+    reader = Reader()
+    reader.stack = Stacks()
+
+    # Objects of a class and its subclasses are retrieved together
+    reader.push(model.Dimension(id="FOO"))
+    assert reader.get_single(model.DimensionComponent, "FOO").id == "FOO"
+    reader.push(model.TimeDimension(id="BAR"))
+    assert reader.get_single(model.DimensionComponent, "BAR").id == "BAR"
+    assert reader.get_single(model.DimensionComponent) is None
+    assert reader.get_single(model.Dimension, "BAR") is None
+
+    # The index by ID is updated as objects are popped
+    reader.push(model.Dimension(id="FOO"))
+    assert reader.get_single(model.Dimension, "FOO") is None
+    reader.pop_single(model.Dimension)
+    assert reader.get_single(model.Dimension, "FOO").id == "FOO"
+
+    # Keys for subclasses are updated as stacks are removed and created
+    assert len(reader.pop_all(model.DimensionComponent)) == 2
+    assert reader.get_single(model.DimensionComponent, "FOO") is None
+    reader.push(model.MeasureDimension(id="BAZ"))
+    assert reader.get_single(model.DimensionComponent, "BAZ").id == "BAZ"
+    assert reader.pop_all(model.Component)[0].id == "BAZ"
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+@pytest.mark.parametrize(
+    "filename", ["ng-flat.xml", "ng-ts.xml", "ng-xs.xml", "rg-ts-gf.xml", "sg-ts.xml"]
+)
+def test_read_columns_generic(filename, parser):
+    # Generic messages, without a DSD, are read into the same pandas objects as
+    # to_pandas() returns
+    with specimen(filename) as f:
+        expected = pandasdmx.to_pandas(pandasdmx.read_sdmx(f))
+    with specimen(filename) as f:
+        result = pandasdmx.read_sdmx(f, columnar=True, parser=parser)
+    assert_pd_equal(expected, result)
+
+
+def test_read_columns_empty():
+    base = BASE_PATH / "ECB_EXR"
+    dsd = pandasdmx.read_sdmx(base / "ng-structure-full.xml").structure[0]
+
+    # A data set without observations
+    text = (base / "ng-flat-ss.xml").read_text()
+    start = text.index("<Obs")
+    end = text.index("</message:DataSet>")
+    source = BytesIO((text[:start] + text[end:]).encode())
+
+    result = pandasdmx.read_sdmx(source, dsd=dsd, columnar=True)
+    assert isinstance(result, pd.Series) and len(result) == 0
+    assert list(result.index.names) == [dim.id for dim in dsd.dimensions]
+
+
+@pytest.mark.parametrize("release", [True, False])
+@pytest.mark.parametrize("parser", PARSERS)
+def test_release(monkeypatch, parser, release):
+    path = BASE_PATH / "ECB_EXR" / "ng-ts.xml"
+    n_series = len(re.findall("<generic:Series>", path.read_text()))
+    assert n_series > 1
+
+    # Record the number of children of <mes:DataSet> when it is parsed
+    sizes = []
+    ds_end = sdmxml.PARSE[qname("mes:DataSet"), "end"]
+
+    def record(reader, elem):
+        sizes.append(len(elem))
+        return ds_end(reader, elem)
+
+    monkeypatch.setitem(sdmxml.PARSE, (qname("mes:DataSet"), "end"), record)
+    monkeypatch.setattr(Reader, "release", release)
+
+    msg = pandasdmx.read_sdmx(path, parser=parser)
+    assert len(msg.data[0].series) == n_series
+
+    # Only the last <Series> remains, unless release is disabled
+    assert sizes == [1 if release else n_series]
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+def test_dfd_forward_reference(caplog, parser):
+    # A dataflow without a resolved <str:Structure>. The warning shows the same
+    # XML with either parser.
+    elem = E(qname("str:Dataflow"), id="EXR", agencyID="ECB", version="1.0")
+    expected = etree.tostring(elem).decode()
+
+    reader = Reader()
+    reader.read_message(BytesIO(etree.tostring(elem)), parser=parser)
+
+    assert reader.pop_single(model.DataflowDefinition).id == "EXR"
+    assert "Not implemented: forward reference to:\n" + expected in caplog.messages
+
+
 E = etree.Element
 
 # Each entry is a tuple with 2 elements:
@@ -1,12 +1,21 @@
+import asyncio
 import json
 import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from io import BytesIO
 
 import pandas as pd
 import pytest
+import requests_mock
 
 import pandasdmx
+from pandasdmx.util import MessageCache
 
+from . import assert_pd_equal
 from .data import specimen
 
 
@@ -50,14 +59,24 @@ def test_request():
     # Regular methods
     r.clear_cache()
 
+    # Each instance has its own cache, unless one is given
+    assert isinstance(r.cache, MessageCache)
+    assert r.cache is not pandasdmx.Request().cache
+    cache = dict()
+    assert pandasdmx.Request(cache=cache).cache is cache
+
     r.timeout = 300
     assert r.timeout == 300
 
     # dir() includes convenience methods for resource endpoints
     expected = {
+        "aget",
         "cache",
         "clear_cache",
+        "close",
+        "data_partitioned",
         "get",
+        "max_concurrent",
         "preview_data",
         "series_keys",
         "session",
@@ -69,6 +88,265 @@ def test_request():
     assert set(filter(lambda s: not s.startswith("_"), dir(r))) == expected
 
 
+@pytest.fixture
+def latent_server():
+    """Local HTTP server that responds to any GET request after a delay.
+
+    The server's :attr:`peak` attribute is the most requests handled at once.
+    """
+    with specimen("ECB_EXR/ng-ts.xml", opened=False) as path:
+        content = path.read_bytes()
+
+    class Server(ThreadingHTTPServer):
+        active = peak = 0
+        lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            server = self.server
+            with server.lock:
+                server.active += 1
+                server.peak = max(server.peak, server.active)
+
+            # Inject latency, as from a remote web service
+            time.sleep(0.2)
+
+            with server.lock:
+                server.active -= 1
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/vnd.sdmx.genericdata+xml")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = Server(("127.0.0.1", 0), Handler)
+    server.url = "http://127.0.0.1:{}/data/{{}}".format(server.server_port)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor])
+def test_request_aget(latent_server, executor):
+    url = latent_server.url
+    N = 8
+
+    req = pandasdmx.Request(max_concurrent=4)
+    assert req.max_concurrent == 4
+
+    expected = [req.get(url=url.format(i)) for i in range(N)]
+    assert latent_server.peak == 1
+
+    async def main(pool):
+        return await asyncio.gather(
+            *[req.aget(url=url.format(i), executor=pool) for i in range(N)]
+        )
+
+    with req:
+        if executor:
+            with executor() as pool:
+                result = asyncio.run(main(pool))
+        else:
+            result = asyncio.run(main(None))
+
+    # Queries are concurrent, at most 4 at once
+    assert 1 < latent_server.peak <= 4
+
+    # Threads are shut down on exit from the with-context
+    assert req._executor is None
+
+    # Same messages, in order
+    for msg, exp in zip(result, expected):
+        assert msg.response.url == exp.response.url
+        assert_pd_equal(
+            pandasdmx.to_pandas(msg.data[0]), pandasdmx.to_pandas(exp.data[0])
+        )
+
+    # dry_run= is handled as by get()
+    result = asyncio.run(req.aget(url=url.format(0), dry_run=True))
+    assert result.url == url.format(0)
+
+
+def test_request_get_split():
+    with specimen("ECB_EXR/ng-structure-full.xml") as f:
+        dsd = pandasdmx.read_sdmx(f).structure["ECB_EXR_NG"]
+    with specimen("ECB_EXR/ng-ts.xml", opened=False) as path:
+        content = path.read_bytes()
+
+    req = pandasdmx.Request("ECB")
+    args = dict(key={"CURRENCY": ["CHF", "GBP", "JPY", "USD"], "FREQ": "M"}, dsd=dsd)
+
+    # Query is split by number of series
+    urls = req.data("EXR", dry_run=True, max_series=3, **args)
+    assert [r.url.split("/")[-1] for r in urls] == ["M.CHF+GBP...", "M.JPY+USD..."]
+
+    # …or by length of the URL
+    url = req.data("EXR", dry_run=True, **args).url
+    urls = req.data("EXR", dry_run=True, max_url_length=len(url) - 8, **args)
+    assert [r.url.split("/")[-1] for r in urls] == ["M.CHF+GBP...", "M.JPY+USD..."]
+
+    # Not split if within the limits
+    assert req.data("EXR", dry_run=True, max_series=4, **args).url == url
+
+    # aget() also splits queries
+    urls = asyncio.run(req.aget("data", "EXR", dry_run=True, max_series=3, **args))
+    assert len(urls) == 2
+
+    # Impossible to satisfy
+    with pytest.raises(ValueError, match="cannot split"):
+        req.data("EXR", dry_run=True, max_url_length=len(url) - 20, **args)
+
+    headers = {"Content-Type": "application/vnd.sdmx.genericdata+xml; version=2.1"}
+    with requests_mock.Mocker() as m:
+        # Each part of the query returns the same, complete message
+        m.get(requests_mock.ANY, content=content, headers=headers)
+        msg = req.data("EXR", max_series=1, **args)
+
+        assert m.call_count == 4
+
+        with pytest.raises(ValueError, match="cannot write 4 split queries"):
+            req.data("EXR", max_series=1, tofile=BytesIO(), **args)
+
+    # Messages are merged without duplicate series or observations
+    ds = msg.data[0]
+    assert len(ds.series) == 4
+    assert len(ds.obs) == 12
+    assert all(len(obs) == 3 for obs in ds.series.values())
+    with specimen("ECB_EXR/ng-ts.xml") as f:
+        expected = pandasdmx.read_sdmx(f)
+    assert_pd_equal(pandasdmx.to_pandas(ds), pandasdmx.to_pandas(expected.data[0]))
+
+    # Worker threads use copies of the session with their own connection pools
+    session = pandasdmx.api._copy_session(req.session)
+    assert session.timeout == req.session.timeout
+    assert session.adapters["https://"] is not req.session.adapters["https://"]
+
+
+def _groups(ds):
+    """Return the group membership and attributes of the observations of `ds`."""
+    groups = {gk: (gk.id, str(gk)) for gk in ds.group}
+    members = {
+        groups[gk]: sorted(str(obs.key) for obs in observations)
+        for gk, observations in ds.group.items()
+    }
+    attrs = []
+    for obs in ds.obs:
+        # Observations refer to the group keys of the data set itself
+        assert all(any(gk is g for g in groups) for gk in obs.group_keys)
+        attrs.append(
+            (str(obs.key), sorted((id, str(av.value)) for id, av in obs.attrib.items()))
+        )
+    return members, sorted(attrs)
+
+
+def test_merge_groups():
+    with specimen("ECB_EXR/rg-ts.xml", opened=False) as path:
+        content = path.read_text()
+        expected = pandasdmx.read_sdmx(path)
+
+    # Messages with the first series, and the others
+    pattern = re.compile("<generic:Series>.*?</generic:Series>", flags=re.S)
+    series = pattern.findall(content)
+    messages = []
+    for keep in series[:1], series[1:]:
+        text = pattern.sub(lambda m: m.group(0) if m.group(0) in keep else "", content)
+        messages.append(pandasdmx.read_sdmx(BytesIO(text.encode())))
+
+    ds = pandasdmx.api._merge(messages).data[0]
+
+    # Same group membership and attributes as the complete message
+    assert [len(obs) for obs in ds.group.values()] == [12, 3, 3, 3, 3]
+    assert _groups(ds) == _groups(expected.data[0])
+
+
+def test_request_data_partitioned():
+    with specimen("ECB_EXR/ng-ts.xml", opened=False) as path:
+        content = path.read_text()
+
+    def window(request, context):
+        # Return only the observations between startPeriod and endPeriod
+        start, end = (request.qs[p][0][:7] for p in ("startperiod", "endperiod"))
+
+        def obs(match):
+            period = re.search('ObsDimension value="([^"]+)"', match.group(0))[1]
+            return match.group(0) if start <= period <= end else ""
+
+        return re.sub("<generic:Obs>.*?</generic:Obs>", obs, content, flags=re.S)
+
+    req = pandasdmx.Request("ECB")
+    args = dict(key="M..EUR.SP00.E", start="2010-08", end="2010-10", step="M")
+
+    # One query per window
+    urls = [r.url for r in req.data_partitioned("EXR", dry_run=True, **args)]
+    assert urls[0].endswith("?startPeriod=2010-08-01&endPeriod=2010-08-31")
+    assert urls[-1].endswith("?startPeriod=2010-10-01&endPeriod=2010-10-31")
+    assert len(urls) == 3
+
+    headers = {"Content-Type": "application/vnd.sdmx.genericdata+xml; version=2.1"}
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, text=window, headers=headers)
+        msg = req.data_partitioned("EXR", workers=2, use_cache=True, **args)
+        assert m.call_count == 3
+
+        # Merged message is cached
+        assert req.data_partitioned("EXR", use_cache=True, **args) is msg
+        assert m.call_count == 3
+        assert req.cache.stats["hits"] == 1
+
+    # Series contain the observations from every window, in order
+    ds = msg.data[0]
+    assert len(ds.series) == 4
+    for observations in ds.series.values():
+        periods = [obs.dimension.get_values()[0] for obs in observations]
+        assert periods == ["2010-08", "2010-09", "2010-10"]
+
+    with specimen("ECB_EXR/ng-ts.xml") as f:
+        expected = pandasdmx.read_sdmx(f)
+    assert_pd_equal(pandasdmx.to_pandas(ds), pandasdmx.to_pandas(expected.data[0]))
+
+    # Windows without data are skipped
+    def no_data(request, context):
+        if request.qs["startperiod"][0] < "2010-08":
+            context.status_code = 404
+            return ""
+        return window(request, context)
+
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, text=no_data, headers=headers)
+        msg = req.data_partitioned("EXR", **dict(args, start="2010-06"))
+        assert m.call_count == 5
+    assert len(msg.data[0].obs) == 12
+
+    with pytest.raises(ValueError, match="step must be"):
+        req.data_partitioned("EXR", **dict(args, step="5X"))
+
+    with pytest.raises(ValueError, match="start and end are required"):
+        req.data_partitioned("EXR", key="M..EUR.SP00.E", dry_run=True)
+
+    with pytest.raises(ValueError, match="is after end"):
+        req.data_partitioned("EXR", **dict(args, start="2011"))
+
+    # Group membership and attributes are as in a single, unpartitioned response;
+    # window() serves parts of the new `content`
+    with specimen("ECB_EXR/rg-ts.xml", opened=False) as path:
+        content = path.read_text()
+        expected = pandasdmx.read_sdmx(path)
+
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, text=window, headers=headers)
+        msg = req.data_partitioned("EXR", **args)
+        assert m.call_count == 3
+
+    assert [len(obs) for obs in msg.data[0].group.values()] == [12, 3, 3, 3, 3]
+    assert _groups(msg.data[0]) == _groups(expected.data[0])
+
+
 def test_request_get_exceptions():
     """Tests of Request.get() that don't require remote data."""
     req = pandasdmx.Request("ESTAT")
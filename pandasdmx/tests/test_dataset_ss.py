@@ -7,7 +7,7 @@ import pandasdmx
 from pandasdmx import message, model
 from pandasdmx.model import Key
 
-from . import MessageTest
+from . import MessageTest, assert_pd_equal
 
 
 class StructuredMessageTest(MessageTest):
@@ -34,6 +34,11 @@ class StructuredMessageTest(MessageTest):
         # The DSD was used to parse the message
         assert msg.data[0].structured_by is dsd
 
+    def test_read_columns(self, dsd, msg):
+        # The columnar reader gives the same result as to_pandas()
+        result = pandasdmx.read_sdmx(self.path / self.filename, dsd=dsd, columnar=True)
+        assert_pd_equal(pandasdmx.to_pandas(msg), result)
+
 
 class TestFlatDataSet(StructuredMessageTest):
     filename = "ng-flat-ss.xml"
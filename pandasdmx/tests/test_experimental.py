@@ -2,18 +2,20 @@
 
 See pandasdmx.experimental for more information.
 """
+import numpy as np
+import pandas as pd
 import pytest
 
+import pandasdmx
 from pandasdmx.experimental import DataSet as PandasDataSet
 from pandasdmx.model import AttributeValue, DataAttribute, DataSet, Key, Observation
+from pandasdmx.tests import assert_pd_equal
+from pandasdmx.tests.data import BASE_PATH
 
 
 # Run the tests on both the standard DataSet class, and the experimental,
 # PandasDataSet version
-@pytest.mark.parametrize(
-    "DataSetType",
-    [DataSet, pytest.param(PandasDataSet, marks=pytest.mark.experimental)],
-)
+@pytest.mark.parametrize("DataSetType", [DataSet, PandasDataSet])
 def test_add_obs(DataSetType):
     # Create a Key and Attributes
     key = Key(CURRENCY="NZD", CURRENCY_DENOM="EUR", TIME_PERIOD="2018-01-01")
@@ -29,5 +31,94 @@ def test_add_obs(DataSetType):
     ds.add_obs(obs)
 
     # PandasDataSet does not store Observation objects internally, but should
-    # emit them when the .obs property is accessed
+    # emit them when the .obs property is accessed, in the order they were added
     assert all(a == b for a, b in zip(ds.obs, obs))
+
+    # …also if this differs from the order of their keys
+    ds = DataSetType()
+    ds.add_obs(obs[::-1])
+    assert [o.value for o in ds.obs] == [7, 6, 5]
+
+
+def test_empty():
+    ds = PandasDataSet()
+    assert ds.obs == [] and len(ds.series) == 0
+
+    # As model.DataSet
+    assert_pd_equal(pandasdmx.to_pandas(DataSet()), pandasdmx.to_pandas(ds))
+
+    result = ds.to_pandas()
+    assert isinstance(result, pd.Series) and len(result) == 0
+
+
+@pytest.mark.parametrize(
+    "filename", ["sg-ts.xml", "sg-ts-gf.xml", "sg-xs.xml", "ng-flat-ss.xml", "ts.json"]
+)
+def test_read(filename):
+    path = BASE_PATH / "ECB_EXR" / filename
+    expected = pandasdmx.read_sdmx(path)
+    msg = pandasdmx.read_sdmx(path, dataset_class=PandasDataSet)
+
+    ds = msg.data[0]
+    assert isinstance(ds, PandasDataSet)
+
+    # Same number of observations, series and groups, and of observations in each
+    exp_ds = expected.data[0]
+    assert len(exp_ds.obs) == len(ds.obs)
+    for attr in "series", "group":
+        assert [len(obs) for obs in getattr(exp_ds, attr).values()] == [
+            len(obs) for obs in getattr(ds, attr).values()
+        ]
+
+    # Observations are in the same order, overall and in each series
+    assert [o.key for o in exp_ds.obs] == [o.key for o in ds.obs]
+    for exp_obs, obs in zip(exp_ds.series.values(), ds.series.values()):
+        assert [o.key for o in exp_obs] == [o.key for o in obs]
+
+    # Positions of the observations in each series are computed once
+    cache = ds._positions_cache
+    for sk in ds.series:
+        ds.series[sk]
+    assert ds._positions_cache is cache
+
+    # Series attributes are available through the observations
+    if len(exp_ds.series):
+        assert [sorted(o.attrib) for o in exp_ds.series[0]] == [
+            sorted(o.attrib) for o in ds.series[0]
+        ]
+
+    # Same result from to_pandas(), without copying if keys are unique
+    result = pandasdmx.to_pandas(msg)
+    assert_pd_equal(pandasdmx.to_pandas(expected), result)
+    if ds._data.index.is_unique:
+        assert np.shares_memory(result.values, ds._data["value"].values)
+
+    # Other arguments
+    assert_pd_equal(
+        pandasdmx.to_pandas(expected, attributes="os"),
+        pandasdmx.to_pandas(msg, attributes="os"),
+    )
+
+
+def test_delete():
+    msg = pandasdmx.read_sdmx(
+        BASE_PATH / "ECB_EXR" / "sg-ts-gf.xml", dataset_class=PandasDataSet
+    )
+    ds = msg.data[0]
+    n_obs, n_series, n_groups = len(ds.obs), len(ds.series), len(ds.group)
+    sk, last = ds._series_keys[0], ds._series_keys[-1]
+    n = len(ds.series[sk])
+    expected = [o.value for o in ds.series[last]]
+
+    # Deleting a series key removes its observations
+    del ds.series[sk]
+    assert sk not in ds.series
+    assert (len(ds.obs), len(ds.series)) == (n_obs - n, n_series - 1)
+    assert all(o.series_key is not sk for o in ds.obs)
+    assert [o.value for o in ds.series[last]] == expected
+    assert all(o.series_key is last for o in ds.series[last])
+
+    # Deleting a group key retains its observations
+    del ds.group[0]
+    assert (len(ds.obs), len(ds.group)) == (n_obs - n, n_groups - 1)
+    assert all(len(obs) for obs in ds.group.values())
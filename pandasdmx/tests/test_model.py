@@ -35,6 +35,51 @@ def test_contentconstraint():
     cr.data_content_region = CubeRegion(included=True, member={})
 
 
+def test_cuberegion_split():
+    dsd = DataStructureDefinition()
+    for id in "ABC":
+        dsd.dimensions.getdefault(id)
+    key = {"A": [f"a{i}" for i in range(10)], "B": "b1+b2+b3"}
+    cr = dsd.make_constraint(key).data_content_region[0]
+
+    def split(**kwargs):
+        return [r.to_query_string(dsd) for r in cr.split(dsd, **kwargs)]
+
+    # Within limits: not split
+    assert cr.split(dsd, max_keys=30) == [cr]
+
+    # Largest selection is split in as many parts as needed
+    assert split(max_keys=7) == [
+        f"a{i}+a{i + 1}.b1+b2+b3." for i in range(0, 10, 2)
+    ]
+
+    # Longest selection is halved until each query string is short enough
+    assert all(len(s) <= 20 for s in split(max_length=20))
+    assert split(max_length=20)[0] == "a0+a1.b1+b2+b3."
+
+    # Together, the regions include the same keys
+    result = split(max_keys=2)
+    assert len(result) == 20
+    n_keys = []
+    for s in result:
+        a, b, _ = s.split(".")
+        n_keys.append(len(a.split("+")) * len(b.split("+")))
+    assert max(n_keys) <= 2 and sum(n_keys) == 30
+
+    with pytest.raises(ValueError, match="cannot split 'a0.b1.'"):
+        cr.split(dsd, max_keys=0)
+
+    # A single long value does not prevent splitting other selections
+    key = {"A": "a1+a2+a3+a4", "C": "c" * 20}
+    cr = dsd.make_constraint(key).data_content_region[0]
+    assert split(max_length=30) == [f"a1+a2..{'c' * 20}", f"a3+a4..{'c' * 20}"]
+
+    # Excluded regions cannot be split
+    cr.included = False
+    with pytest.raises(ValueError, match="excluded"):
+        split(max_keys=1)
+
+
 def test_dataset():
     # Enumeration values can be used to initialize
     from pandasdmx.model import ActionType
@@ -43,6 +88,40 @@ def test_dataset():
     DataSet(action=ActionType["information"])
 
 
+def test_dataset_group_refs():
+    ds = DataSet()
+    gk1 = GroupKey(foo=1)
+    ds.group[gk1] = []
+    sk = model.SeriesKey(foo=1, bar=2)
+    obs = [Observation(dimension=Key(baz=i)) for i in range(3)]
+
+    ds.add_obs(obs, sk)
+
+    # SeriesKey and observations are associated with the group
+    assert sk.group_keys == {gk1}
+    assert all(o.group_keys == {gk1} for o in obs)
+
+    # Groups added later are also associated; each observation appears once
+    gk2 = GroupKey(bar=2, baz=1)
+    ds.group[gk2] = []
+    ds.group[GroupKey(foo=2)] = []
+    for o in ds.obs:
+        ds._add_group_refs(o)
+
+    assert len(ds.group[gk1]) == 3
+    assert ds.group[gk2] == [obs[1]]
+    assert obs[1].group_keys == {gk1, gk2}
+
+    # A group key replaced by another, without changing the number of keys
+    del ds.group[gk2]
+    gk3 = GroupKey(bar=2, baz=2)
+    ds.group[gk3] = []
+    ds.add_obs([Observation(dimension=Key(baz=i)) for i in (1, 2)], sk)
+
+    assert len(ds.group[gk3]) == 1 and ds.group[gk3][0].dimension["baz"] == 2
+    assert all(gk2 not in o.group_keys for o in ds.obs[3:])
+
+
 def test_datastructuredefinition():
     dsd = DataStructureDefinition()
 
@@ -77,6 +156,53 @@ def test_datastructuredefinition():
     DataStructureDefinition.from_keys([key1, key2])
 
 
+def test_datastructuredefinition_make_key_intern(monkeypatch):
+    dsd = DataStructureDefinition()
+    dsd.dimensions.getdefault(id="foo")
+    dsd.attributes.getdefault(id="bar")
+
+    # With trusted=True, KeyValue and AttributeValue instances are shared
+    k1 = dsd.make_key(Key, dict(foo="1", bar="x"), trusted=True)
+    k2 = dsd.make_key(Key, dict(foo="1", bar="x"), trusted=True)
+    assert k1 is not k2
+    assert k1.values["foo"] is k2.values["foo"]
+    assert k1.attrib["bar"] is k2.attrib["bar"]
+    other = dsd.make_key(Key, dict(foo="2"), trusted=True)
+    assert k1.values["foo"] is not other.values["foo"]
+
+    # …otherwise not, so that modifying one key does not affect others
+    k1 = dsd.make_key(Key, dict(foo=1, bar="x"))
+    k1.values["foo"].value = 3
+    k2 = dsd.make_key(Key, dict(foo=1, bar="x"))
+    assert k1.values["foo"] is not k2.values["foo"]
+    assert k2.values["foo"].value == 1
+
+    # With intern=True, the same key is returned
+    k3 = dsd.make_key(Key, dict(foo=1), intern=True)
+    assert k3 is dsd.make_key(Key, dict(foo=1), intern=True)
+    assert k3 is not dsd.make_key(Key, dict(foo=2), intern=True)
+
+    # Values that are equal, but of different types, are not interchangeable
+    for value in True, 1.0:
+        key = dsd.make_key(Key, dict(foo=value), intern=True)
+        assert key is not k3 and type(key.values["foo"].value) is type(value)
+
+    # Unhashable values are not interned
+    k4 = dsd.make_key(Key, dict(foo=[1]), intern=True)
+    assert k4 is not dsd.make_key(Key, dict(foo=[1]), intern=True)
+
+    # Missing dimensions still raise KeyError
+    with raises(KeyError):
+        dsd.make_key(Key, dict(baz=1))
+
+    # Caches are bounded; the oldest entries are discarded
+    monkeypatch.setattr(model, "MAX_INTERNED", 3)
+    keys = [dsd.make_key(Key, dict(foo=i), intern=True) for i in range(10)]
+    assert len(dsd._interned_keys) == len(dsd._interned_values) == 3
+    assert keys[-1] is dsd.make_key(Key, dict(foo=9), intern=True)
+    assert keys[0] is not dsd.make_key(Key, dict(foo=0), intern=True)
+
+
 def test_dimension():
     # Constructor
     Dimension(id="CURRENCY", order=0)
@@ -93,6 +219,43 @@ def test_dimensiondescriptor():
     key3 = dd.order_key(key2)
     assert list(key1.values.keys()) == list(key3.values.keys())
 
+    # A key already in order is returned as-is
+    assert dd.order_key(key1) is key1
+
+    # Values can be ordered without creating a Key; unknown IDs are omitted
+    assert dd.order_values(("baz", "qux", "foo"), (3, 4, 1)) == (
+        ("foo", "baz"),
+        (1, 3),
+    )
+
+    # Changing the order of dimensions is reflected
+    dd.get("foo").order = 5
+    assert list(dd.order_key(key1).values.keys()) == ["bar", "baz", "foo"]
+    dd.components.append(Dimension(id="qux", order=-1))
+    assert dd.order_values(("baz", "qux"), (3, 4)) == (("qux", "baz"), (4, 3))
+
+
+def test_componentlist_index():
+    ad = AttributeDescriptor()
+    da1 = ad.getdefault("foo")
+    assert "foo" in ad and ad.get("foo") is da1 and "bar" not in ad
+
+    # Components appended directly to the list are found
+    da2 = DataAttribute(id="bar")
+    ad.components.append(da2)
+    assert ad.get("bar") is da2 and "bar" in ad
+    assert da2 in ad
+
+    # …as are components of a replaced list
+    ad.components = [DataAttribute(id="baz")]
+    assert "baz" in ad and "foo" not in ad
+    with raises(KeyError):
+        ad.get("foo")
+
+    # Components without IDs are not indexed
+    ad.append(DataAttribute())
+    assert len(ad) == 2 and "baz" in ad
+
 
 def test_identifiable():
     urn = "urn:sdmx:org.sdmx.infomodel.conceptscheme.ConceptScheme=IT1:VARIAB_ALL(9.6)"
@@ -1,5 +1,18 @@
 """Speed and memory usage tests."""
-from pandasdmx.model import AttributeValue, DataAttribute, DataStructureDefinition
+import os
+import resource
+
+import pytest
+
+from pandasdmx import read_sdmx
+from pandasdmx.model import (
+    AttributeValue,
+    DataAttribute,
+    DataSet,
+    DataStructureDefinition,
+)
+from pandasdmx.reader.sdmxml import PARSERS, Reader
+from pandasdmx.tests.data import BASE_PATH
 
 
 def test_refcount():
@@ -28,3 +41,86 @@ def test_refcount():
     # Same, using a DSD
     av2 = AttributeValue(value="baz", value_for="foo", dsd=dsd)
     assert av2.value_for is da3
+
+
+def rss():
+    """Return the resident set size of the current process, in bytes."""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize()
+
+
+def write_ss(path, n_series, n_obs):
+    """Write a structure-specific data message with `n_series` × `n_obs`."""
+    text = (BASE_PATH / "ECB_EXR" / "ng-ts-gf-ss.xml").read_text()
+    obs = "".join(
+        f'<Obs TIME_PERIOD="{i}" OBS_VALUE="{i}.5" OBS_STATUS="A"/>'
+        for i in range(n_obs)
+    )
+    with open(path, "w") as f:
+        # Header and <DataSet> start tag from the specimen
+        f.write(text[: text.index("<Series")])
+        for i in range(n_series):
+            # Series keys repeat, so that the values interned by make_key() do not
+            # add to the memory used
+            f.write(
+                f'<Series FREQ="M" CURRENCY="C{i % 200}" CURRENCY_DENOM="EUR" '
+                f'EXR_TYPE="SP00" EXR_VAR="E">{obs}</Series>'
+            )
+        f.write("</message:DataSet></message:StructureSpecificData>")
+    return path
+
+
+@pytest.fixture(scope="module")
+def ss_200k(tmp_path_factory):
+    """Structure-specific data message with 200 series × 1000 observations."""
+    yield write_ss(tmp_path_factory.mktemp("performance") / "ss-200k.xml", 200, 1000)
+
+
+@pytest.fixture(scope="module")
+def ss_50k_series(tmp_path_factory):
+    """Structure-specific data message with 50,000 series × 4 observations."""
+    path = tmp_path_factory.mktemp("performance") / "ss-50k-series.xml"
+    yield write_ss(path, 50000, 4)
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="Linux only")
+@pytest.mark.parametrize("parser", PARSERS)
+def test_parse_memory(ss_200k, parser):
+    # Memory used to read a message is bounded, regardless of the number of
+    # observations, when these are not collected
+    dsd = read_sdmx(BASE_PATH / "ECB_EXR" / "ng-structure-full.xml").structure[0]
+    samples = []
+
+    with open(ss_200k, "rb") as f:
+        for obs in Reader().iter_observations(f, dsd=dsd, parser=parser):
+            if obs.dimension.values["TIME_PERIOD"].value == "999":
+                # Last observation in each series
+                samples.append(rss())
+
+    assert len(samples) == 200
+    # Without clearing parsed elements, this is more than 100 MiB
+    assert samples[-1] - samples[0] < 8 * 2 ** 20
+
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="Linux only")
+@pytest.mark.parametrize("parser", PARSERS)
+def test_read_message_memory(ss_50k_series, parser):
+    # Memory used by the parser in read_message() is bounded, regardless of the
+    # number of series. Observations are discarded by the DataSet class, so that
+    # only the memory used by parsing is measured.
+    samples = []
+
+    class SampledDataSet(DataSet):
+        def add_obs(self, observations, series_key=None):
+            if series_key is not None:
+                samples.append(rss())
+
+    dsd = read_sdmx(BASE_PATH / "ECB_EXR" / "ng-structure-full.xml").structure[0]
+
+    with open(ss_50k_series, "rb") as f:
+        Reader().read_message(f, dsd=dsd, parser=parser, dataset_class=SampledDataSet)
+
+    assert len(samples) == 50000
+    # With Reader.release = False, this is more than 8 MiB
+    assert samples[-1] - samples[0] < 4 * 2 ** 20
@@ -1,8 +1,12 @@
 import pytest
+import requests_mock
 
-from pandasdmx.remote import Session
+from pandasdmx import Request, read_sdmx, to_pandas
+from pandasdmx.reader import sdmxjson
+from pandasdmx.remote import ResponseIO, Session, StreamingResponseIO
 
-from . import has_requests_cache
+from . import assert_pd_equal, has_requests_cache
+from .data import BASE_PATH as TEST_DATA_PATH
 
 
 @pytest.mark.skipif(has_requests_cache, reason="test without requests_cache")
@@ -24,3 +28,60 @@ def test_session_init_cache(tmp_path):
 
     # Test for existence of cache file
     assert cache_name.with_suffix(".sqlite").exists()
+
+
+def test_response_io(monkeypatch):
+    path = TEST_DATA_PATH / "ECB_EXR" / "ts.json"
+    url = "https://example.com/data"
+
+    with requests_mock.Mocker() as m:
+        m.get(url, content=path.read_bytes())
+        io = ResponseIO(Session().get(url))
+
+    # Buffered content can be rewound
+    assert io.seekable()
+    io.read(100)
+    assert io.tell() == 100
+    io.seek(0)
+
+    # …so that readers use it directly, without a copy
+    def spool(*args, **kwargs):  # pragma: no cover
+        raise AssertionError("source copied")
+
+    monkeypatch.setattr(sdmxjson, "SpooledTemporaryFile", spool)
+    msg = sdmxjson.Reader().read_message(io)
+    expected = read_sdmx(path)
+    assert len(expected.data[0].obs) == len(msg.data[0].obs)
+
+
+def test_streaming_response_io(tmp_path):
+    content = (TEST_DATA_PATH / "ECB_EXR" / "1" / "M.USD.EUR.SP00.A.xml").read_bytes()
+    url = "https://example.com/data"
+
+    with requests_mock.Mocker() as m:
+        m.get(url, content=content)
+        response = Session(stream=True).get(url)
+
+        # Content is retrieved only as needed to satisfy read()
+        io = StreamingResponseIO(response, tee=tmp_path / "tee.xml", chunk_size=100)
+        assert response.raw.tell() == 0
+        assert io.read(250) == content[:250]
+        assert response.raw.tell() == 300
+
+        # Remaining content, including partial chunks; tee receives all data
+        assert io.read() == content[250:]
+        io.close()
+        assert (tmp_path / "tee.xml").read_bytes() == content
+
+    # Request.get() parses streamed responses
+    headers = {"Content-Type": "application/vnd.sdmx.genericdata+xml; version=2.1"}
+    with requests_mock.Mocker() as m:
+        m.get(url, content=content, headers=headers)
+        req = Request(stream=True)
+        msg = req.get(url=url, tofile=tmp_path / "tofile.xml")
+
+        # Same result as buffered
+        expected = Request().get(url=url)
+
+    assert_pd_equal(to_pandas(msg.data[0]), to_pandas(expected.data[0]))
+    assert (tmp_path / "tofile.xml").read_bytes() == content
@@ -1,8 +1,12 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 import pydantic
 import pytest
 from pydantic import StrictStr
 
-from pandasdmx.util import BaseModel, DictLike, validate_dictlike
+from pandasdmx.util import BaseModel, DictLike, MessageCache, validate_dictlike
 
 
 def test_dictlike():
@@ -69,3 +73,96 @@ def test_dictlike_anno():
     @validate_dictlike("elems")
     class Bar(BaseModel):
         elems: DictLike[StrictStr, float] = DictLike()
+
+
+def test_construct():
+    @validate_dictlike("items")
+    class Foo(BaseModel):
+        items: DictLike[StrictStr, int] = DictLike()
+        other: Optional["Foo"] = None
+
+    # Omitted DictLike fields are new, empty instances
+    f1, f2 = Foo.construct(), Foo.construct()
+    assert type(f1.items) == DictLike and f1.items is not f2.items
+    assert f1.__fields_set__ == set()
+
+    # Values are not validated, but are copied like validated values
+    values = DictLike(a=1)
+    f = Foo.construct(items=values)
+    assert f.items == values and f.items is not values
+    assert f.__fields_set__ == {"items"}
+
+    # …so that setting elements is type-checked, as on a validated instance
+    with pytest.raises(pydantic.ValidationError):
+        f.items[123] = 456
+
+    # Assignment of an instance of the field type keeps the same object
+    f1.other = f2
+    assert f1.other is f2
+    f1.other = None
+    assert f1.other is None and "other" in f1.__fields_set__
+
+    # Other values are still validated
+    with pytest.raises(pydantic.ValidationError):
+        f1.other = 1
+
+
+def test_message_cache(monkeypatch):
+    cache = MessageCache(max_entries=2, max_bytes=10, sizeof=len)
+
+    cache["a"] = "xxx"
+    cache["b"] = "xxx"
+    assert cache["a"] == "xxx"
+
+    # Least recently used entry is discarded
+    cache["c"] = "xxx"
+    assert set(cache) == {"a", "c"}
+    with pytest.raises(KeyError):
+        cache["b"]
+
+    # Entries are discarded to respect max_bytes
+    cache["d"] = "xxxxxxxx"
+    assert list(cache) == ["d"]
+
+    assert cache.stats == dict(hits=1, misses=1, evictions=3, entries=1, bytes=8)
+
+    # Entries expire after ttl seconds
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = MessageCache(ttl=10)
+    cache["a"] = cache["b"] = object()
+    now[0] = 5.0
+    cache["c"] = object()
+    assert "a" in cache
+    now[0] = 12.0
+    assert "a" not in cache
+    with pytest.raises(KeyError):
+        cache["a"]
+    assert cache.stats["misses"] == 1
+    cache["d"] = object()
+    assert set(cache) == {"c", "d"}
+
+    cache.clear()
+    assert len(cache) == 0 and cache.stats["bytes"] == 0
+
+    # ttl set after entries were added without expiry
+    cache = MessageCache()
+    cache["a"] = object()
+    cache.ttl = 5
+    cache["b"] = object()
+    now[0] = 20.0
+    cache["c"] = object()
+    assert set(cache) == {"a", "c"}
+
+    # Concurrent use from several threads
+    cache = MessageCache(max_entries=10, sizeof=len)
+
+    def use(i):
+        for j in range(1000):
+            cache[f"{i}-{j % 20}"] = "x"
+            cache.get(f"{i}-{j % 20}")
+
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(use, range(4)))
+    assert cache.stats["entries"] == 10 == cache.stats["bytes"]
+    assert cache.hits + cache.misses == 4000
@@ -4,8 +4,22 @@ import pytest
 from pytest import raises
 
 import pandasdmx
-from pandasdmx.model import TimeDimension
+from pandasdmx.model import (
+    AttributeValue,
+    ConstraintRole,
+    ConstraintRoleType,
+    ContentConstraint,
+    CubeRegion,
+    DataAttribute,
+    Dimension,
+    Key,
+    MemberSelection,
+    MemberValue,
+    Observation,
+    TimeDimension,
+)
 from pandasdmx.tests import assert_pd_equal
+from pandasdmx.writer.pandas import parse_time_period
 from pandasdmx.tests.data import expected_data, specimen, test_files
 
 # file name → (exception raised, exception message, comment/reason)
@@ -80,6 +94,68 @@ def test_write_data_attributes(path):
     assert isinstance(result, (pd.Series, pd.DataFrame, list)), type(result)
 
 
+def test_write_dataset_duplicate_keys():
+    da = {id: DataAttribute(id=id) for id in "AB"}
+
+    def obs(x, value, **attrs):
+        return Observation(
+            dimension=Key(X=x),
+            value=value,
+            attached_attribute={
+                id: AttributeValue(value_for=da[id], value=v) for id, v in attrs.items()
+            },
+        )
+
+    # The second observation with key "b" replaces the first, in its position
+    observations = [obs("b", 1.0, A="a1"), obs("a", 2.0), obs("b", 3.0, B="b3")]
+
+    result = pandasdmx.to_pandas(observations)
+    assert [("a",), ("b",)] == list(result.index)
+    assert [2.0, 3.0] == list(result)
+
+    result = pandasdmx.to_pandas(observations, attributes="o")
+    assert [("b",), ("a",)] == list(result.index)
+    assert ["value", "B"] == list(result.columns)
+    assert [3.0, 2.0] == list(result["value"])
+    assert "b3" == result.loc[("b",), "B"].value
+    assert pd.isna(result.loc[("a",), "B"])
+
+
+@pytest.mark.parametrize("executor", [None, "thread", "process"])
+def test_write_executor(executor):
+    # DataMessage with 2 DataSets
+    with specimen("ECB_EXR/action-delete.json") as f:
+        msg = pandasdmx.read_sdmx(f)
+
+    expected = pandasdmx.to_pandas(msg)
+    result = pandasdmx.to_pandas(msg, executor=executor, workers=2)
+    assert 2 == len(result)
+    for e, r in zip(expected, result):
+        assert_pd_equal(e, r)
+
+    # StructureMessage
+    with specimen("ESTAT/apro_mk_cola-structure.xml") as f:
+        msg = pandasdmx.read_sdmx(f)
+
+    expected = pandasdmx.to_pandas(msg)
+    result = pandasdmx.to_pandas(msg, executor=executor, workers=2)
+    assert list(expected) == list(result)
+    for key, value in expected.items():
+        if isinstance(value, (pd.Series, pd.DataFrame)):
+            assert_pd_equal(value, result[key])
+        else:
+            for k, v in value.items():
+                assert_pd_equal(v, result[key][k])
+
+
+def test_write_executor_invalid():
+    with specimen("ECB_EXR/action-delete.json") as f:
+        msg = pandasdmx.read_sdmx(f)
+
+    with pytest.raises(ValueError, match="executor must be"):
+        pandasdmx.to_pandas(msg, executor="foo")
+
+
 def test_write_agencyscheme():
     # Convert an agency scheme
     with specimen("ECB/orgscheme.xml") as f:
@@ -296,6 +372,130 @@ def test_write_dataset_datetime():
         pandasdmx.to_pandas(ds, datetime=43)
 
 
+def test_write_dataset_categorical():
+    with specimen("IPI-2010-A21-structure.xml") as f:
+        dsd = pandasdmx.read_sdmx(f).structure["IPI-2010-A21"]
+    with specimen("IPI-2010-A21.xml") as f:
+        msg = pandasdmx.read_sdmx(f, dsd=dsd)
+
+    expected = pandasdmx.to_pandas(msg, attributes="o")
+    result = pandasdmx.to_pandas(msg, attributes="o", categorical=True)
+
+    # Same values and labels
+    assert expected["value"].tolist() == result["value"].tolist()
+    assert expected.index.tolist() == result.index.tolist()
+
+    # Dimension values are categorical; categories of coded dimensions are the
+    # codes, in order
+    for level in result.index.levels:
+        assert isinstance(level, pd.CategoricalIndex)
+    codes = list(dsd.dimensions.get("PRODUIT").local_representation.enumerated.items)
+    assert codes == result.index.levels[1].categories.tolist()
+
+    # Coded attributes are categorical, giving the IDs of the values
+    assert "category" == result["OBS_STATUS"].dtype
+    assert expected["OBS_STATUS"].map(str).tolist() == result["OBS_STATUS"].tolist()
+
+
+def test_write_dataset_chunksize():
+    with specimen("IPI-2010-A21-structure.xml") as f:
+        dsd = pandasdmx.read_sdmx(f).structure["IPI-2010-A21"]
+    with specimen("IPI-2010-A21.xml") as f:
+        msg = pandasdmx.read_sdmx(f, dsd=dsd)
+    expected = pandasdmx.to_pandas(msg, attributes="osg").sort_index()
+
+    # Chunks of at most 1000 observations
+    result = list(pandasdmx.to_pandas(msg, attributes="osg", chunksize=1000))
+    assert [1000, 1000, 1000, 230] == list(map(len, result))
+    assert_pd_equal(expected, pd.concat(result).sort_index())
+
+    # One chunk per series
+    result = list(pandasdmx.to_pandas(msg, chunksize="series"))
+    assert len(msg.data[0].series) == len(result)
+    for series_key, df in zip(msg.data[0].series, result):
+        assert {series_key.get_values()} == set(df.index.droplevel(-1))
+
+    # Observations streamed from a file
+    with specimen("IPI-2010-A21.xml") as f:
+        obs = pandasdmx.read_sdmx(f, dsd=dsd, stream=True)
+        result = list(pandasdmx.to_pandas(obs, attributes="osg", chunksize=1000))
+    assert_pd_equal(expected, pd.concat(result).sort_index())
+
+    with pytest.raises(ValueError, match="chunksize must be"):
+        pandasdmx.to_pandas(msg, chunksize=0)
+
+
+def test_write_dataset_constraint():
+    with specimen("ECB_EXR/ng-ts.xml") as f:
+        msg = pandasdmx.read_sdmx(f)
+
+    def cr(**values):
+        member = {}
+        for id, vv in values.items():
+            dim = Dimension(id=id)
+            mvs = {MemberValue(value=v) for v in vv}
+            member[dim] = MemberSelection(values_for=dim, values=mvs)
+        # NB construct() avoids validating CubeRegion.member, with its forward
+        #    reference to Dimension
+        return CubeRegion.construct(member=member)
+
+    cc = ContentConstraint(
+        role=ConstraintRole(role=ConstraintRoleType.allowable),
+        data_content_region=[
+            cr(CURRENCY=["CHF", "GBP", "XXX"], TIME_PERIOD=["2010-08", "2010-09"]),
+            cr(CURRENCY=["USD"], TIME_PERIOD=["2010-10"]),
+        ],
+    )
+
+    # Same as filtering the observations
+    obs = msg.data[0].obs
+    expected = pandasdmx.to_pandas([o for o in obs if o.key in cc], attributes="o")
+    result = pandasdmx.to_pandas(msg, attributes="o", constraint=cc)
+    assert_pd_equal(expected, result)
+    assert 5 == len(result)
+
+    # A dimension not in the keys
+    cc.data_content_region.append(cr(FOO=["BAR"]))
+    with pytest.raises(KeyError):
+        pandasdmx.to_pandas(msg, constraint=cc)
+
+
+@pytest.mark.parametrize(
+    "values, freq, expected",
+    [
+        (["2020", "2021"], "A", ["2020", "2021"]),
+        (["2020-A1", "2021-A1"], "A", ["2020", "2021"]),
+        (["2020-S1", "2020-S2"], "6M", ["2020-01", "2020-07"]),
+        (["2020-T1", "2020-T3"], "4M", ["2020-01", "2020-09"]),
+        (["2020-Q1", "2020Q4"], "Q", ["2020Q1", "2020Q4"]),
+        (["2020-M01", "2020-12"], "M", ["2020-01", "2020-12"]),
+        (["2020-W01", "2020-W53"], "W", ["2019-12-30", "2020-12-28"]),
+        (["2020-D060", "2020-02-29"], "D", ["2020-02-29", "2020-02-29"]),
+    ],
+)
+def test_parse_time_period(values, freq, expected):
+    # Frequency is inferred from the format of the values
+    expected = pd.PeriodIndex(expected, freq=freq)
+    pd.testing.assert_index_equal(expected, parse_time_period(values))
+
+
+def test_parse_time_period_freq():
+    # Periods with the given frequency containing the start of each value
+    expected = pd.PeriodIndex(["2020-04", "2020-05", None], freq="M")
+    result = parse_time_period(["2020-Q2", "2020-05", None], freq="M")
+    pd.testing.assert_index_equal(expected, result)
+
+    # Frequency cannot be inferred from mixed or unknown frequencies
+    for values in (["2020-Q1", "2020-05"], ["2020-03-15T10:00"]):
+        with pytest.raises(ValueError, match="cannot infer frequency"):
+            parse_time_period(values)
+
+    # Weeks and days that do not exist in the year are not valid
+    for value in ("2021-W53", "2021-D366"):
+        with pytest.raises(ValueError, match="invalid time periods"):
+            parse_time_period(["2021-W01", value], freq="D")
+
+
 @pytest.mark.parametrize("path", **test_files(kind="structure"))
 def test_writer_structure(path):
     msg = pandasdmx.read_sdmx(path)
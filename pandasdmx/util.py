@@ -1,5 +1,7 @@
 import collections
 import logging
+import threading
+import time
 import typing
 from enum import Enum
 from typing import TYPE_CHECKING, Any, List, Type, TypeVar, Union, no_type_check
@@ -7,6 +9,7 @@ from typing import TYPE_CHECKING, Any, List, Type, TypeVar, Union, no_type_check
 import pydantic
 from pydantic import DictError, Extra, ValidationError, validator  # noqa: F401
 from pydantic.class_validators import make_generic_validator
+from pydantic.fields import SHAPE_SINGLETON
 
 KT = TypeVar("KT")
 VT = TypeVar("VT")
@@ -106,6 +109,10 @@ class BaseModel(pydantic.BaseModel):
        - When cls.attr is typed as BaseModel (or a subclass), then
          a.attr is b.attr is always False, even when set to the same reference.
        - Fix: override BaseModel.validate() without copy().
+    3. :meth:`construct` gives fields validated by :func:`validate_dictlike` the same
+       :class:`DictLike` values as validation would, and assignment of values that
+       need no validation (:obj:`None`, or instances of a BaseModel field's type)
+       skips Field.validate().
     """
 
     class Config:
@@ -128,10 +135,28 @@ class BaseModel(pydantic.BaseModel):
                 raise DictError() from e
             return cls(**value_as_dict)
 
+    @classmethod
+    def construct(cls: Type["Model"], _fields_set=None, **values) -> "Model":
+        """Create a new instance from trusted `values`, without validation.
+
+        As :meth:`pydantic.BaseModel.construct`, except that values for
+        :class:`DictLike` fields are copied as validation would, and omitted ones are
+        empty. Use only where `values` have the types that validation would produce.
+        """
+        if _fields_set is None:
+            _fields_set = set(values)
+        for name, field in _dictlike_fields(cls):
+            value = values.get(name)
+            values[name] = DictLike() if value is None else DictLike._for(field, value)
+        return super().construct(_fields_set, **values)
+
     # Workaround for https://github.com/samuelcolvin/pydantic/issues/524
     @no_type_check
     def __setattr__(self, name, value):
-        if self.__config__.extra is not Extra.allow and name not in self.__fields__:
+        if name in self.__private_attributes__:
+            # As pydantic; private attributes are not validated
+            return object.__setattr__(self, name, value)
+        elif self.__config__.extra is not Extra.allow and name not in self.__fields__:
             raise ValueError(
                 f'"{self.__class__.__name__}" object has no field' f' "{name}"'
             )
@@ -144,22 +169,48 @@ class BaseModel(pydantic.BaseModel):
             self.__config__.validate_assignment
             and name not in self.__config__.validate_assignment_exclude
         ):
+            # With "limited", validators receive no sibling field values. An
+            # empty dict is passed directly; self.dict(include={}) would build
+            # the same empty dict at greater cost
             if self.__config__.validate_assignment == "limited":
-                kw = {"include": {}}
+                values = {}
             else:
-                kw = {"exclude": {name}}
+                values = self.dict(exclude={name})
             known_field = self.__fields__.get(name, None)
-            if known_field:
-                value, error_ = known_field.validate(value, self.dict(**kw), loc=name)
+            if known_field and not _is_valid(known_field, value):
+                value, error_ = known_field.validate(value, values, loc=name)
                 if error_:
                     raise ValidationError([error_], type(self))
         self.__dict__[name] = value
         self.__fields_set__.add(name)
 
 
+def _is_valid(field, value) -> bool:
+    """Return :obj:`True` if `value` would be returned unchanged by validating `field`.
+
+    This is the case for :obj:`None` and for instances of the field's
+    :class:`BaseModel` type, if `field` has no other validators.
+    """
+    if field.pre_validators or field.post_validators or field.class_validators:
+        return False
+    elif value is None:
+        return field.allow_none
+    else:
+        type_ = field.type_
+        return (
+            field.shape == SHAPE_SINGLETON
+            and isinstance(type_, type)
+            and issubclass(type_, BaseModel)
+            and isinstance(value, type_)
+        )
+
+
 class DictLike(collections.OrderedDict, typing.MutableMapping[KT, VT]):
     """Container with features of a dict & list, plus attribute access."""
 
+    # Fields used to validate keys and values; see validate()
+    __fields: typing.Dict = {}
+
     def __getitem__(self, key: Union[KT, int]) -> VT:
         try:
             return super().__getitem__(key)
@@ -183,6 +234,10 @@ class DictLike(collections.OrderedDict, typing.MutableMapping[KT, VT]):
         except KeyError as e:
             raise AttributeError(*e.args) from None
 
+    def __reduce__(self):
+        # Omit the fields used to validate keys and values, which cannot be pickled
+        return self.__class__, (), None, None, iter(self.items())
+
     def validate(cls, value, field):
         if not isinstance(value, (dict, DictLike)):
             raise ValueError(value)
@@ -192,10 +247,16 @@ class DictLike(collections.OrderedDict, typing.MutableMapping[KT, VT]):
         result.update(value)
         return result
 
+    @classmethod
+    def _for(cls, field, value):
+        """Return a copy of `value` like :meth:`validate`, without validating it."""
+        result = cls(value)
+        result.__fields = {"key": field.key_field, "value": field}
+        return result
+
     def _apply_validators(self, which, value):
-        try:
-            field = self.__fields[which]
-        except AttributeError:
+        field = self.__fields.get(which)
+        if field is None:
             return value
         result, error = field._apply_validators(
             value, validators=field.validators, values={}, loc=(), cls=None
@@ -241,16 +302,172 @@ def summarize_dictlike(dl, maxwidth=72):
     return result
 
 
+class MessageCache(typing.MutableMapping[str, Any]):
+    """Bounded, thread-safe cache of messages, e.g. for :attr:`.Request.cache`.
+
+    When adding an entry would exceed `max_entries` or `max_bytes`, the least
+    recently used entries are discarded. Entries older than `ttl` seconds are
+    discarded when next accessed, or when any entry is added.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of entries. :obj:`None` for no limit.
+    max_bytes : int, optional
+        Maximum total estimated size of the entries, in bytes. :obj:`None` for no
+        limit.
+    ttl : float, optional
+        Time, in seconds, for which entries are kept. :obj:`None` for no limit.
+    sizeof : callable, optional
+        Function returning the estimated size of an entry, in bytes. Default: the
+        length of the HTTP response content from which a :class:`.Message` was
+        parsed.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=None, ttl=None, sizeof=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof or _response_size
+
+        # Key → (value, size, expiry time); least recently used first
+        self._data: typing.Dict = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+        #: Number of successful lookups.
+        self.hits = 0
+        #: Number of lookups for keys that were not present, or had expired.
+        self.misses = 0
+        #: Number of entries discarded to respect `max_entries` or `max_bytes`.
+        self.evictions = 0
+
+    @property
+    def stats(self):
+        """:class:`dict` of `hits`, `misses`, `evictions`, `entries` and `bytes`."""
+        with self._lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._data),
+                bytes=self._bytes,
+            )
+
+    def __getitem__(self, key):
+        with self._lock:
+            try:
+                value, _, expires = self._data[key]
+            except KeyError:
+                self.misses += 1
+                raise
+
+            if expires is not None and expires <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                raise KeyError(key)
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        size = self.sizeof(value)
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, size, expires)
+            self._bytes += size
+            self._evict()
+
+    def __delitem__(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def __contains__(self, key):
+        with self._lock:
+            try:
+                expires = self._data[key][2]
+            except KeyError:
+                return False
+            return expires is None or expires > time.monotonic()
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def _remove(self, key):
+        self._bytes -= self._data.pop(key)[1]
+
+    def _evict(self):
+        """Discard expired entries, then least recently used entries over limits."""
+        if self.ttl is not None:
+            now = time.monotonic()
+            # Entries added while ttl was None do not expire
+            expired = [
+                k for k, v in self._data.items() if v[2] is not None and v[2] <= now
+            ]
+            for key in expired:
+                self._remove(key)
+
+        while len(self._data) and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._data)))
+            self.evictions += 1
+
+
+def _response_size(msg) -> int:
+    """Return the length of the content of the HTTP response for `msg`."""
+    response = getattr(msg, "response", None)
+    if response is None:
+        return 0
+    try:
+        return len(response.content or b"")
+    except RuntimeError:
+        # Content of a streamed response was consumed while parsing
+        return int(response.headers.get("Content-Length", 0))
+
+
+_validate_dictlike = make_generic_validator(DictLike.validate)
+
+#: Names and fields of BaseModel subclasses that are validated by
+#: :func:`validate_dictlike`.
+_DICTLIKE_FIELDS: typing.Dict[type, typing.List] = {}
+
+
 def validate_dictlike(*fields):
     def decorator(cls):
-        v = make_generic_validator(DictLike.validate)
         for field in fields:
-            cls.__fields__[field].post_validators = [v]
+            cls.__fields__[field].post_validators = [_validate_dictlike]
         return cls
 
     return decorator
 
 
+def _dictlike_fields(cls) -> typing.List:
+    try:
+        return _DICTLIKE_FIELDS[cls]
+    except KeyError:
+        result = _DICTLIKE_FIELDS[cls] = [
+            (name, field)
+            for name, field in cls.__fields__.items()
+            if _validate_dictlike in (field.post_validators or ())
+        ]
+        return result
+
+
 def compare(attr, a, b, strict: bool) -> bool:
     """Return :obj:`True` if ``a.attr`` == ``b.attr``.
 
@@ -1,4 +1,7 @@
-from itertools import chain
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import chain, compress, groupby, islice
 from typing import Set, Union
 
 import numpy as np
@@ -24,6 +27,25 @@ from pandasdmx.writer.base import BaseWriter
 #: 'compat' or 'rows'. See the ref:`HOWTO <howto-rtype>`.
 DEFAULT_RTYPE = "rows"
 
+#: :mod:`pandas` frequency strings for values of the SDMX FREQ code list, and for
+#: the period indicators of SDMX reporting periods such as '2020-Q1'.
+FREQ = {
+    "A": "A",
+    "S": "6M",
+    "T": "4M",
+    "Q": "Q",
+    "M": "M",
+    "W": "W",
+    "D": "D",
+    "B": "B",
+    "H": "H",
+    "N": "T",
+}
+
+# Format for pandas.to_datetime() that accepts only ISO 8601 dates and times, e.g.
+# '2020', '2020-01' or '2020-01-31T12:00'. Before pandas 2.0, any ISO 8601 format
+# string selected the strict ISO 8601 parser.
+_ISO8601 = "ISO8601" if int(pd.__version__.split(".")[0]) >= 2 else "%Y-%m-%d"
 
 writer = BaseWriter("pandas")
 
@@ -54,8 +76,11 @@ def _list(obj: list, *args, **kwargs):
 @writer
 def _dict(obj: dict, *args, **kwargs):
     """Convert mappings."""
-    result = {k: writer.recurse(v, *args, **kwargs) for k, v in obj.items()}
+    return _combine({k: writer.recurse(v, *args, **kwargs) for k, v in obj.items()})
 
+
+def _combine(result):
+    """Helper for :func:`_dict` to combine the converted values of a mapping."""
     result_type = set(type(v) for v in result.values())
 
     if result_type <= {pd.Series, pd.DataFrame}:
@@ -87,9 +112,18 @@ def _set(obj: set, *args, **kwargs):
     return result
 
 
+@writer
+def _iterator(obj: Iterator, *args, **kwargs):
+    """Convert an iterator of :class:`.Observation`, e.g. from ``read_sdmx(…,
+    stream=True)``."""
+    return write_dataset(obj, *args, **kwargs)
+
+
 # Functions for message classes
 @writer
-def write_datamessage(obj: message.DataMessage, *args, rtype=None, **kwargs):
+def write_datamessage(
+    obj: message.DataMessage, *args, rtype=None, executor=None, workers=None, **kwargs
+):
     """Convert :class:`.DataMessage`.
 
     Parameters
@@ -97,6 +131,12 @@ def write_datamessage(obj: message.DataMessage, *args, rtype=None, **kwargs):
     rtype : 'compat' or 'rows', optional
         Data type to return; default :data:`.DEFAULT_RTYPE`. See the
         :ref:`HOWTO <howto-rtype>`.
+    executor : :class:`concurrent.futures.Executor` or 'thread' or 'process', optional
+        If given, convert multiple data sets concurrently, using `executor` or a
+        new pool of threads or processes. The results are in the same order.
+    workers : int, optional
+        Maximum number of workers in a new pool. If given without `executor`, a
+        pool of threads is used.
     kwargs :
         Passed to :meth:`write_dataset` for each data set.
 
@@ -119,11 +159,14 @@ def write_datamessage(obj: message.DataMessage, *args, rtype=None, **kwargs):
     if len(obj.data) == 1:
         return writer.recurse(obj.data[0], *args, **kwargs)
     else:
-        return [writer.recurse(ds, *args, **kwargs) for ds in obj.data]
+        func = partial(_recurse, args, kwargs)
+        return _map(func, obj.data, executor, workers)
 
 
 @writer
-def write_structuremessage(obj: message.StructureMessage, include=None, **kwargs):
+def write_structuremessage(
+    obj: message.StructureMessage, include=None, executor=None, workers=None, **kwargs
+):
     """Convert :class:`.StructureMessage`.
 
     Parameters
@@ -132,6 +175,11 @@ def write_structuremessage(obj: message.StructureMessage, include=None, **kwargs
     include : iterable of str or str, optional
         One or more of the attributes of the StructureMessage (
         'category_scheme', 'codelist', etc.) to transform.
+    executor : :class:`concurrent.futures.Executor` or 'thread' or 'process', optional
+        If given, convert the objects in all the attributes, e.g. each
+        :class:`.Codelist`, concurrently. See :func:`write_datamessage`.
+    workers : int, optional
+        See :func:`write_datamessage`.
     kwargs :
         Passed to :meth:`write` for each attribute.
 
@@ -159,9 +207,19 @@ def write_structuremessage(obj: message.StructureMessage, include=None, **kwargs
         attr_set &= all_contents
     attrs = sorted(attr_set)
 
+    # Convert the objects in all attributes together, then combine those for each
+    # attribute as _dict() does
+    tasks = [(a, k, v) for a in attrs for k, v in getattr(obj, a).items()]
+    func = partial(_recurse, (), kwargs)
+    values = _map(func, [t[2] for t in tasks], executor, workers)
+
+    converted: dict = {a: {} for a in attrs}
+    for (a, k, _), value in zip(tasks, values):
+        converted[a][k] = value
+
     result: DictLike[str, Union[pd.Series, pd.DataFrame]] = DictLike()
     for a in attrs:
-        dl = writer.recurse(getattr(obj, a), **kwargs)
+        dl = _combine(converted[a])
         if len(dl):
             # Only add non-empty elements
             result[a] = dl
@@ -169,6 +227,35 @@ def write_structuremessage(obj: message.StructureMessage, include=None, **kwargs
     return result
 
 
+def _recurse(args, kwargs, obj):
+    """Convert `obj`; a module-level function, so it can be used in processes."""
+    return writer.recurse(obj, *args, **kwargs)
+
+
+def _map(func, items, executor=None, workers=None):
+    """Return a list of `func` applied to each of `items`, in order.
+
+    If `executor` or `workers` are given, `items` are converted concurrently; see
+    :func:`write_datamessage`.
+    """
+    if executor is None and workers is None:
+        return list(map(func, items))
+    elif isinstance(executor, Executor):
+        return list(executor.map(func, items))
+
+    try:
+        cls = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}[
+            executor or "thread"
+        ]
+    except KeyError:
+        raise ValueError(
+            f"executor must be an Executor, 'thread' or 'process'; got {executor}"
+        ) from None
+
+    with cls(max_workers=workers) as pool:
+        return list(pool.map(func, items))
+
+
 # Functions for model classes
 
 
@@ -206,6 +293,8 @@ def write_dataset(
     dtype=np.float64,
     constraint=None,
     datetime=False,
+    categorical=False,
+    chunksize=None,
     **kwargs,
 ):
     """Convert :class:`~.DataSet`.
@@ -216,6 +305,8 @@ def write_dataset(
     Parameters
     ----------
     obj : :class:`~.DataSet` or iterable of :class:`~.Observation`
+        The observations may also be :class:`.StreamedObservation`, as from
+        :func:`.read_sdmx` with ``stream=True``.
     attributes : str
         Types of attributes to return with the data. A string containing
         zero or more of:
@@ -250,12 +341,28 @@ def write_dataset(
           - **axis** (`{0 or 'index', 1 or 'columns'}`): axis on which to place
             the time dimension (default: 0).
           - **freq** (:obj:`True` or :class:`str` or :class:`~.Dimension`):
-            produce :class:`pandas.PeriodIndex`. If :class:`str`, the ID of a
+            produce :class:`pandas.PeriodIndex`, using :func:`parse_time_period`.
+            If :obj:`True`, the frequency is inferred from the format of the time
+            periods. If :class:`str`, a :mod:`pandas` frequency, or the ID of a
             Dimension containing a frequency specification. If a Dimension, the
-            specified dimension is used for the frequency specification.
+            specified dimension is used for the frequency specification; its
+            values are mapped to :mod:`pandas` frequencies using :data:`FREQ`.
 
             Any Dimension used for the frequency specification  does not
             appear in the returned DataFrame.
+    categorical : bool, optional
+        If :obj:`True`, give the values of each dimension, and of each coded
+        attribute, as a :class:`pandas.Categorical`. The categories are the IDs of
+        the codes in the component's enumerated representation, in order, followed
+        by any other values; or, if the component is not coded, the values that
+        appear. Coded attributes are given by the IDs of their values, instead of
+        :class:`.AttributeValue`.
+    chunksize : int or 'series', optional
+        If given, return an iterator over results for successive chunks of the
+        observations in `obj`, instead of one result: each for at most `chunksize`
+        observations, or, if 'series', for the consecutive observations with the
+        same :class:`.SeriesKey`. Observations are read from `obj` only as each
+        chunk is converted. Duplicate keys in different chunks are not removed.
 
     Returns
     -------
@@ -268,6 +375,8 @@ def write_dataset(
           various layouts as described in the :ref:`HOWTO <howto-rtype>`.
     :class:`pandas.Series` with :class:`pandas.MultiIndex`
         Otherwise.
+    iterator
+        of the above, if `chunksize` is given.
     """
     # If called directly on a DataSet (rather than a parent DataMessage),
     # cannot determine the "dimension at observation level"
@@ -286,33 +395,74 @@ def write_dataset(
     elif set(attributes) - {"o", "s", "g", "d"}:
         raise ValueError(f"attributes must be in 'osgd'; got {attributes}")
 
-    # Iterate on observations
-    data = {}
-    for observation in getattr(obj, "obs", obj):
+    if chunksize is not None:
+        if chunksize != "series" and not (isinstance(chunksize, int) and chunksize > 0):
+            raise ValueError(f"chunksize must be int > 0 or 'series'; got {chunksize}")
+        args = (attributes, dtype, constraint, datetime, categorical)
+        return _write_chunks(obj, chunksize, *args, **kwargs)
+
+    # Iterate on observations, filling one list per dimension, the values, and one
+    # list per attribute ID; these are padded with NaN where an attribute is absent.
+    # The order of the attribute IDs of each observation is also recorded.
+    keys = []
+    values = []
+    attrs = {}
+    attr_order = []
+    ids = ()
+    n = 0
+
+    # A ContentConstraint is applied to all keys at once, below; any other
+    # constraint to each Observation
+    check = None if isinstance(constraint, model.ContentConstraint) else constraint
+
+    for observation in map(_observation, getattr(obj, "obs", obj)):
         # Check that the Observation is within the constraint, if any
-        key = observation.key.order()
-        if constraint and key not in constraint:
+        if check and observation.key not in check:
             continue
 
+        ids, key = _ordered_key(observation.key_parts)
+        if len(key) == len(keys):
+            for column, value in zip(keys, key):
+                column.append(str(value))
+        else:
+            _append_key(keys, key, n)
+
         # Add value and attributes
-        row = {}
         if dtype:
-            row["value"] = observation.value
+            values.append(observation.value)
         if attributes:
-            row.update(observation.attrib)
-
-        data[tuple(map(str, key.get_values()))] = row
-
-    result: Union[pd.Series, pd.DataFrame] = pd.DataFrame.from_dict(
-        data, orient="index"
+            attrib = observation.attrib
+            for attr_id, av in attrib.items():
+                column = attrs.setdefault(attr_id, [])
+                column.extend([np.nan] * (n - len(column)))
+                column.append(av)
+            attr_order.append(tuple(attrib))
+
+        n += 1
+
+    if check is None and constraint and n:
+        # Keep only Observations within the constraint
+        mask = _constraint_mask(constraint, keys, ids)
+        if not mask.all():
+            keys = [list(compress(column, mask)) for column in keys]
+            values = list(compress(values, mask))
+            for column in attrs.values():
+                column.extend([np.nan] * (n - len(column)))
+                column[:] = compress(column, mask)
+            attr_order = list(compress(attr_order, mask)) if attributes else []
+            n = int(mask.sum())
+
+    result: Union[pd.Series, pd.DataFrame] = _dataset_frame(
+        keys, ids, values if dtype else None, attrs, attr_order, n
     )
 
-    if len(result):
-        result.index.names = observation.key.order().values.keys()
-        if dtype:
-            result["value"] = result["value"].astype(dtype)
-            if not attributes:
-                result = result["value"]
+    if len(result) and dtype:
+        result["value"] = result["value"].astype(dtype)
+        if not attributes:
+            result = result["value"]
+
+    if categorical:
+        result = _categorical(result, obj, kwargs.get("dsd"))
 
     # Reshape for compatibility with v0.9
     result, datetime, kwargs = _dataset_compat(result, datetime, kwargs)
@@ -320,6 +470,387 @@ def write_dataset(
     return _maybe_convert_datetime(result, datetime, obj=obj, **kwargs)
 
 
+def _write_chunks(obj, chunksize, *args, **kwargs):
+    """Helper for :meth:`.write_dataset` to convert chunks of observations."""
+    observations = getattr(obj, "obs", obj)
+    if chunksize == "series":
+        chunks = (list(group) for _, group in groupby(observations, _series_values))
+    else:
+        observations = iter(observations)
+        chunks = iter(lambda: list(islice(observations, chunksize)), [])
+
+    for chunk in chunks:
+        if hasattr(obj, "obs"):
+            # Keep the structure of the DataSet, e.g. for `datetime` and `categorical`
+            chunk = DataSet.construct(obs=chunk, structured_by=obj.structured_by)
+        yield write_dataset(chunk, *args, **kwargs)
+
+
+def _series_values(observation):
+    """Return the values of the series key of `observation`, if any."""
+    sk = observation.series_key
+    return None if sk is None else sk.get_values()
+
+
+def _observation(obj):
+    """Return `obj`, converting a :class:`.StreamedObservation` to Observation."""
+    if isinstance(obj, Observation):
+        return obj
+    return Observation.construct(
+        series_key=obj.series_key,
+        dimension=obj.dimension,
+        value=obj.value,
+        attached_attribute=obj.attached_attribute,
+        group_keys=getattr(obj.series_key, "group_keys", set()),
+    )
+
+
+def _constraint_mask(constraint, keys, ids):
+    """Return a boolean array: :obj:`True` for `keys` within `constraint`.
+
+    As ``key in constraint`` for each key, for a :class:`.ContentConstraint`. Each
+    distinct value of each dimension is compared to the member values once.
+    """
+    if not constraint.data_content_region:
+        raise NotImplementedError("ContentConstraint does not contain a CubeRegion.")
+
+    # Factorized values of each dimension; codes, and a mask for the distinct values
+    factorized = {}
+
+    result = np.zeros(len(keys[0]), dtype=bool)
+    for cr in constraint.data_content_region:
+        region = np.ones_like(result)
+        for ms in cr.member.values():
+            id = ms.values_for.id
+            if id not in factorized:
+                if id not in ids:
+                    raise KeyError(id)
+                factorized[id] = pd.factorize(keys[ids.index(id)])
+            codes, uniques = factorized[id]
+
+            # Missing values, with code -1, are not within the selection
+            selected = [mv.value for mv in ms.values]
+            within = np.append(pd.Index(uniques).isin(selected), False)
+            region &= within[codes]
+        result |= region
+
+    return result
+
+
+def _append_key(keys, key, n):
+    """Append `key` to lists `keys`, which have length `n`, padding with NaN."""
+    keys.extend([np.nan] * n for _ in range(len(key) - len(keys)))
+    for i, column in enumerate(keys):
+        column.append(str(key[i]) if i < len(key) else np.nan)
+
+
+def _dataset_frame(keys, ids, values, attrs, attr_order, n):
+    """Return a :class:`pandas.DataFrame` for :func:`write_dataset`.
+
+    `keys` are lists of values for each dimension with `ids`; `values` is a list of
+    observation values, or :obj:`None`; `attrs` maps attribute IDs to lists of
+    :class:`.AttributeValue`; and `attr_order` gives the attribute IDs of each row,
+    in order. All have length `n`.
+
+    The result is the same as :meth:`pandas.DataFrame.from_dict` gives for a dict
+    mapping each key to a dict of the row's value and attributes:
+
+    - For duplicate keys, the last row replaces the first, in its position.
+    - With a single column, rows are sorted by key. Otherwise, they are in the
+      order of the first row with each column, then of their first appearance.
+    """
+    data = {} if values is None else {"value": values}
+    for attr_id, column in attrs.items():
+        column.extend([np.nan] * (n - len(column)))
+        data[attr_id] = column
+
+    if not len(data) or not n:
+        return pd.DataFrame()
+
+    index = pd.MultiIndex.from_arrays(keys, names=ids)
+    result = pd.DataFrame(data, index=index)
+
+    if not index.is_unique:
+        # Keep the last row for each key, in the position of the first
+        codes, _ = pd.factorize(index)
+        rows = np.flatnonzero(~index.duplicated(keep="last"))
+        rows = rows[np.argsort(codes[rows], kind="stable")]
+        result = result.iloc[rows]
+
+        # Attributes only of replaced rows are absent; order the others as they
+        # appear in the remaining rows
+        columns = {} if values is None else {"value": None}
+        for row in rows if attrs else ():
+            columns.update(dict.fromkeys(attr_order[row]))
+        result = result[list(columns)]
+
+    if len(result.columns) == 1:
+        # Rows lacking the only column are absent; the others are sorted
+        if values is None:
+            result = result[result.iloc[:, 0].notna().to_numpy()]
+        return result.sort_index()
+    elif values is None:
+        # Order rows by the first attribute they have, then their position
+        present = result.notna().to_numpy()
+        first = np.where(present.any(axis=1), present.argmax(axis=1), len(attrs))
+        rows = np.argsort(first, kind="stable")
+        result = result.iloc[rows[first[rows] < len(attrs)]]
+
+    return result
+
+
+def _categorical(df, obj, dsd=None):
+    """Helper for :meth:`.write_dataset` to convert values to categoricals.
+
+    Components are taken from the structure of `obj`, if any, else from `dsd`.
+    """
+    structure = getattr(obj, "structured_by", None)
+    if structure is None or not len(structure.dimensions.components):
+        structure = dsd
+
+    if isinstance(df.index, pd.MultiIndex):
+        dims = getattr(structure, "dimensions", None)
+        levels = [
+            pd.CategoricalIndex(
+                level,
+                categories=_categories(_codes(_component(dims, level.name)), level),
+                name=level.name,
+            )
+            for level in df.index.levels
+        ]
+        df.index = df.index.set_levels(levels)
+
+    if isinstance(df, pd.DataFrame):
+        attrs = getattr(structure, "attributes", None)
+        for label in df.columns:
+            codes = _codes(_component(attrs, label))
+            if label == "value" or codes is None:
+                continue
+            values = df[label].map(_attribute_value, na_action="ignore")
+            df[label] = pd.Categorical(
+                values, categories=_categories(codes, values.dropna().unique())
+            )
+
+    return df
+
+
+def _component(components, id):
+    """Return the component `id` from `components`, or :obj:`None`."""
+    try:
+        return components.get(id)
+    except (AttributeError, KeyError):
+        return None
+
+
+def _codes(component):
+    """Return the IDs of codes in the enumerated representation of `component`.
+
+    The local representation is used if given, else the core representation of the
+    component's concept. Returns :obj:`None` if `component` is not coded.
+    """
+    concept = getattr(component, "concept_identity", None)
+    for representation in (
+        getattr(component, "local_representation", None),
+        getattr(concept, "core_representation", None),
+    ):
+        enumerated = getattr(representation, "enumerated", None)
+        if enumerated is not None:
+            return list(enumerated.items)
+    return None
+
+
+def _categories(codes, values):
+    """Return categories for `values`: `codes`, followed by any other `values`."""
+    if codes is None:
+        return list(values)
+    known = set(codes)
+    return codes + [v for v in values if v not in known]
+
+
+def _attribute_value(av):
+    """Return the ID of the value of `av`, an :class:`.AttributeValue`."""
+    value = getattr(av, "value", av)
+    return getattr(value, "id", value)
+
+
+def parse_time_period(values, freq=None):
+    """Parse SDMX time period `values` to a :class:`pandas.PeriodIndex`.
+
+    Besides dates and times understood by :func:`pandas.to_datetime`, `values` may
+    be SDMX reporting periods: '2020-A1', '2020-S2', '2020-T3', '2020-Q4',
+    '2020-M01', '2020-W05' or '2020-D366'. If all `values` are ISO 8601 dates and
+    times, these are parsed by :func:`pandas.to_datetime`; otherwise, each distinct
+    value is parsed once.
+
+    Parameters
+    ----------
+    values : array-like of str
+    freq : str, optional
+        :mod:`pandas` frequency of the result. Each value gives the period with
+        `freq` containing its start. If not given, the frequency is inferred from
+        the format of `values`: for instance, 'M' for '2020-01' or '2020-M01'. See
+        also :data:`FREQ`.
+
+    Raises
+    ------
+    ValueError
+        if `freq` is not given, and `values` have different or no frequencies; or if
+        any of `values` is not a valid time period, e.g. '2021-W53' or '2021-D366'.
+    """
+    start, freqs = _parse_time_period(values, freq is None)
+
+    if freq is None:
+        inferred = set(freqs[pd.notna(start)])
+        if len(inferred) != 1 or None in inferred:
+            inferred = sorted(inferred, key=str)
+            raise ValueError(f"cannot infer frequency of time periods; got {inferred}")
+        freq = inferred.pop()
+
+    return pd.DatetimeIndex(start).to_period(freq).rename(getattr(values, "name", None))
+
+
+def _parse_time_period(values, infer=True):
+    """Helper for :func:`parse_time_period`.
+
+    Returns an array of the start times of the periods in `values`, and an array of
+    their :mod:`pandas` frequencies, :obj:`None` where these are not known. If not
+    `infer`, the latter may be :obj:`None` instead.
+    """
+    values = np.asarray(values, dtype=object)
+
+    try:
+        # Fast path for ISO 8601 dates and times only; other values raise
+        start = pd.to_datetime(values, format=_ISO8601)
+    except (TypeError, ValueError):
+        pass
+    else:
+        if not infer:
+            return start.to_numpy(dtype="datetime64[ns]"), None
+
+        # '2020', '2020-01' and '2020-01-31' are years, months and dates
+        length = np.fromiter(
+            (len(v) if isinstance(v, str) else 0 for v in values), int, len(values)
+        )
+        freqs = np.full(len(values), None, dtype=object)
+        for n, freq in ((4, "A"), (7, "M"), (10, "D")):
+            freqs[length == n] = freq
+        freqs[pd.isna(start)] = None
+        return start.to_numpy(dtype="datetime64[ns]"), freqs
+
+    codes, uniques = pd.factorize(values)
+
+    # Characters of each distinct value, as integers; 0 after the end
+    text = uniques.astype(str)
+    width = max(10, text.dtype.itemsize // 4)
+    chars = text.astype(f"U{width}").view(np.uint32).reshape(len(text), width)
+    chars = chars.astype(np.int64)
+    rows = np.arange(len(chars))
+    length = np.count_nonzero(chars, axis=1)
+    digits = chars - ord("0")
+    is_digit = (0 <= digits) & (digits <= 9)
+    dash = chars == ord("-")
+
+    def number(first, count):
+        """Integers from `count` digits at `first`; -1 where these are not digits."""
+        first, count = np.broadcast_arrays(first, count, rows)[:2]
+        result = np.zeros(len(chars), dtype=np.int64)
+        valid = count > 0
+        for i in range(count.max(initial=0)):
+            pos = np.minimum(first + i, chars.shape[1] - 1)
+            use = i < count
+            valid &= is_digit[rows, pos] | ~use
+            result = np.where(use, 10 * result + digits[rows, pos], result)
+        return np.where(valid, result, -1)
+
+    # Years, months and dates: 2020, 2020-01, 2020-01-31
+    year = number(0, 4)
+    month = number(5, 2)
+    day = number(8, 2)
+    is_year = (year >= 0) & (length == 4)
+    is_month = (year >= 0) & dash[:, 4] & (1 <= month) & (month <= 12)
+    is_date = is_month & dash[:, 7] & (1 <= day) & (day <= 31) & (length == 10)
+    is_month &= length == 7
+
+    freqs = np.full(len(chars), None, dtype=object)
+    freqs[is_year], freqs[is_month], freqs[is_date] = "A", "M", "D"
+    month = np.where(is_month | is_date, month - 1, 0)  # Offset from January
+    day = np.where(is_date, day - 1, 0)  # Offset from the 1st of the month
+
+    # Reporting periods: 2020-Q1 or 2020Q1; the period indicator, then its number
+    sep = dash[:, 4].astype(np.int64)
+    indicator = chars[rows, 4 + sep]
+    count = length - 5 - sep
+    n = np.where(count <= 3, number(5 + sep, np.clip(count, 0, 3)), 0) - 1
+    is_period = np.zeros(len(chars), dtype=bool)
+    for code, months, limit in (
+        ("A", 12, 1),
+        ("S", 6, 2),
+        ("T", 4, 3),
+        ("Q", 3, 4),
+        ("M", 1, 12),
+        ("W", 0, 53),
+        ("D", 0, 366),
+    ):
+        match = (indicator == ord(code)) & (year >= 0) & (0 <= n) & (n < limit)
+        is_period |= match
+        freqs[match] = FREQ[code]
+        month = np.where(match, n * months, month)
+        if code == "W":
+            # ISO 8601 weeks start on the Monday of the week containing 4 January;
+            # 1970-01-01 was a Thursday
+            jan4 = (year - 1970).astype("datetime64[Y]").astype("datetime64[D]") + 3
+            weekday = (jan4.astype(np.int64) + 3) % 7
+            day = np.where(match, 7 * n + 3 - weekday, day)
+            is_week = match
+        elif code == "D":
+            day = np.where(match, n, day)
+            is_day = match
+
+    # Start of each period
+    ym = ((year - 1970) * 12 + month).astype("datetime64[M]")
+    start = ym.astype("datetime64[D]") + day
+    # Dates such as 2020-02-30 are not valid
+    is_date &= start.astype("datetime64[M]") == ym
+
+    # Nor are week 53 or day 366 of years without these: the Thursday of a week, or a
+    # day, is in the next year
+    in_year = (year - 1970).astype("datetime64[Y]")
+    invalid = (is_week & ((start + 3).astype("datetime64[Y]") != in_year)) | (
+        is_day & (start.astype("datetime64[Y]") != in_year)
+    )
+    if invalid.any():
+        raise ValueError(f"invalid time periods; got {list(uniques[invalid])}")
+    parsed = is_year | is_month | is_date | is_period
+    start = start.astype("datetime64[ns]")
+
+    # Other dates and times
+    if not parsed.all():
+        other = ~parsed
+        start[other] = pd.to_datetime(uniques[other]).to_numpy(dtype="datetime64[ns]")
+        freqs[other] = None
+
+    # Map back to `values`; code -1, for missing values, gives NaT
+    start = np.append(start, np.datetime64("NaT"))
+    freqs = np.append(freqs, None)
+    return start[codes], freqs[codes]
+
+
+def _ordered_key(keys):
+    """Return the dimension IDs and values of the combined `keys`, ordered.
+
+    For the :attr:`.Observation.key_parts`, this gives the same as
+    ``observation.key.order()``, without creating any :class:`.Key`.
+    """
+    kvs = {}
+    for key in keys:
+        kvs.update(key.values)
+    ids = tuple(kvs.keys())
+    values = tuple(kv.value for kv in kvs.values())
+
+    dd = keys[0].described_by if len(keys) else None
+    return (ids, values) if dd is None else dd.order_values(ids, values)
+
+
 def _dataset_compat(df, datetime, kwargs):
     """Helper for :meth:`.write_dataset` 0.9 compatibility."""
     rtype = kwargs.pop("_rtype")
@@ -427,9 +958,12 @@ def _maybe_convert_datetime(df, arg, obj, dsd=None):
     # Unstack all but the time dimension and convert
     other_dims = list(filter(lambda d: d != param["dim"], df.index.names))
     df = df.unstack(other_dims)
-    df.index = pd.to_datetime(df.index)
 
-    if param["freq"]:
+    if not param["freq"]:
+        df.index = pd.DatetimeIndex(
+            _parse_time_period(df.index, False)[0], name=df.index.name
+        )
+    else:
         # Determine frequency string, Dimension, or Attribute
         try:
             # pandas version prior to 1.1.0
@@ -465,15 +999,16 @@ def _maybe_convert_datetime(df, arg, obj, dsd=None):
                     "cannot convert to PeriodIndex with " f"non-unique freq={values}"
                 )
 
-            # Store the unique value
+            # Store the unique value, a code from the SDMX FREQ code list
             freq = values.pop()
+            freq = FREQ.get(freq, freq)
 
             # Remove the index level
             df.columns = df.columns.droplevel(i)
         elif isinstance(freq, DataAttribute):  # pragma: no cover
             raise NotImplementedError
 
-        df.index = df.index.to_period(freq=freq)
+        df.index = parse_time_period(df.index, None if freq is True else freq)
 
     if param["axis"] in {1, "columns"}:
         # Change axis